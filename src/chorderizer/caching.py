@@ -0,0 +1,92 @@
+"""
+caching.py — Bounded caches and cache keys
+==========================================
+LRUCache is a small least-recently-used mapping with hit/miss/eviction counters,
+reported through cache_info() in the same shape as functools.lru_cache.
+
+scale_fingerprint() keys cached results by the content of a scale definition,
+so two scales that share a name but not their degrees never collide.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Mapping, NamedTuple, Optional
+
+from .theory_utils import MusicTheoryUtils
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+# -----------------------------------------------------------------------------
+# Class LRUCache
+# -----------------------------------------------------------------------------
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache holding at most ``maxsize`` entries.
+    A maxsize of 0 disables caching (every lookup is a miss).
+    """
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be >= 0, got {maxsize}")
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """Returns the cached value (marking it most recently used) or ``default``."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Stores a value, evicting the least recently used entries past maxsize."""
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drops every entry and resets the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+
+def scale_fingerprint(scale_info: Mapping[str, Any]) -> str:
+    """
+    Stable content hash of a scale definition (name and degrees). Degree order is
+    part of the hash because it decides the order of the generated chords.
+    """
+    payload = json.dumps(MusicTheoryUtils.thaw(scale_info))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,212 @@
+"""
+catalog.py — Compiled scale catalogs with an on-disk cache
+===========================================================
+Parsing a scales JSON file and deriving its lookup tables (degree intervals,
+pitch-class masks, chord qualities) is done once; the result is stored as a
+marshal artifact in the user cache directory. Later starts load that artifact
+instead, as long as the source file's path, mtime/size or content hash still
+match.
+
+Scale packs (see scale_packs.py) additionally get a small manifest artifact with
+just their metadata, names and masks, so they can be listed without loading
+their degree tables.
+"""
+
+import hashlib
+import json
+import logging
+import marshal
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Bump whenever the layout of compiled catalogs or manifests changes
+CATALOG_FORMAT_VERSION = 2
+
+CACHE_DIR_ENV = "CHORDERIZER_CACHE_DIR"
+
+
+def default_cache_dir() -> str:
+    """Returns the per-user cache directory (overridable via CHORDERIZER_CACHE_DIR)."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return override
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "chorderizer")
+
+
+def compile_scales(scales: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Derives the lookup tables for a scales mapping.
+
+    Returns a dict with:
+        scales: The scale definitions as loaded.
+        intervals: scale_key -> tuple of degree root intervals.
+        masks: scale_key -> 12 pitch-class masks, one per tonic.
+        qualities: scale_key -> tuple of
+            (degree, root_interval, base_quality, full_quality, display_suffix).
+    """
+    intervals: Dict[str, Tuple[int, ...]] = {}
+    masks: Dict[str, Tuple[int, ...]] = {}
+    qualities: Dict[str, Tuple[Tuple[str, int, str, str, str], ...]] = {}
+
+    for scale_key, scale_info in scales.items():
+        degrees = scale_info["degrees"]
+        intervals[scale_key] = tuple(d["root_interval"] for d in degrees.values())
+
+        base_mask = 0
+        for interval in intervals[scale_key]:
+            base_mask |= 1 << (interval % 12)
+        masks[scale_key] = tuple(
+            ((base_mask << tonic) | (base_mask >> (12 - tonic))) & 0xFFF for tonic in range(12)
+        )
+
+        qualities[scale_key] = tuple(
+            (
+                degree,
+                d["root_interval"],
+                d["base_quality"],
+                d["full_quality"],
+                d["display_suffix"],
+            )
+            for degree, d in degrees.items()
+        )
+
+    return {"scales": scales, "intervals": intervals, "masks": masks, "qualities": qualities}
+
+
+def scale_definitions(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the scales of a JSON document: a plain scales file or a pack with "scales"."""
+    if "pack" in document:
+        return document["scales"]
+    return document
+
+
+def compile_pack_manifest(document: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Derives the metadata of a scale pack document.
+
+    Returns a dict with the pack's name, namespace and description (None if not
+    given), plus names: scale_key -> name and masks: scale_key -> 12 masks.
+    """
+    info = document.get("pack", {})
+    compiled = compile_scales(scale_definitions(document))
+    return {
+        "name": info.get("name"),
+        "namespace": info.get("namespace"),
+        "description": info.get("description", ""),
+        "names": {key: scale["name"] for key, scale in compiled["scales"].items()},
+        "masks": compiled["masks"],
+    }
+
+
+def _cache_file_for(source_path: str, cache_dir: str, kind: str = "catalog") -> str:
+    digest = hashlib.sha256(source_path.encode("utf-8")).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(cache_dir, f"{stem}-{digest}.{kind}")
+
+
+def _read_artifact(cache_file: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(cache_file, "rb") as f:
+            # The artifact is written by _write_artifact and holds plain data only
+            artifact = marshal.load(f)  # noqa: S302
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logging.debug(f"Scale catalog cache unreadable at {cache_file}: {e}")
+        return None
+    if not isinstance(artifact, dict) or artifact.get("version") != CATALOG_FORMAT_VERSION:
+        return None
+    return artifact
+
+
+def _write_artifact(cache_file: str, artifact: Dict[str, Any]) -> None:
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            marshal.dump(artifact, f)
+        os.replace(tmp_file, cache_file)
+    except (OSError, ValueError) as e:
+        logging.debug(f"Could not write scale catalog cache {cache_file}: {e}")
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
+def _load_compiled(
+    source_path: str,
+    cache_dir: Optional[str],
+    kind: str,
+    compile_document: Callable[[Dict[str, Any]], Dict[str, Any]],
+) -> Dict[str, Any]:
+    source_path = os.path.abspath(source_path)
+    cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
+    cache_file = _cache_file_for(source_path, cache_dir, kind)
+    stat = os.stat(source_path)
+
+    artifact = _read_artifact(cache_file)
+    if artifact is not None and artifact["source"]["path"] == source_path:
+        source = artifact["source"]
+        if source["mtime_ns"] == stat.st_mtime_ns and source["size"] == stat.st_size:
+            return artifact["payload"]
+
+    with open(source_path, "rb") as f:
+        raw = f.read()
+    content_hash = hashlib.sha256(raw).hexdigest()
+
+    if artifact is not None and artifact["source"]["sha256"] == content_hash:
+        payload = artifact["payload"]
+    else:
+        payload = compile_document(json.loads(raw.decode("utf-8")))
+
+    _write_artifact(
+        cache_file,
+        {
+            "version": CATALOG_FORMAT_VERSION,
+            "source": {
+                "path": source_path,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": content_hash,
+            },
+            "payload": payload,
+        },
+    )
+    return payload
+
+
+def load_catalog(source_path: str, cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Loads the compiled catalog for a scales JSON file (or scale pack), using the
+    cache when valid.
+
+    The cache is trusted when path, mtime and size match. If only the mtime moved
+    (e.g. a checkout touched the file), the content hash decides and the cache
+    header is refreshed.
+
+    Raises:
+        OSError: If the source file cannot be read.
+        ValueError: If the source file is not valid JSON.
+    """
+    return _load_compiled(
+        source_path,
+        cache_dir,
+        "catalog",
+        lambda document: compile_scales(scale_definitions(document)),
+    )
+
+
+def load_pack_manifest(source_path: str, cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Loads a scale pack's manifest (see compile_pack_manifest) with the same
+    cache validation as load_catalog.
+
+    Raises:
+        OSError: If the pack file cannot be read.
+        ValueError: If the pack file is not valid JSON.
+        KeyError, TypeError: If the pack does not follow the scales format.
+    """
+    return _load_compiled(source_path, cache_dir, "manifest", compile_pack_manifest)
@@ -0,0 +1,184 @@
+"""
+chord_set.py — Immutable chord generation results
+==================================================
+ScaleChord and ScaleChordSet hold the chords built for one scale configuration.
+Both use __slots__ and tuples and reject attribute assignment, so a cached
+result can be handed to any number of callers without copying.
+
+Callers that still expect the legacy 4-tuple of dicts use ScaleChordSet.as_dicts().
+"""
+
+from typing import Dict, Iterator, List, Tuple
+
+
+class _Frozen:
+    """Base for slotted value objects that reject assignment after __init__."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _init(self, **fields) -> None:
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+
+# -----------------------------------------------------------------------------
+# Class ScaleChord
+# -----------------------------------------------------------------------------
+class ScaleChord(_Frozen):
+    """One diatonic chord: its degree, spelling and voicing."""
+
+    __slots__ = (
+        "degree",
+        "name",
+        "root_pc",
+        "suffix",
+        "chord_type",
+        "base_quality",
+        "note_names",
+        "midi_notes",
+    )
+
+    def __init__(
+        self,
+        degree: str,
+        name: str,
+        root_pc: int,
+        suffix: str,
+        chord_type: str,
+        base_quality: str,
+        note_names: Tuple[str, ...],
+        midi_notes: Tuple[int, ...],
+    ):
+        self._init(
+            degree=degree,
+            name=name,
+            root_pc=root_pc,
+            suffix=suffix,
+            chord_type=chord_type,
+            base_quality=base_quality,
+            note_names=tuple(note_names),
+            midi_notes=tuple(midi_notes),
+        )
+
+    def _fields(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __reduce__(self):
+        return (type(self), self._fields())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ScaleChord):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        return f"ScaleChord({self.degree!r}, {self.name!r}, midi_notes={self.midi_notes!r})"
+
+
+# -----------------------------------------------------------------------------
+# Class ScaleChordSet
+# -----------------------------------------------------------------------------
+class ScaleChordSet(_Frozen):
+    """
+    The chords for a (tonic, scale, extension level, inversion) configuration,
+    in scale degree order. Iterating yields ScaleChord objects; indexing takes a
+    degree name.
+    """
+
+    __slots__ = ("tonic", "scale_name", "extension_level", "inversion", "chords", "_by_degree")
+
+    def __init__(
+        self,
+        tonic: str,
+        scale_name: str,
+        extension_level: int,
+        inversion: int,
+        chords: Tuple[ScaleChord, ...],
+    ):
+        chords = tuple(chords)
+        self._init(
+            tonic=tonic,
+            scale_name=scale_name,
+            extension_level=extension_level,
+            inversion=inversion,
+            chords=chords,
+            _by_degree={chord.degree: chord for chord in chords},
+        )
+
+    def __reduce__(self):
+        return (
+            type(self),
+            (self.tonic, self.scale_name, self.extension_level, self.inversion, self.chords),
+        )
+
+    def __len__(self) -> int:
+        return len(self.chords)
+
+    def __iter__(self) -> Iterator[ScaleChord]:
+        return iter(self.chords)
+
+    def __contains__(self, degree: str) -> bool:
+        return degree in self._by_degree
+
+    def __getitem__(self, degree: str) -> ScaleChord:
+        return self._by_degree[degree]
+
+    def get(self, degree: str, default=None):
+        return self._by_degree.get(degree, default)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ScaleChordSet):
+            return NotImplemented
+        return (
+            self.tonic == other.tonic
+            and self.scale_name == other.scale_name
+            and self.extension_level == other.extension_level
+            and self.inversion == other.inversion
+            and self.chords == other.chords
+        )
+
+    def __hash__(self) -> int:
+        return hash(
+            (self.tonic, self.scale_name, self.extension_level, self.inversion, self.chords)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ScaleChordSet({self.tonic!r}, {self.scale_name!r}, "
+            f"[{', '.join(chord.name for chord in self.chords)}])"
+        )
+
+    @property
+    def degrees(self) -> Tuple[str, ...]:
+        return tuple(chord.degree for chord in self.chords)
+
+    def names(self) -> Dict[str, str]:
+        """Degree -> chord display name."""
+        return {chord.degree: chord.name for chord in self.chords}
+
+    def midi(self) -> Dict[str, List[int]]:
+        """Degree -> MIDI notes (fresh lists)."""
+        return {chord.degree: list(chord.midi_notes) for chord in self.chords}
+
+    def as_dicts(
+        self,
+    ) -> Tuple[Dict[str, str], Dict[str, List[str]], Dict[str, List[int]], Dict[str, str]]:
+        """
+        Legacy view: (chord names, note names, MIDI notes, base qualities) keyed by
+        degree. The dicts and lists are new objects the caller may mutate freely.
+        """
+        return (
+            self.names(),
+            {chord.degree: list(chord.note_names) for chord in self.chords},
+            self.midi(),
+            {chord.degree: chord.base_quality for chord in self.chords},
+        )
@@ -0,0 +1,333 @@
+"""
+chord_space.py — Precomputed, memory-mapped chord space
+========================================================
+The chords Chorderizer can produce are a small finite set: 12 tonics × the
+core catalog scales × 6 extension levels × 4 inversions (scale packs are left
+to live generation, so they stay unloaded). This module renders all of them
+once into a fixed-layout binary file and serves lookups straight from an mmap,
+so the pages are shared between processes and nothing is parsed at load.
+
+Layout (little endian):
+    header      HEADER struct
+    tonics      u16 string index per tonic
+    scales      u16 string index per scale key, then per scale name
+    records     one RECORD per (tonic, scale, extension, inversion, degree slot)
+    strings     u32 count, u32 offsets[count + 1], UTF-8 blob
+
+Build it ahead of time with ``python -m chorderizer.chord_space``; otherwise
+open_chord_space builds it on first use in the user cache directory.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional
+
+from .catalog import default_cache_dir
+from .chord_set import ScaleChord, ScaleChordSet
+from .theory_utils import MusicTheory, MusicTheoryUtils
+
+# Bump whenever generation output or the file layout changes
+CHORD_SPACE_VERSION = 3
+
+MAGIC = b"CHSP"
+N_EXTENSIONS = 6
+N_INVERSIONS = 4
+MAX_NOTES = 6
+
+# magic, version, n_tonics, n_scales, n_ext, n_inv, max_degrees, max_notes, record_size,
+# fingerprint, records offset, strings offset
+HEADER = struct.Struct("<4sHHHHHHHH32sII")
+# present, n_notes, root pc, degree, chord name, suffix, chord type, base quality,
+# midi notes, note names
+RECORD = struct.Struct(f"<BBBHHHHH{MAX_NOTES}B{MAX_NOTES}H")
+
+
+def chord_space_fingerprint(theory: MusicTheory) -> bytes:
+    """Identifies the catalog and chord definitions a chord space was built from."""
+    payload = json.dumps(
+        {
+            "version": CHORD_SPACE_VERSION,
+            "scales": MusicTheoryUtils.thaw(theory.core_scales),
+            "chords": MusicTheoryUtils.thaw(theory.CHORD_STRUCTURES),
+            "tonics": list(theory.CHROMATIC_NOTES),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).digest()
+
+
+def build_chord_space(path: str, theory: Optional[MusicTheory] = None) -> str:
+    """
+    Renders every generate_chord_set result for the catalog into a binary file.
+
+    Returns:
+        The path written.
+    """
+    # Imported here: generators attaches chord spaces, so avoid a module cycle
+    from .generators import ChordGenerator
+
+    theory = theory if theory is not None else MusicTheory.shared()
+    generator = ChordGenerator(theory)
+    tonics = list(theory.CHROMATIC_NOTES)
+    scales = theory.core_scales
+    scale_keys = list(scales)
+    max_degrees = max((len(s["degrees"]) for s in scales.values()), default=1)
+
+    strings: Dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        if text not in strings:
+            strings[text] = len(strings)
+        return strings[text]
+
+    tonic_ids = [intern(t) for t in tonics]
+    scale_ids = [intern(k) for k in scale_keys]
+    scale_name_ids = [intern(scales[k].get("name", "")) for k in scale_keys]
+    empty_record = RECORD.pack(0, 0, 0, 0, 0, 0, 0, 0, *([0] * MAX_NOTES), *([0] * MAX_NOTES))
+
+    records = bytearray()
+    for tonic in tonics:
+        for scale_key in scale_keys:
+            scale_info = scales[scale_key]
+            for ext in range(N_EXTENSIONS):
+                for inv in range(N_INVERSIONS):
+                    chord_set = generator.generate_chord_set(tonic, scale_info, ext, inv)
+                    written = 0
+                    for degree in scale_info["degrees"]:
+                        chord = chord_set.get(degree)
+                        if chord is None:
+                            records += empty_record
+                            written += 1
+                            continue
+                        notes = chord.midi_notes[:MAX_NOTES]
+                        labels = chord.note_names[:MAX_NOTES]
+                        padding = [0] * (MAX_NOTES - len(notes))
+                        records += RECORD.pack(
+                            1,
+                            len(notes),
+                            chord.root_pc,
+                            intern(degree),
+                            intern(chord.name),
+                            intern(chord.suffix),
+                            intern(chord.chord_type),
+                            intern(chord.base_quality),
+                            *notes,
+                            *padding,
+                            *[intern(label) for label in labels],
+                            *padding,
+                        )
+                        written += 1
+                    records += empty_record * (max_degrees - written)
+
+    index_ids = tonic_ids + scale_ids + scale_name_ids
+    index_block = struct.pack(f"<{len(index_ids)}H", *index_ids)
+    records_offset = HEADER.size + len(index_block)
+    strings_offset = records_offset + len(records)
+
+    encoded = [text.encode("utf-8") for text in strings]
+    offsets = [0]
+    for blob in encoded:
+        offsets.append(offsets[-1] + len(blob))
+    string_block = struct.pack(f"<I{len(offsets)}I", len(encoded), *offsets) + b"".join(encoded)
+
+    header = HEADER.pack(
+        MAGIC,
+        CHORD_SPACE_VERSION,
+        len(tonics),
+        len(scale_keys),
+        N_EXTENSIONS,
+        N_INVERSIONS,
+        max_degrees,
+        MAX_NOTES,
+        RECORD.size,
+        chord_space_fingerprint(theory),
+        records_offset,
+        strings_offset,
+    )
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(index_block)
+        f.write(records)
+        f.write(string_block)
+    os.replace(tmp_path, path)
+    return path
+
+
+# -----------------------------------------------------------------------------
+# Class ChordSpaceTable
+# -----------------------------------------------------------------------------
+class ChordSpaceTable:
+    """Read-only view of a chord space file through mmap."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            version,
+            self.n_tonics,
+            self.n_scales,
+            self.n_extensions,
+            self.n_inversions,
+            self.max_degrees,
+            max_notes,
+            record_size,
+            self.fingerprint,
+            self._records_offset,
+            self._strings_offset,
+        ) = HEADER.unpack_from(self._mm, 0)
+        if (
+            magic != MAGIC
+            or version != CHORD_SPACE_VERSION
+            or max_notes != MAX_NOTES
+            or record_size != RECORD.size
+        ):
+            self.close()
+            raise ValueError(f"Unsupported chord space file: {path}")
+
+        (n_strings,) = struct.unpack_from("<I", self._mm, self._strings_offset)
+        self._blob_offset = self._strings_offset + 4 + (n_strings + 1) * 4
+        self._strings: List[Optional[str]] = [None] * n_strings
+        self._view = memoryview(self._mm)
+
+        n_ids = self.n_tonics + 2 * self.n_scales
+        ids = struct.unpack_from(f"<{n_ids}H", self._mm, HEADER.size)
+        scale_ids = ids[self.n_tonics : self.n_tonics + self.n_scales]
+        self._tonic_index = {self._string(i): pos for pos, i in enumerate(ids[: self.n_tonics])}
+        self._scale_index = {self._string(i): pos for pos, i in enumerate(scale_ids)}
+        self._scale_name_ids = ids[self.n_tonics + self.n_scales :]
+        # Decoded results are immutable, so each slot is decoded at most once
+        self._decoded: Dict[int, ScaleChordSet] = {}
+
+    def close(self) -> None:
+        view = getattr(self, "_view", None)
+        if view is not None:
+            view.release()
+        self._mm.close()
+
+    def _string(self, idx: int) -> str:
+        text = self._strings[idx]
+        if text is None:
+            start, end = struct.unpack_from("<II", self._mm, self._strings_offset + 4 + idx * 4)
+            text = self._strings[idx] = str(
+                self._view[self._blob_offset + start : self._blob_offset + end], "utf-8"
+            )
+        return text
+
+    def has_scale(self, scale_key: str) -> bool:
+        return scale_key in self._scale_index
+
+    def lookup(
+        self, tonic: str, scale_key: str, extension_level: int, inversion: int
+    ) -> Optional[ScaleChordSet]:
+        """
+        Returns the generate_chord_set result for a combination, or None if the
+        table does not cover it (unknown tonic spelling, custom scale, out of range).
+        """
+        t_idx = self._tonic_index.get(tonic)
+        s_idx = self._scale_index.get(scale_key)
+        if (
+            t_idx is None
+            or s_idx is None
+            or not 0 <= extension_level < self.n_extensions
+            or not 0 <= inversion < self.n_inversions
+        ):
+            return None
+
+        slot = (
+            (t_idx * self.n_scales + s_idx) * self.n_extensions + extension_level
+        ) * self.n_inversions + inversion
+        cached = self._decoded.get(slot)
+        if cached is not None:
+            return cached
+
+        offset = self._records_offset + slot * self.max_degrees * RECORD.size
+        chords: List[ScaleChord] = []
+        string = self._string
+        for record in RECORD.iter_unpack(
+            self._view[offset : offset + self.max_degrees * RECORD.size]
+        ):
+            if not record[0]:
+                continue
+            n_notes = record[1]
+            chords.append(
+                ScaleChord(
+                    string(record[3]),
+                    string(record[4]),
+                    record[2],
+                    string(record[5]),
+                    string(record[6]),
+                    string(record[7]),
+                    tuple(string(i) for i in record[8 + MAX_NOTES : 8 + MAX_NOTES + n_notes]),
+                    record[8 : 8 + n_notes],
+                )
+            )
+        result = self._decoded[slot] = ScaleChordSet(
+            tonic,
+            string(self._scale_name_ids[s_idx]),
+            extension_level,
+            inversion,
+            chords,
+        )
+        return result
+
+
+def default_chord_space_path(theory: MusicTheory, cache_dir: Optional[str] = None) -> str:
+    digest = chord_space_fingerprint(theory).hex()[:16]
+    return os.path.join(cache_dir or default_cache_dir(), f"chord-space-{digest}.bin")
+
+
+def open_chord_space(
+    theory: Optional[MusicTheory] = None,
+    path: Optional[str] = None,
+    build: bool = True,
+) -> Optional[ChordSpaceTable]:
+    """
+    Opens the chord space for a catalog, building it first if allowed and missing.
+
+    Returns None (and logs) when the table is unavailable or stale; callers then
+    fall back to live generation.
+    """
+    theory = theory if theory is not None else MusicTheory.shared()
+    path = path or default_chord_space_path(theory)
+    try:
+        if not os.path.exists(path):
+            if not build:
+                return None
+            build_chord_space(path, theory)
+        table = ChordSpaceTable(path)
+    except (OSError, ValueError, struct.error) as e:
+        logging.warning(f"Chord space unavailable at {path}: {e}")
+        return None
+
+    if table.fingerprint != chord_space_fingerprint(theory):
+        table.close()
+        logging.info(f"Chord space at {path} is stale; falling back to live generation.")
+        return None
+    return table
+
+
+def main() -> None:
+    """Command-line build step: python -m chorderizer.chord_space [--output PATH]."""
+    parser = argparse.ArgumentParser(description="Build the Chorderizer chord space table")
+    parser.add_argument("--output", help="Destination file (defaults to the user cache)")
+    args = parser.parse_args()
+
+    theory = MusicTheory.shared()
+    path = build_chord_space(args.output or default_chord_space_path(theory), theory)
+    print(f"Chord space written to {path}")
+
+
+if __name__ == "__main__":
+    main()
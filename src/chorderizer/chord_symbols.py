@@ -0,0 +1,243 @@
+"""
+chord_symbols.py — Chord-symbol parser
+======================================
+Parses lead-sheet symbols such as "F#m7b5/C", "Bb13(#11)" or "Dsus4" into
+their root, CHORD_STRUCTURES quality, alterations and bass note. Symbols with
+no quality of their own ("C5", "G7sus4", "C6/9", "E7alt") are read as a
+quality plus implied alterations.
+
+The grammar is precompiled: one regular expression splits root, body and bass,
+the quality is the longest body prefix found in the suffix table (so "m7b5"
+wins over "m7" + "b5"), and a second expression validates the alterations.
+Parsed symbols are immutable and interned: parsing the same text again returns
+the same ChordSymbol object from the cache, which makes large charts (where a
+handful of symbols repeat) cheap to parse.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from .spelling import SPELLINGS
+from .theory_utils import MusicTheory
+
+# Alternative spellings accepted for each quality, on top of MusicTheory.CHORD_SUFFIXES
+QUALITY_ALIASES: Mapping[str, Tuple[str, ...]] = {
+    "major": ("M", "maj", "Maj"),
+    "minor": ("min", "mi", "-"),
+    "diminished": ("°", "o"),
+    "augmented": ("+", "#5"),
+    "sus4": ("sus",),
+    "major6": ("maj6", "M6"),
+    "minor6": ("min6", "-6"),
+    "dom7": ("dom7",),
+    "maj7": ("M7", "Maj7", "ma7", "Δ", "Δ7", "j7"),
+    "min7": ("min7", "mi7", "-7"),
+    "minMaj7": ("mM7", "mMaj7", "mmaj7", "min(maj7)", "-Δ7", "-maj7"),
+    "dim7": ("°7", "o7"),
+    "halfdim7": ("ø", "ø7", "min7b5", "-7b5", "m7(b5)"),
+    "aug7": ("+7", "7#5", "7+5", "7(#5)"),
+    "augMaj7": ("+M7", "+maj7", "maj7#5", "maj7(#5)", "Δ#5"),
+    "dom9": ("dom9",),
+    "maj9": ("M9", "Maj9", "Δ9"),
+    "min9": ("min9", "-9"),
+    "minMaj9": ("mM9", "mMaj9", "mmaj9"),
+    "halfdim9": ("ø9", "min9b5"),
+    "dimM9": ("°M9",),
+    "maj11": ("M11", "Maj11", "Δ11"),
+    "min11": ("min11", "-11"),
+    "maj13": ("M13", "Maj13", "Δ13"),
+    "min13": ("min13", "-13"),
+}
+
+# Suffixes spelled as a CHORD_STRUCTURES quality plus alterations (in alteration syntax)
+COMPOUND_SUFFIXES: Mapping[str, Tuple[str, str]] = {
+    "5": ("major", "omit3"),
+    "7sus4": ("dom7", "omit3add4"),
+    "7sus": ("dom7", "omit3add4"),
+    "7sus2": ("dom7", "omit3add2"),
+    "9sus4": ("dom9", "omit3add4"),
+    "9sus": ("dom9", "omit3add4"),
+    "6/9": ("major6", "add9"),
+    "69": ("major6", "add9"),
+    "m6/9": ("minor6", "add9"),
+    "m69": ("minor6", "add9"),
+    "-6/9": ("minor6", "add9"),
+    "7alt": ("dom7", "b5#5b9#9"),
+    "alt": ("dom7", "b5#5b9#9"),
+}
+
+# Semitones above the root of each chord degree as written in an alteration;
+# a bare 7 is the dominant (minor) seventh
+DEGREE_SEMITONES: Mapping[int, int] = {
+    2: 2,
+    3: 4,
+    4: 5,
+    5: 7,
+    6: 9,
+    7: 10,
+    9: 14,
+    11: 17,
+    13: 21,
+}
+
+# Every spelled note name (C, C#, Db, B#, Fbb, ...) -> pitch class
+NOTE_PITCH_CLASSES: Mapping[str, int] = {
+    name: pc for row in SPELLINGS for pc, name in enumerate(row) if name is not None
+}
+
+BAR_LINE = "|"
+REPEAT_MARK = "%"
+
+_NOTE = r"[A-G](?:##|bb|#|b)?"
+# "/" only starts a slash bass when a note name follows it ("C6/9" has no bass)
+_SYMBOL_RE = re.compile(rf"^(?P<root>{_NOTE})(?P<body>.*?)(?:/(?P<bass>{_NOTE}))?$")
+_ALTERATION = r"\(?\s*(add|omit|no)?\s*([#b+-]?)(\d{1,2})\s*[,)]?\s*"
+_ALTERATION_RE = re.compile(_ALTERATION)
+_ALTERATIONS_RE = re.compile(rf"(?:{_ALTERATION})*")
+
+
+class ChordSymbol(NamedTuple):
+    """A parsed chord symbol. Intervals are semitones above the root, sorted."""
+
+    symbol: str
+    root: str
+    root_pc: int
+    quality: str  # Key into MusicTheory.CHORD_STRUCTURES
+    alterations: Tuple[str, ...]  # Normalized, e.g. ("#11",), ("add9",), ("omit5",)
+    bass: Optional[str]
+    bass_pc: Optional[int]
+    intervals: Tuple[int, ...]
+
+    @property
+    def pitch_classes(self) -> Tuple[int, ...]:
+        """Sounding pitch classes, bass first when there is one."""
+        pcs = []
+        if self.bass_pc is not None:
+            pcs.append(self.bass_pc)
+        for interval in self.intervals:
+            pc = (self.root_pc + interval) % 12
+            if pc not in pcs:
+                pcs.append(pc)
+        return tuple(pcs)
+
+
+def _suffix_table() -> Dict[str, str]:
+    table = {suffix: quality for quality, suffix in MusicTheory.CHORD_SUFFIXES.items()}
+    for quality, aliases in QUALITY_ALIASES.items():
+        for alias in aliases:
+            table.setdefault(alias, quality)
+    return table
+
+
+SUFFIX_QUALITIES: Mapping[str, str] = _suffix_table()
+# suffix -> (quality, implied alterations), compound suffixes included
+_SUFFIXES: Mapping[str, Tuple[str, str]] = {
+    **{suffix: (quality, "") for suffix, quality in SUFFIX_QUALITIES.items()},
+    **COMPOUND_SUFFIXES,
+}
+_MAX_SUFFIX_LENGTH = max(len(suffix) for suffix in _SUFFIXES)
+
+
+def _split_quality(body: str) -> Optional[Tuple[str, str]]:
+    """
+    Longest quality suffix whose remainder is a valid alteration list, as
+    (quality, alterations), the implied alterations of compound suffixes first.
+    """
+    for length in range(min(len(body), _MAX_SUFFIX_LENGTH), -1, -1):
+        entry = _SUFFIXES.get(body[:length])
+        if entry is not None and _ALTERATIONS_RE.fullmatch(body, length):
+            quality, implied = entry
+            return quality, implied + body[length:]
+    return None
+
+
+def _balanced(text: str) -> bool:
+    """True if parentheses are closed and not nested."""
+    depth = 0
+    for char in text:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if not 0 <= depth <= 1:
+            return False
+    return depth == 0
+
+
+def _apply_alterations(intervals: List[int], text: str) -> Tuple[str, ...]:
+    applied = []
+    for kind, accidental, number in _ALTERATION_RE.findall(text):
+        degree = int(number)
+        if degree not in DEGREE_SEMITONES:
+            raise ValueError(f"Unknown chord degree '{number}'")
+        shift = {"#": 1, "+": 1, "b": -1, "-": -1}.get(accidental, 0)
+        semitones = DEGREE_SEMITONES[degree] + shift
+
+        if kind in ("omit", "no"):
+            intervals[:] = [i for i in intervals if i % 12 != DEGREE_SEMITONES[degree] % 12]
+            if degree == 3:  # omit3 removes either third
+                intervals[:] = [i for i in intervals if i % 12 not in (3, 4)]
+            applied.append(f"omit{degree}")
+            continue
+
+        if degree == 5:
+            # Altered fifths replace the natural fifth
+            intervals[:] = [i for i in intervals if i != 7]
+        elif shift and not kind and degree in (9, 11, 13):
+            # Altered tensions (b9, #9, #11, b13) replace the natural one; add keeps it
+            intervals[:] = [i for i in intervals if i != DEGREE_SEMITONES[degree]]
+        if semitones not in intervals:
+            intervals.append(semitones)
+        applied.append(("add" if kind else "") + {1: "#", -1: "b"}.get(shift, "") + number)
+    return tuple(applied)
+
+
+@lru_cache(maxsize=65536)
+def parse_chord_symbol(symbol: str) -> ChordSymbol:
+    """
+    Parses a chord symbol. Repeated symbols return the same (cached) object.
+
+    Raises:
+        ValueError: If the symbol does not follow the chord-symbol grammar.
+    """
+    match = _SYMBOL_RE.match(symbol.strip())
+    body = match.group("body") if match is not None else ""
+    split = _split_quality(body) if match is not None and _balanced(body) else None
+    if split is None:
+        raise ValueError(f"Unrecognized chord symbol '{symbol}'")
+
+    root = match.group("root")
+    quality, alteration_text = split
+    intervals = list(MusicTheory.CHORD_STRUCTURES[quality])
+    alterations = _apply_alterations(intervals, alteration_text)
+    bass = match.group("bass")
+
+    return ChordSymbol(
+        symbol,
+        root,
+        NOTE_PITCH_CLASSES[root],
+        quality,
+        alterations,
+        bass,
+        NOTE_PITCH_CLASSES[bass] if bass is not None else None,
+        tuple(sorted(set(intervals))),
+    )
+
+
+def parse_chord_chart(chart: Iterable[str]) -> List[ChordSymbol]:
+    """
+    Parses a sequence of symbols, or a whole chart as text. Bar lines ("|") and
+    whitespace separate symbols; repeat marks ("%") repeat the previous chord.
+
+    Raises:
+        ValueError: On the first symbol that cannot be parsed.
+    """
+    tokens = chart.replace(BAR_LINE, " ").split() if isinstance(chart, str) else chart
+    parsed: List[ChordSymbol] = []
+    for symbol in tokens:
+        if symbol == REPEAT_MARK and parsed:
+            parsed.append(parsed[-1])
+        else:
+            parsed.append(parse_chord_symbol(symbol))
+    return parsed
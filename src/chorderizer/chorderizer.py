@@ -19,6 +19,7 @@ import os
 import sys
 from typing import Any, Dict, List
 
+from .chord_space import open_chord_space
 from .generators import ChordGenerator, MidiGenerator, TablatureGenerator
 from .theory_utils import MusicTheory, MusicTheoryUtils
 from .translations import Translations
@@ -152,7 +153,7 @@ def _phase3_display_results(
         if _should_show_tab(tab_filter, chord_name, qual):
             midi = midi_notes.get(degree, [])
             if midi:
-                tab_lines = tab_builder.generate_simple_tab(chord_name, midi)
+                tab_lines = tab_builder.generate_fingering_tab(chord_name, midi)
                 if tab_lines:
                     render_guitar_tab(chord_name, tab_lines)
 
@@ -259,19 +260,19 @@ def _phase4_midi_export(
                 print()
 
             if prompt_confirm(Translations.t("legacy_confirm_trans_midi")):
-                trans_chord_data, _, trans_midi, _ = chord_builder.generate_scale_chords(
+                trans_set = chord_builder.generate_chord_set(
                     new_tonic, new_scale, extension_level, inversion_idx
                 )
-                if trans_chord_data:
+                if trans_set:
                     trans_list = [
                         {
                             "degree": item["degree"],
-                            "name": trans_chord_data[item["degree"]],
-                            "midi_notes": trans_midi[item["degree"]],
+                            "name": trans_set[item["degree"]].name,
+                            "midi_notes": list(trans_set[item["degree"]].midi_notes),
                             "duration_beats": item["duration_beats"],
                         }
                         for item in chords_for_midi
-                        if item["degree"] in trans_chord_data
+                        if item["degree"] in trans_set
                     ]
                     if trans_list:
                         sugg_trans = _midi_filename(
@@ -313,9 +314,8 @@ def process_single_run(
     extension_level, inversion_idx = chord_cfg
 
     # ── Generate chords ───────────────────────────────────────────────────────
-    chord_names, note_names, midi_notes, base_qualities = chord_builder.generate_scale_chords(
-        tonic, scale_info, extension_level, inversion_idx
-    )
+    chord_set = chord_builder.generate_chord_set(tonic, scale_info, extension_level, inversion_idx)
+    chord_names, note_names, midi_notes, base_qualities = chord_set.as_dicts()
 
     if not chord_names:
         render_error(f"Could not generate chords for  {tonic}.")
@@ -384,9 +384,9 @@ def main() -> None:
 
     # Legacy Sequential Flow
     if args.legacy:
-        theory = MusicTheory()
+        theory = MusicTheory.shared()
         ui = UIManager(theory)
-        chord_builder = ChordGenerator(theory)
+        chord_builder = ChordGenerator(theory, chord_space=open_chord_space(theory))
         tab_builder = TablatureGenerator(theory)
         midi_builder = MidiGenerator(theory)
 
@@ -0,0 +1,387 @@
+"""
+fingerings.py — Playable guitar fingerings for chords
+=====================================================
+FingeringSearch enumerates every fingering of a chord on a fretted instrument:
+one fret (or a muted string) per string, with the chord's bass as the lowest
+sounding note, every required chord tone present, fretted notes within a
+maximum fret span and no more notes than four fingers can hold (a barre on the
+lowest fret counts as one finger). Open strings are allowed. The perfect 5th
+is dropped only when no fingering keeps it, unless asked otherwise.
+
+Fingerings are ranked by playability (span, position, fingers and muted
+strings, inner and treble ones weighing more) and cached per chord pitch set.
+
+The search walks the strings from a FretboardIndex, a precomputed table of
+where every pitch and pitch class lies on the neck.
+
+FingeringPlanner picks one fingering per chord of a whole progression, so
+consecutive shapes stay close on the neck: a Viterbi pass over each chord's
+best fingerings minimizes their scores plus the frets the hand travels, in
+O(n·k²) for n chords with k candidates each.
+"""
+
+from operator import add
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .caching import CacheInfo, LRUCache
+
+# Open-string MIDI notes, lowest string first
+STANDARD_TUNING: Tuple[int, ...] = (40, 45, 50, 55, 59, 64)  # E2 A2 D3 G3 B3 E4
+
+Frets = Tuple[Optional[int], ...]
+# (midi_notes, root_pc) of one chord of a progression
+ChordNotes = Tuple[Sequence[int], Optional[int]]
+
+
+class Fingering(NamedTuple):
+    """One fingering: a fret per string (None = muted, lowest string first)."""
+
+    frets: Frets
+    notes: Tuple[int, ...]
+    score: float
+
+    @property
+    def span(self) -> int:
+        """Frets between the lowest and highest fretted note (open strings excluded)."""
+        fretted = [f for f in self.frets if f]
+        return max(fretted) - min(fretted) if fretted else 0
+
+    @property
+    def position(self) -> int:
+        """Lowest fretted fret (0 for all-open shapes)."""
+        return min((f for f in self.frets if f), default=0)
+
+    @property
+    def shape(self) -> str:
+        """Chord-chart notation, lowest string first, e.g. "x32010"."""
+        marks = ["x" if f is None else str(f) for f in self.frets]
+        separator = "-" if any(f is not None and f > 9 for f in self.frets) else ""
+        return separator.join(marks)
+
+
+# -----------------------------------------------------------------------------
+# Class FretboardIndex
+# -----------------------------------------------------------------------------
+class FretboardIndex:
+    """
+    Where every MIDI pitch and pitch class lies on a tuned neck. Strings are
+    numbered in the order of open_strings (the lowest string first on a guitar).
+    """
+
+    def __init__(self, open_strings: Sequence[int] = STANDARD_TUNING, max_fret: int = 15):
+        self.open_strings: Tuple[int, ...] = tuple(open_strings)
+        self.max_fret = max_fret
+        positions: Dict[int, List[Tuple[int, int]]] = {}
+        frets_by_pc = [[[] for _ in range(12)] for _ in self.open_strings]
+        for string, open_note in enumerate(self.open_strings):
+            for fret in range(max_fret + 1):
+                pitch = open_note + fret
+                positions.setdefault(pitch, []).append((string, fret))
+                frets_by_pc[string][pitch % 12].append(fret)
+        self._positions = {pitch: tuple(spots) for pitch, spots in positions.items()}
+        self._frets_by_pc = tuple(tuple(tuple(frets) for frets in row) for row in frets_by_pc)
+        # pitches[string][fret]: MIDI note sounded at each position
+        self.pitches: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(range(open_note, open_note + max_fret + 1)) for open_note in self.open_strings
+        )
+
+    def positions(self, pitch: int) -> Tuple[Tuple[int, int], ...]:
+        """(string, fret) pairs that sound a MIDI pitch, lowest string first."""
+        return self._positions.get(pitch, ())
+
+    def frets(self, string: int, pitch_class: int) -> Tuple[int, ...]:
+        """Frets of a string that sound a pitch class, ascending."""
+        return self._frets_by_pc[string][pitch_class % 12]
+
+
+# -----------------------------------------------------------------------------
+# Class FingeringSearch
+# -----------------------------------------------------------------------------
+class FingeringSearch:
+    """Enumerates and ranks playable fingerings, cached per chord pitch set."""
+
+    DEFAULT_MAX_FRET: int = 15
+    DEFAULT_MAX_SPAN: int = 4
+    DEFAULT_CACHE_SIZE: int = 256
+    MAX_FINGERS: int = 4
+
+    def __init__(
+        self,
+        open_strings: Sequence[int] = STANDARD_TUNING,
+        max_fret: int = DEFAULT_MAX_FRET,
+        max_span: int = DEFAULT_MAX_SPAN,
+        min_strings: int = 3,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Args:
+            open_strings: Open-string MIDI notes, lowest string first.
+            max_fret: Highest fret used.
+            max_span: Largest distance in frets between fretted notes.
+            min_strings: Fewest strings a fingering must sound.
+            cache_size: Chord pitch sets whose ranked fingerings are cached.
+        """
+        self.index = FretboardIndex(open_strings, max_fret)
+        self.max_span = max_span
+        self.min_strings = min_strings
+        self._cache = LRUCache(cache_size)
+
+    def cache_info(self) -> CacheInfo:
+        """Hit/miss/eviction statistics of the fingering cache."""
+        return self._cache.cache_info()
+
+    def fingerings(
+        self,
+        pitch_classes: Iterable[int],
+        root_pc: Optional[int] = None,
+        bass_pc: Optional[int] = None,
+        omit_fifth: Optional[bool] = None,
+    ) -> Tuple[Fingering, ...]:
+        """
+        Playable fingerings of a chord, most playable first.
+
+        Args:
+            pitch_classes: Chord tones (0-11).
+            root_pc: Chord root, used to find the 5th (default: bass_pc).
+            bass_pc: Pitch class of the lowest sounding note (default: root_pc,
+                or the lowest of pitch_classes).
+            omit_fifth: True makes the 5th optional, False requires it, None
+                drops it only when no fingering keeps it.
+        """
+        tones = tuple(sorted({pc % 12 for pc in pitch_classes}))
+        if not tones:
+            return ()
+        if bass_pc is None:
+            bass_pc = root_pc if root_pc is not None else tones[0]
+        if root_pc is None:
+            root_pc = bass_pc
+        key = (tones, root_pc % 12, bass_pc % 12, omit_fifth)
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+
+        fifth = (root_pc + 7) % 12
+        can_omit = fifth in tones and fifth != bass_pc % 12
+        if omit_fifth is None:
+            result = self._search(tones, bass_pc % 12, ())
+            if not result and can_omit:
+                result = self._search(tones, bass_pc % 12, (fifth,))
+        else:
+            result = self._search(tones, bass_pc % 12, (fifth,) if omit_fifth and can_omit else ())
+        self._cache.put(key, result)
+        return result
+
+    def fingerings_for_notes(
+        self,
+        midi_notes: Sequence[int],
+        root_pc: Optional[int] = None,
+        omit_fifth: Optional[bool] = None,
+    ) -> Tuple[Fingering, ...]:
+        """Fingerings of a voiced chord, keeping its lowest note as the bass."""
+        if not midi_notes:
+            return ()
+        bass_pc = min(midi_notes) % 12
+        return self.fingerings(midi_notes, root_pc, bass_pc, omit_fifth)
+
+    def _search(
+        self, tones: Tuple[int, ...], bass_pc: int, optional: Tuple[int, ...]
+    ) -> Tuple[Fingering, ...]:
+        index = self.index
+        open_strings = index.open_strings
+        n_strings = len(open_strings)
+        max_span = self.max_span
+        min_strings = self.min_strings
+        required_mask = 0
+        for pc in tones:
+            if pc not in optional:
+                required_mask |= 1 << pc
+        n_required = bin(required_mask).count("1")
+        # Per string: (fret, pitch-class bit) of every chord tone, ascending frets
+        options = [
+            sorted((fret, 1 << pc) for pc in tones for fret in index.frets(string, pc))
+            for string in range(n_strings)
+        ]
+        bass_bit = 1 << bass_pc
+        # On ascending tunings the first sounding string must carry the bass and no
+        # later note may sound below it. On re-entrant tunings (ukulele) the bass is
+        # not always on the first sounding string, so only the final check applies.
+        ascending = all(a < b for a, b in zip(open_strings, open_strings[1:]))
+        optional_mask = 0
+        for pc in optional:
+            optional_mask |= 1 << pc
+
+        found: List[Fingering] = []
+        frets: List[Optional[int]] = [None] * n_strings
+
+        def walk(string: int, used: int, low: int, high: int, sounding: int, floor: int) -> None:
+            # floor: lowest pitch sounded so far
+            left = n_strings - string
+            if string == n_strings:
+                if (
+                    sounding >= min_strings
+                    and used & required_mask == required_mask
+                    and floor % 12 == bass_pc
+                ):
+                    omitted = bin(optional_mask & ~used).count("1")
+                    fingering = self._rate(tuple(frets), omitted)
+                    if fingering is not None:
+                        found.append(fingering)
+                return
+            missing = bin(required_mask & ~used).count("1")
+            if missing > left or sounding + left < min_strings:
+                return
+            # Mute this string
+            frets[string] = None
+            walk(string + 1, used, low, high, sounding, floor)
+            open_note = open_strings[string]
+            for fret, bit in options[string]:
+                pitch = open_note + fret
+                if ascending and (bit != bass_bit if sounding == 0 else pitch < floor):
+                    continue
+                new_low, new_high = low, high
+                if fret:
+                    new_low, new_high = min(low, fret), max(high, fret)
+                    if new_high - new_low > max_span:
+                        if fret > new_low:
+                            break
+                        continue
+                frets[string] = fret
+                walk(string + 1, used | bit, new_low, new_high, sounding + 1, min(floor, pitch))
+            frets[string] = None
+
+        if n_required <= n_strings:
+            walk(0, 0, 99, -1, 0, 1 << 10)
+        found.sort(key=lambda f: (f.score, tuple(-1 if x is None else x for x in f.frets)))
+        return tuple(found)
+
+    def _rate(self, frets: Frets, omitted: int) -> Optional[Fingering]:
+        """
+        Builds a Fingering with its playability score (lower is better), or None
+        if it needs more than MAX_FINGERS fingers.
+        """
+        open_strings = self.index.open_strings
+        sounding = [s for s, f in enumerate(frets) if f is not None]
+        notes = tuple(open_strings[s] + frets[s] for s in sounding)
+        fretted = [frets[s] for s in sounding if frets[s]]
+        low = min(fretted, default=0)
+        span = max(fretted, default=0) - low
+
+        # A barre on the lowest fret holds all its notes with one finger, as long
+        # as no open string rings between them
+        at_low = [s for s in sounding if frets[s] == low and low > 0]
+        fingers = len(fretted)
+        if len(at_low) > 1 and all(frets[s] != 0 for s in range(at_low[0], at_low[-1] + 1)):
+            fingers -= len(at_low) - 1
+        if fingers > self.MAX_FINGERS:
+            return None
+
+        # Unused bass strings are simply not struck; treble and inner ones must be damped
+        first, last = sounding[0], sounding[-1]
+        inner_mutes = sum(1 for s in range(first, last + 1) if frets[s] is None)
+        score = (
+            span
+            + 0.3 * low
+            + 0.5 * fingers
+            + 0.3 * first
+            + 1.5 * (len(frets) - 1 - last)
+            + 2.5 * inner_mutes
+            + 0.5 * omitted
+        )
+        return Fingering(frets, notes, score)
+
+
+def hand_movement(prev: Fingering, curr: Fingering) -> int:
+    """Frets the hand travels between two fingerings (open shapes sit at the nut)."""
+    return abs(prev.position - curr.position)
+
+
+# -----------------------------------------------------------------------------
+# Class FingeringPlanner
+# -----------------------------------------------------------------------------
+class FingeringPlanner:
+    """
+    Chooses the fingerings of a progression for minimal hand movement and
+    stretch: each chord costs its playability score (span, fingers, mutes)
+    plus ``move_weight`` times the frets moved from the previous shape.
+    """
+
+    DEFAULT_MAX_CANDIDATES: int = 12
+    DEFAULT_MOVE_WEIGHT: float = 1.0
+    DEFAULT_CACHE_SIZE: int = 1024
+
+    def __init__(
+        self,
+        search: Optional[FingeringSearch] = None,
+        max_candidates: int = DEFAULT_MAX_CANDIDATES,
+        move_weight: float = DEFAULT_MOVE_WEIGHT,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Args:
+            search: Fingering search of the instrument (default: standard guitar).
+            max_candidates: Most playable fingerings considered per chord.
+            move_weight: Cost of moving the hand by one fret, against one point
+                of playability score.
+            cache_size: Chord pairs whose movement-cost matrices are cached.
+        """
+        if max_candidates < 1:
+            raise ValueError(f"max_candidates must be >= 1, got {max_candidates}")
+        self.search = search if search is not None else FingeringSearch()
+        self.max_candidates = max_candidates
+        self.move_weight = move_weight
+        self._matrices = LRUCache(cache_size)
+
+    def cache_info(self) -> CacheInfo:
+        """Hit/miss/eviction statistics of the movement-cost matrix cache."""
+        return self._matrices.cache_info()
+
+    def candidates(
+        self, midi_notes: Sequence[int], root_pc: Optional[int] = None
+    ) -> Tuple[Fingering, ...]:
+        """The most playable fingerings of a voiced chord, best first."""
+        return self.search.fingerings_for_notes(midi_notes, root_pc)[: self.max_candidates]
+
+    def plan(self, chords: Iterable[ChordNotes]) -> List[Optional[Fingering]]:
+        """
+        One fingering per (midi_notes, root_pc) chord. Chords without a playable
+        fingering get None and do not break the chain: the next chord moves from
+        the last fingered one.
+        """
+        layers = [self.candidates(notes, root_pc) if notes else () for notes, root_pc in chords]
+        plan: List[Optional[Fingering]] = [None] * len(layers)
+        indices = [i for i, layer in enumerate(layers) if layer]
+        if not indices:
+            return plan
+
+        first = layers[indices[0]]
+        costs = [f.score for f in first]
+        back: List[List[int]] = []
+        for prev, curr in zip(indices, indices[1:]):
+            step_costs: List[float] = []
+            step_back: List[int] = []
+            for row, fingering in zip(self._matrix(layers[prev], layers[curr]), layers[curr]):
+                totals = list(map(add, costs, row))
+                best = min(totals)
+                step_costs.append(best + fingering.score)
+                step_back.append(totals.index(best))
+            costs = step_costs
+            back.append(step_back)
+
+        state = costs.index(min(costs))
+        plan[indices[-1]] = layers[indices[-1]][state]
+        for t in range(len(indices) - 2, -1, -1):
+            state = back[t][state]
+            plan[indices[t]] = layers[indices[t]][state]
+        return plan
+
+    def _matrix(
+        self, prev: Tuple[Fingering, ...], curr: Tuple[Fingering, ...]
+    ) -> Tuple[Tuple[float, ...], ...]:
+        """matrix[j][i]: weighted movement from prev[i] to curr[j], cached per pair."""
+        key = (prev, curr)
+        matrix = self._matrices.get(key)
+        if matrix is None:
+            weight = self.move_weight
+            matrix = tuple(tuple(weight * hand_movement(p, c) for p in prev) for c in curr)
+            self._matrices.put(key, matrix)
+        return matrix
@@ -1,21 +1,127 @@
-import copy
 import logging
 import os
 import random
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 from colorama import Fore, Style
 from mido import Message, MetaMessage, MidiFile, MidiTrack, bpm2tempo
 
+from .caching import CacheInfo, LRUCache, scale_fingerprint
+from .chord_set import ScaleChord, ScaleChordSet
+from .fingerings import Fingering, FingeringPlanner
+from .instruments import DEFAULT_TUNING, Tuning, fingering_search, get_tuning
+from .parallel import generate_parallel
+from .spelling import key_spelling, parse_note, spell_chord_tones
 from .theory_utils import MusicTheory, MusicTheoryUtils
+from .voice_leading import VoiceLeadingOptimizer
+
+try:
+    import numpy as np
+except ImportError:  # Optional: batch APIs need `pip install chorderizer[fast]`
+    np = None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "NumPy is required for batch generation. Install it with 'pip install chorderizer[fast]'."
+        )
+
+
+class ChordBatch(NamedTuple):
+    """
+    Result of ChordGenerator.generate_batch for N requests over up to D degrees
+    (the largest degree count among the requested scales).
+
+    midi: (N, D, M) int16 MIDI notes, ascending, padded with -1.
+    chord_types: (N, D) int16 indices into ChordGenerator.chord_type_codes, -1 if absent.
+    roots: (N, D) int16 chord root pitch classes, -1 if absent.
+    note_counts: (N, D) int16 number of valid notes per chord.
+    """
+
+    midi: Any
+    chord_types: Any
+    roots: Any
+    note_counts: Any
+
+
+class _DegreePlan(NamedTuple):
+    """A scale degree on a concrete tonic, before extension and inversion are applied."""
+
+    degree: str
+    root_pc: int
+    root_name: str
+    root_letter: Optional[int]  # Letter index for chord-tone spelling, None if unspelled
+    base_quality: str
+    full_quality: str
+    display_suffix: str
+
+
+class _ScalePlan:
+    """
+    The tonic/scale stage of ChordGenerator.generate_chord_set. Resolved chord
+    types and intervals are filled in per extension level on first use.
+    """
+
+    __slots__ = ("scale_name", "use_flats", "degrees", "_resolved")
+
+    def __init__(self, scale_name: str, use_flats: bool, degrees: Tuple[_DegreePlan, ...]):
+        self.scale_name = scale_name
+        self.use_flats = use_flats
+        self.degrees = degrees
+        self._resolved: Dict[int, Tuple[Optional[Tuple[str, str, Tuple[int, ...]]], ...]] = {}
+
+    def resolve(
+        self, generator: "ChordGenerator", extension_level: int
+    ) -> Tuple[Optional[Tuple[str, str, Tuple[int, ...]]], ...]:
+        """(chord type, display suffix, intervals) per degree, None for unknown types."""
+        resolved = self._resolved.get(extension_level)
+        if resolved is None:
+            resolved = tuple(
+                generator._resolve_degree(degree, extension_level) for degree in self.degrees
+            )
+            self._resolved[extension_level] = resolved
+        return resolved
 
 
 # -----------------------------------------------------------------------------
 # Class ChordGenerator
 # -----------------------------------------------------------------------------
 class ChordGenerator:
-    def __init__(self, theory: MusicTheory):
-        self.theory = theory
+    # Default number of generated chord sets kept in the LRU cache
+    DEFAULT_CACHE_SIZE: int = 256
+    # Number of (tonic, scale) generation plans kept in the LRU cache
+    PLAN_CACHE_SIZE: int = 64
+
+    def __init__(
+        self,
+        theory: Optional[MusicTheory] = None,
+        chord_space=None,
+        cache_size: Optional[int] = None,
+    ):
+        self.theory = theory if theory is not None else MusicTheory.shared()
+        self._chord_cache = LRUCache(self.DEFAULT_CACHE_SIZE if cache_size is None else cache_size)
+        # Tonic/scale stage of generation, reused when only extension or inversion change
+        self._plan_cache = LRUCache(self.PLAN_CACHE_SIZE)
+        # Catalog scales are immutable registry objects, so their content hashes
+        # are computed once and found by identity (pack scales: on first use)
+        self._fingerprints_by_id = {
+            id(info): scale_fingerprint(info) for info in self.theory.core_scales.values()
+        }
+        # Lookup arrays of generate_batch, built on its first call; per-scale rows
+        # are added the first time a scale is requested, so unused packs stay unloaded
+        self._batch_tables: Optional[Dict[str, Any]] = None
+        self._batch_rows: Dict[str, Tuple[Any, Any]] = {}
+        self.chord_space = None
+        if chord_space is not None:
+            self.attach_chord_space(chord_space)
+
+    def attach_chord_space(self, chord_space) -> None:
+        """
+        Serves catalog scales from a precomputed ChordSpaceTable (see chord_space.py).
+        Custom scales and combinations outside the table keep using live generation.
+        """
+        self.chord_space = chord_space
 
     def generate_scale_chords(
         self,
@@ -24,22 +130,160 @@ class ChordGenerator:
         extension_level: int = 2,
         inversion: int = 0,
     ) -> Tuple[Dict[str, str], Dict[str, List[str]], Dict[str, List[int]], Dict[str, str]]:
-        # Initialize cache if it doesn't exist
-        if not hasattr(self, "_chord_cache"):
-            self._chord_cache = {}
+        """
+        Legacy interface: the chords of a scale as (names, note names, MIDI notes,
+        base qualities) dicts keyed by degree. New code should use generate_chord_set.
+        """
+        return self.generate_chord_set(
+            scale_tonic_str, scale_info, extension_level, inversion
+        ).as_dicts()
+
+    def generate_chord_set(
+        self,
+        scale_tonic_str: str,
+        scale_info: Dict[str, Any],
+        extension_level: int = 2,
+        inversion: int = 0,
+    ) -> ScaleChordSet:
+        """
+        Builds the diatonic chords of a scale. The result is immutable and may be
+        shared, so cache hits are returned as-is.
+        """
+        if self.chord_space is not None:
+            scale_key = self.theory.scale_key_of(scale_info)
+            if scale_key is not None:
+                precomputed = self.chord_space.lookup(
+                    scale_tonic_str, scale_key, extension_level, inversion
+                )
+                if precomputed is not None:
+                    return precomputed
+
+        # Key by scale content, not name, so same-named custom scales never collide
+        fingerprint = self._fingerprints_by_id.get(id(scale_info))
+        if fingerprint is None:
+            fingerprint = scale_fingerprint(scale_info)
+            if self.theory.scale_key_of(scale_info) is not None:
+                self._fingerprints_by_id[id(scale_info)] = fingerprint
+        cache_key = (scale_tonic_str, fingerprint, extension_level, inversion)
+
+        cached = self._chord_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        plan = self._scale_plan(scale_tonic_str, scale_info, fingerprint)
+        if plan is None:
+            return ScaleChordSet(
+                scale_tonic_str, scale_info.get("name", ""), extension_level, inversion, ()
+            )
+
+        chords: List[ScaleChord] = []
+        # Only the voicing stage below depends on the inversion
+        for degree, resolved in zip(plan.degrees, plan.resolve(self, extension_level)):
+            if resolved is None:
+                continue
+            chord_type_to_use, degree_display_suffix, chord_structure = resolved
+
+            current_midi_notes = self._voice_chord(chord_structure, degree.root_pc, inversion)
+            if degree.root_letter is not None:
+                current_chord_note_names = spell_chord_tones(
+                    degree.root_letter,
+                    degree.root_pc,
+                    chord_structure,
+                    current_midi_notes,
+                    plan.use_flats,
+                )
+            else:
+                current_chord_note_names = tuple(
+                    MusicTheoryUtils.get_note_name(n, plan.use_flats) for n in current_midi_notes
+                )
+            chords.append(
+                ScaleChord(
+                    degree.degree,
+                    degree.root_name + degree_display_suffix,
+                    degree.root_pc,
+                    degree_display_suffix,
+                    chord_type_to_use,
+                    degree.base_quality,
+                    current_chord_note_names,
+                    tuple(current_midi_notes),
+                )
+            )
+
+        result = ScaleChordSet(scale_tonic_str, plan.scale_name, extension_level, inversion, chords)
+        self._chord_cache.put(cache_key, result)
+        return result
+
+    def _voice_chord(
+        self, chord_structure: Sequence[int], root_pc: int, inversion: int
+    ) -> List[int]:
+        """The voicing stage: ascending MIDI notes of a chord structure on a root."""
+        # Apply inversion
+        chord_intervals_relative = self._apply_inversion(list(chord_structure), inversion)
+
+        # Generate MIDI notes for the chord
+        unique_sorted_intervals = sorted(set(chord_intervals_relative))
+
+        initial_octave_offset = self._determine_initial_octave_offset(
+            unique_sorted_intervals, root_pc
+        )
 
-        # Create a cache key using scale_info's name (dicts aren't hashable)
-        scale_name = scale_info.get("name", "")
-        cache_key = (scale_tonic_str, scale_name, extension_level, inversion)
+        current_midi_notes = self._generate_midi_notes_for_chord(
+            unique_sorted_intervals, root_pc, initial_octave_offset
+        )
+        return sorted(set(current_midi_notes))  # Final sort and unique
+
+    def build_chord(
+        self, degree: str, root_name: str, chord_type: str, inversion: int = 0
+    ) -> ScaleChord:
+        """
+        Builds a single chord outside any scale (e.g. a secondary dominant), voiced
+        and spelled like the chords of generate_chord_set.
 
-        # Return cached result if available
-        if cache_key in self._chord_cache:
-            return copy.deepcopy(self._chord_cache[cache_key])
+        Raises:
+            ValueError: If the root is not a note name or the chord type is unknown.
+        """
+        parsed = parse_note(root_name)
+        chord_structure = self.theory.CHORD_STRUCTURES.get(chord_type)
+        if parsed is None:
+            raise ValueError(f"Invalid chord root '{root_name}'.")
+        if chord_structure is None:
+            raise ValueError(f"Unknown chord type '{chord_type}'.")
+        root_letter, root_pc = parsed
+        suffix = self.theory.CHORD_SUFFIXES.get(chord_type, chord_type)
+        midi_notes = self._voice_chord(chord_structure, root_pc, inversion)
+        note_names = spell_chord_tones(
+            root_letter, root_pc, tuple(chord_structure), midi_notes, "b" in root_name[1:]
+        )
+        tones = set(chord_structure)
+        third = "minor" if 3 in tones else "major"
+        if 6 in tones and third == "minor":
+            base_quality = "diminished"
+        elif 8 in tones and third == "major" and 7 not in tones:
+            base_quality = "augmented"
+        else:
+            base_quality = third
+        return ScaleChord(
+            degree,
+            root_name + suffix,
+            root_pc,
+            suffix,
+            chord_type,
+            base_quality,
+            note_names,
+            tuple(midi_notes),
+        )
 
-        generated_chords: Dict[str, str] = {}
-        notes_per_chord_names: Dict[str, List[str]] = {}
-        notes_per_chord_midi: Dict[str, List[int]] = {}
-        generated_base_qualities: Dict[str, str] = {}
+    def _scale_plan(
+        self, scale_tonic_str: str, scale_info: Dict[str, Any], fingerprint: str
+    ) -> Optional["_ScalePlan"]:
+        """
+        Returns the tonic/scale stage of generation (degree roots and spellings),
+        cached per (tonic, scale). None if the tonic is invalid.
+        """
+        plan_key = (scale_tonic_str, fingerprint)
+        plan = self._plan_cache.get(plan_key)
+        if plan is not None:
+            return plan
 
         try:
             scale_tonic_index = MusicTheoryUtils.get_note_index(scale_tonic_str)
@@ -48,78 +292,257 @@ class ChordGenerator:
             print(
                 f"{Fore.RED}Error: Invalid scale tonic '{scale_tonic_str}'. Please provide a valid tonic.{Style.RESET_ALL}"
             )
-            return {}, {}, {}, {}
-
-        scale_degrees_info = scale_info["degrees"]
-        use_flats = MusicTheoryUtils.should_use_flats(scale_tonic_str)
-
-        for degree_roman, degree_definition in scale_degrees_info.items():
+            return None
+
+        # Letter-name spelling of every degree root (None if the tonic is not a note name)
+        spelling = key_spelling(scale_tonic_str, scale_info)
+        if spelling is not None:
+            use_flats = spelling.prefers_flats
+        else:
+            use_flats = MusicTheoryUtils.should_use_flats(scale_tonic_str)
+
+        degrees: List[_DegreePlan] = []
+        for degree_idx, (degree_roman, degree_definition) in enumerate(
+            scale_info["degrees"].items()
+        ):
             chord_root_abs_idx = (scale_tonic_index + degree_definition["root_interval"]) % 12
-            chord_root_name = MusicTheoryUtils.get_note_name(chord_root_abs_idx, use_flats)
-            base_quality = degree_definition["base_quality"]
-            degree_display_suffix = degree_definition["display_suffix"]
-            chord_type_to_use = degree_definition[
-                "full_quality"
-            ]  # Default to full quality (e.g., 7ths)
-
-            chord_type_to_use, degree_display_suffix = self._determine_chord_type_and_suffix(
-                base_quality,
-                chord_type_to_use,
-                degree_display_suffix,
-                extension_level,
+            if spelling is not None:
+                chord_root_name = spelling.root_names[degree_idx]
+                root_letter = spelling.root_letters[degree_idx]
+            else:
+                chord_root_name = MusicTheoryUtils.get_note_name(chord_root_abs_idx, use_flats)
+                root_letter = None
+            degrees.append(
+                _DegreePlan(
+                    degree_roman,
+                    chord_root_abs_idx,
+                    chord_root_name,
+                    root_letter,
+                    degree_definition["base_quality"],
+                    degree_definition["full_quality"],
+                    degree_definition["display_suffix"],
+                )
             )
 
-            # Get intervals for the determined chord type
-            chord_intervals_relative = list(
-                self.theory.CHORD_STRUCTURES.get(
-                    chord_type_to_use,
-                    self.theory.CHORD_STRUCTURES.get(base_quality, []),
-                )
+        plan = _ScalePlan(scale_info.get("name", ""), use_flats, tuple(degrees))
+        self._plan_cache.put(plan_key, plan)
+        return plan
+
+    def _resolve_degree(
+        self, degree: "_DegreePlan", extension_level: int
+    ) -> Optional[Tuple[str, str, Tuple[int, ...]]]:
+        """Chord type, display suffix and intervals of a degree at an extension level."""
+        chord_type_to_use, degree_display_suffix = self._determine_chord_type_and_suffix(
+            degree.base_quality,
+            degree.full_quality,  # Default to full quality (e.g., 7ths)
+            degree.display_suffix,
+            extension_level,
+        )
+
+        # Get intervals for the determined chord type
+        chord_structure = self.theory.CHORD_STRUCTURES.get(
+            chord_type_to_use,
+            self.theory.CHORD_STRUCTURES.get(degree.base_quality, ()),
+        )
+        if not chord_structure:  # Fallback if type is unknown
+            print(
+                f"{Fore.YELLOW}Warning: Chord structure for '{chord_type_to_use}' or '{degree.base_quality}' not found. Skipping chord for degree {degree.degree}.{Style.RESET_ALL}"
             )
-            if not chord_intervals_relative:  # Fallback if type is unknown
-                print(
-                    f"{Fore.YELLOW}Warning: Chord structure for '{chord_type_to_use}' or '{base_quality}' not found. Skipping chord for degree {degree_roman}.{Style.RESET_ALL}"
+            return None
+        return chord_type_to_use, degree_display_suffix, tuple(chord_structure)
+
+    def generate_parallel(self, requests: Iterable[Any], **options) -> Iterator[Any]:
+        """
+        Generates chord sets for many (tonic, scale, extension_level, inversion)
+        requests on a process pool attached to this generator's catalog. See
+        parallel.generate_parallel for the options (max_workers, chunksize,
+        ordered, executor, max_in_flight).
+        """
+        options.setdefault("cache_size", self._chord_cache.maxsize)
+        return generate_parallel(requests, self.theory, **options)
+
+    def cache_info(self) -> CacheInfo:
+        """Hit/miss/eviction statistics of the generated chord set cache."""
+        return self._chord_cache.cache_info()
+
+    # Largest extension level with distinct behaviour; anything outside 0..5 acts like 7ths
+    MAX_EXTENSION_LEVEL: int = 5
+
+    @property
+    def chord_type_codes(self) -> Tuple[str, ...]:
+        """Chord type names indexed by the codes returned from generate_batch."""
+        return tuple(self.theory.CHORD_STRUCTURES)
+
+    def _build_batch_tables(self) -> Dict[str, Any]:
+        """Precomputes the chord/inversion lookup arrays shared by every scale."""
+        type_codes = {name: code for code, name in enumerate(self.chord_type_codes)}
+
+        # Inverted, de-duplicated interval stacks per (chord type, inversion). The extra
+        # last row is an empty chord, so code -1 indexes "no chord" directly.
+        max_notes = max((len(iv) for iv in self.theory.CHORD_STRUCTURES.values()), default=1)
+        n_types = len(type_codes)
+        intervals = np.zeros((n_types + 1, max_notes, max_notes), dtype=np.int16)
+        interval_counts = np.zeros((n_types + 1, max_notes), dtype=np.int16)
+        for name, code in type_codes.items():
+            for inversion in range(max_notes):
+                stacked = sorted(
+                    set(self._apply_inversion(list(self.theory.CHORD_STRUCTURES[name]), inversion))
                 )
-                continue
+                intervals[code, inversion, : len(stacked)] = stacked
+                interval_counts[code, inversion] = len(stacked)
 
-            final_chord_display_name = chord_root_name + degree_display_suffix
+        return {
+            "type_codes": type_codes,
+            "intervals": intervals,
+            "interval_counts": interval_counts,
+        }
 
-            # Apply inversion
-            chord_intervals_relative = self._apply_inversion(
-                list(chord_intervals_relative), inversion
-            )
+    def _batch_row(self, scale_key: str) -> Tuple[Any, Any]:
+        """
+        Root intervals (D,) and chord type codes per extension level (D, E) of a
+        scale's degrees, built the first time the scale is requested.
 
-            # Generate MIDI notes for the chord
-            current_midi_notes: List[int] = []
-            unique_sorted_intervals = sorted(set(chord_intervals_relative))
+        Raises:
+            KeyError: If the scale key is unknown.
+        """
+        row = self._batch_rows.get(scale_key)
+        if row is not None:
+            return row
+        degrees = self.theory.AVAILABLE_SCALES[scale_key]["degrees"]
+        type_codes = self._batch_tables["type_codes"]
+        n_ext = self.MAX_EXTENSION_LEVEL + 1
+
+        root_intervals = np.zeros(len(degrees), dtype=np.int16)
+        degree_types = np.full((len(degrees), n_ext), -1, dtype=np.int16)
+        for d_idx, definition in enumerate(degrees.values()):
+            root_intervals[d_idx] = definition["root_interval"]
+            for ext in range(n_ext):
+                chord_type, _ = self._determine_chord_type_and_suffix(
+                    definition["base_quality"],
+                    definition["full_quality"],
+                    definition["display_suffix"],
+                    ext,
+                )
+                if chord_type not in self.theory.CHORD_STRUCTURES:
+                    chord_type = definition["base_quality"]
+                degree_types[d_idx, ext] = type_codes.get(chord_type, -1)
+        row = self._batch_rows[scale_key] = (root_intervals, degree_types)
+        return row
 
-            initial_octave_offset = self._determine_initial_octave_offset(
-                unique_sorted_intervals, chord_root_abs_idx
-            )
+    def generate_batch(
+        self,
+        tonics: Union[Sequence[Union[int, str]], Any],
+        scale_keys: Union[Sequence[str], str],
+        extension_levels: Union[Sequence[int], int] = 2,
+        inversions: Union[Sequence[int], int] = 0,
+    ) -> ChordBatch:
+        """
+        Generates the diatonic chords of many (tonic, scale, extension, inversion)
+        requests at once with vectorized interval arithmetic.
 
-            current_midi_notes = self._generate_midi_notes_for_chord(
-                unique_sorted_intervals, chord_root_abs_idx, initial_octave_offset
-            )
+        Parameters are broadcast against each other, so a single scale key or
+        extension level can be combined with arrays of the others. Degrees are
+        laid out in scale order; note placement matches generate_scale_chords.
 
-            current_midi_notes = sorted(set(current_midi_notes))  # Final sort and unique
-            current_chord_note_names = [
-                MusicTheoryUtils.get_note_name(n, use_flats) for n in current_midi_notes
+        Requires NumPy.
+        """
+        _require_numpy()
+        if self._batch_tables is None:
+            self._batch_tables = self._build_batch_tables()
+        tables = self._batch_tables
+
+        if isinstance(scale_keys, str):
+            scale_keys = [scale_keys]
+        if isinstance(tonics, (str, int)):
+            tonics = [tonics]
+        if not isinstance(tonics, np.ndarray):
+            tonics = [
+                MusicTheoryUtils.get_note_index(t) if isinstance(t, str) else t for t in tonics
             ]
+        # Only the requested scales are looked up (and their packs loaded)
+        scale_index: Dict[str, int] = {}
+        for key in scale_keys:
+            scale_index.setdefault(key, len(scale_index))
+        try:
+            rows = [self._batch_row(key) for key in scale_index]
+        except KeyError as e:
+            raise ValueError(f"Unknown scale key {e} for batch generation.") from e
+        scale_idx = [scale_index[key] for key in scale_keys]
+        n_degrees = max((len(root_row) for root_row, _ in rows), default=1)
+        root_intervals = np.zeros((len(rows), n_degrees), dtype=np.int16)
+        degree_types = np.full(
+            (len(rows), n_degrees, self.MAX_EXTENSION_LEVEL + 1), -1, dtype=np.int16
+        )
+        for s_idx, (root_row, type_row) in enumerate(rows):
+            root_intervals[s_idx, : len(root_row)] = root_row
+            degree_types[s_idx, : len(type_row)] = type_row
+
+        tonic_arr, scale_arr, ext_arr, inv_arr = np.broadcast_arrays(
+            np.ravel(np.asarray(tonics, dtype=np.int64)) % 12,
+            np.ravel(np.asarray(scale_idx, dtype=np.int64)),
+            np.ravel(np.asarray(extension_levels, dtype=np.int64)),
+            np.ravel(np.asarray(inversions, dtype=np.int64)),
+        )
 
-            generated_chords[degree_roman] = final_chord_display_name
-            notes_per_chord_names[degree_roman] = current_chord_note_names
-            notes_per_chord_midi[degree_roman] = current_midi_notes
-            generated_base_qualities[degree_roman] = base_quality
+        intervals = tables["intervals"]
+        max_notes = intervals.shape[1]
+        ext_arr = np.where((ext_arr < 0) | (ext_arr > self.MAX_EXTENSION_LEVEL), 2, ext_arr)
+        inv_arr = np.where((inv_arr < 0) | (inv_arr >= max_notes), 0, inv_arr)
+
+        degree_idx = np.arange(n_degrees)[None, :]
+        codes = degree_types[scale_arr[:, None], degree_idx, ext_arr[:, None]]
+        roots = (tonic_arr[:, None] + root_intervals[scale_arr]) % 12
+        stack = intervals[codes, inv_arr[:, None]].astype(np.int64)  # (N, D, M)
+        counts = tables["interval_counts"][codes, inv_arr[:, None]]
+
+        # Mirrors _determine_initial_octave_offset
+        base = self.theory.MIDI_BASE_OCTAVE
+        tentative_first = base + (roots + stack[..., 0]) % 12
+        offset = np.where(
+            (tentative_first < base - 6) & (stack[..., 0] >= 0),
+            12,
+            np.where((tentative_first > base + 6) & (stack[..., 0] <= 7), -12, 0),
+        )
 
-        result = (
-            generated_chords,
-            notes_per_chord_names,
-            notes_per_chord_midi,
-            generated_base_qualities,
+        # Mirrors _generate_midi_notes_for_chord, one voice at a time across all chords
+        midi = np.full(stack.shape, -1, dtype=np.int64)
+        last = np.full(roots.shape, -1, dtype=np.int64)
+        wide = counts > 4
+        for j in range(max_notes):
+            rel = stack[..., j]
+            candidate = base + offset + (roots + rel) % 12 + (rel // 12) * 12
+            raise_by = np.where(
+                (last != -1) & (candidate <= last), ((last - candidate) // 12 + 1) * 12, 0
+            )
+            candidate = candidate + raise_by
+            candidate = np.where(candidate > 108, candidate - 12, candidate)
+            candidate = np.where(candidate < 21, candidate + 12, candidate)
+            candidate = np.where(
+                wide
+                & (candidate > base + 24 + offset)
+                & (((candidate - 12) > last) | (last == -1)),
+                candidate - 12,
+                candidate,
+            )
+            placed = (j < counts) & (candidate >= 0) & (candidate <= 127)
+            midi[..., j] = np.where(placed, candidate, -1)
+            last = np.where(placed, candidate, last)
+
+        # Final sort + de-duplication, keeping the -1 padding at the end
+        sentinel = 1 << 10
+        midi = np.sort(np.where(midi < 0, sentinel, midi), axis=-1)
+        duplicate = np.zeros(midi.shape, dtype=bool)
+        duplicate[..., 1:] = midi[..., 1:] == midi[..., :-1]
+        midi = np.sort(np.where(duplicate, sentinel, midi), axis=-1)
+        note_counts = (midi != sentinel).sum(axis=-1)
+        midi = np.where(midi == sentinel, -1, midi)
+
+        return ChordBatch(
+            midi=midi.astype(np.int16),
+            chord_types=codes.astype(np.int16),
+            roots=np.where(codes >= 0, roots, -1).astype(np.int16),
+            note_counts=note_counts.astype(np.int16),
         )
-        self._chord_cache[cache_key] = result
-        # Return a deep copy to prevent callers from mutating the shared cache
-        return copy.deepcopy(result)
 
     def _determine_chord_type_and_suffix(
         self,
@@ -269,25 +692,21 @@ class ChordGenerator:
 # Class TablatureGenerator
 # -----------------------------------------------------------------------------
 class TablatureGenerator:
-    def __init__(self, theory: MusicTheory):
-        self.theory = theory
-        # Standard guitar tuning, MIDI notes
-        self.GUITAR_OPEN_STRINGS_MIDI: Dict[str, int] = {
-            "e1": 64,
-            "B2": 59,
-            "G3": 55,
-            "D4": 50,
-            "A5": 45,
-            "E6": 40,
-        }
-        self.TAB_STRING_NAMES: List[str] = [
-            "e1",
-            "B2",
-            "G3",
-            "D4",
-            "A5",
-            "E6",
-        ]  # High e to Low E
+    def __init__(self, theory: Optional[MusicTheory] = None, tuning: Optional[Tuning] = None):
+        self.theory = theory if theory is not None else MusicTheory.shared()
+        self.set_tuning(tuning if tuning is not None else get_tuning(DEFAULT_TUNING))
+
+    def set_tuning(self, tuning: Tuning) -> None:
+        """Switches to another tuning; its lookup tables are shared and built once."""
+        self.tuning = tuning
+        count = len(tuning.strings)
+        # Strings named with their number, e.g. "E6" ... "e1" in standard tuning
+        names = [f"{name}{count - i}" for i, name in enumerate(tuning.string_names)]
+        self.GUITAR_OPEN_STRINGS_MIDI: Dict[str, int] = dict(zip(names, tuning.open_strings))
+        self.TAB_STRING_NAMES: List[str] = names[::-1]  # String 1 first
+        self._name_width = max(2, *(len(name) for name in names))
+        self.fingering_search = fingering_search(tuning)
+        self.fingering_planner = FingeringPlanner(self.fingering_search)
 
     def _assign_fret_to_string(
         self, chord_note_midi: int, open_string_midi: int, max_frets: int
@@ -331,9 +750,108 @@ class TablatureGenerator:
         tab_lines: List[str] = [f"Chord: {chord_display_name} (simple tab)"]
         for string_name in self.TAB_STRING_NAMES:  # Display from e1 (high) to E6 (low)
             fret_display = frets_on_strings[string_name]
-            tab_lines.append(f"{string_name.ljust(2)}|--{fret_display.rjust(2, '-')}--|")
+            tab_lines.append(
+                f"{string_name.ljust(self._name_width)}|--{fret_display.rjust(2, '-')}--|"
+            )
+        return tab_lines
+
+    def generate_fingering_tab(
+        self,
+        chord_display_name: str,
+        chord_midi_notes: List[int],
+        root_pc: Optional[int] = None,
+        rank: int = 0,
+    ) -> List[str]:
+        """
+        Tab of the rank-th most playable fingering of a chord (see FingeringSearch),
+        keeping its lowest note in the bass. root_pc (used to find an omittable
+        5th) defaults to the root named in chord_display_name. Falls back to
+        generate_simple_tab when no playable fingering exists.
+        """
+        if not chord_midi_notes:
+            return []
+        if root_pc is None:
+            parsed = parse_note(chord_display_name)
+            root_pc = parsed[1] if parsed is not None else None
+        fingerings = self.fingering_search.fingerings_for_notes(chord_midi_notes, root_pc)
+        if not fingerings:
+            return self.generate_simple_tab(chord_display_name, chord_midi_notes)
+
+        rank = max(0, min(rank, len(fingerings) - 1))
+        fingering = fingerings[rank]
+        # Fingerings list the highest-numbered string first
+        frets_on_strings = dict(zip(reversed(self.TAB_STRING_NAMES), fingering.frets))
+        tab_lines: List[str] = [
+            f"Chord: {chord_display_name} ({fingering.shape}, {rank + 1}/{len(fingerings)})"
+        ]
+        for string_name in self.TAB_STRING_NAMES:
+            fret = frets_on_strings[string_name]
+            fret_display = "x" if fret is None else str(fret)
+            tab_lines.append(
+                f"{string_name.ljust(self._name_width)}|--{fret_display.rjust(2, '-')}--|"
+            )
         return tab_lines
 
+    def plan_progression(
+        self, chords: Sequence[Tuple[str, Sequence[int], Optional[int]]]
+    ) -> List[Optional[Fingering]]:
+        """
+        One fingering per (name, midi_notes, root_pc) chord, chosen together for
+        minimal hand movement (see FingeringPlanner). root_pc may be None to take
+        the root named in the chord name. Unplayable chords get None.
+        """
+        planned = []
+        for name, midi_notes, root_pc in chords:
+            if root_pc is None:
+                parsed = parse_note(name)
+                root_pc = parsed[1] if parsed is not None else None
+            planned.append((midi_notes, root_pc))
+        return self.fingering_planner.plan(planned)
+
+    def generate_progression_tab(
+        self,
+        chords: Sequence[Tuple[str, Sequence[int], Optional[int]]],
+        width: int = 80,
+    ) -> List[str]:
+        """
+        ASCII tab sheet of a progression with the fingerings of plan_progression:
+        one column per chord under a row of chord names, wrapped into systems
+        of at most ``width`` characters separated by blank lines. Chords without
+        a playable fingering are left as empty columns.
+        """
+        if not chords:
+            return []
+        fingerings = self.plan_progression(chords)
+        strings = len(self.TAB_STRING_NAMES)
+        indent = " " * (self._name_width + 2)
+        room = max(1, width - len(indent) - 1)
+
+        # Columns (name cell, one cell per string) grouped into systems that fit the width
+        systems: List[List[Tuple[str, List[str]]]] = [[]]
+        used = 0
+        for (name, _, _), fingering in zip(chords, fingerings):
+            # Fingerings list the highest-numbered string first, the sheet string 1 first
+            frets = fingering.frets[::-1] if fingering is not None else (None,) * strings
+            marks = ["" if fingering is None else "x" if f is None else str(f) for f in frets]
+            size = max(len(name), *(len(mark) for mark in marks)) + 2
+            if systems[-1] and used + size > room:
+                systems.append([])
+                used = 0
+            systems[-1].append(
+                ((" " + name).ljust(size), [("-" + m).ljust(size, "-") for m in marks])
+            )
+            used += size
+
+        lines: List[str] = []
+        for system in systems:
+            if lines:
+                lines.append("")
+            lines.append(indent + "".join(name for name, _ in system).rstrip())
+            for s, string_name in enumerate(self.TAB_STRING_NAMES):
+                body = "".join(cells[s] for _, cells in system)
+                lines.append(f"{string_name.ljust(self._name_width)}|-{body}|")
+        return lines
+
 
 # -----------------------------------------------------------------------------
 # Class VoiceLeader
@@ -419,13 +937,97 @@ class VoiceLeader:
         # No need to re-sort as we ensured i > i-1 during generation
         return result
 
+    @staticmethod
+    def apply_batch(progressions: Any) -> Any:
+        """
+        Vectorized apply over many progressions at once.
+
+        Every chord is re-voiced against the previous non-empty voiced chord of
+        its progression, exactly as chaining apply() chord by chord does (same
+        bass anchoring, octave range and fallback); the first chord is kept.
+        Voices are placed for all progressions together: candidate octaves form
+        a (B, 8) grid per voice and the minimal-motion one is picked with argmin.
+
+        Args:
+            progressions: (B, T, M) array of ascending MIDI notes padded with -1
+                (the layout of ChordBatch.midi), or B lists of T note lists.
+
+        Returns:
+            (B, T, M) int64 array in the same layout.
+
+        Requires NumPy.
+        """
+        _require_numpy()
+        if isinstance(progressions, np.ndarray):
+            notes = progressions.astype(np.int64)
+        else:
+            notes = VoiceLeader._pad_progressions(progressions)
+        if notes.ndim != 3:
+            raise ValueError(f"Expected a (B, T, M) array of progressions, got shape {notes.shape}")
+        n_prog, n_chords, max_notes = notes.shape
+        voiced = notes.copy()
+        counts = (notes >= 0).sum(axis=-1)
+        rows = np.arange(n_prog)
+        octaves = 12 * np.arange(1, 9)
+
+        prev = np.full((n_prog, max_notes), -1, dtype=np.int64)
+        prev_counts = np.zeros(n_prog, dtype=np.int64)
+        for t in range(n_chords):
+            curr = notes[:, t]
+            curr_counts = counts[:, t]
+            active = (
+                (curr_counts > 0) & (prev_counts > 0) & (np.abs(curr_counts - prev_counts) <= 2)
+            )
+            if active.any():
+                result = curr.copy()  # Voice 0 (the bass) stays anchored
+                top_prev = prev[rows, np.maximum(prev_counts - 1, 0)]
+                for i in range(1, max_notes):
+                    live = active & (i < curr_counts)
+                    if not live.any():
+                        break
+                    pitch_class = curr[:, i] % 12
+                    lower_bound = result[:, i - 1] + 1
+                    grid = pitch_class[:, None] + octaves
+                    valid = (grid >= np.maximum(VoiceLeader.MIDI_MIN, lower_bound)[:, None]) & (
+                        grid <= VoiceLeader.MIDI_MAX
+                    )
+                    target = np.where(i < prev_counts, prev[:, i], top_prev)
+                    cost = np.abs(grid - target[:, None]) + 0.1 * np.abs(grid - 60)
+                    best = grid[rows, np.argmin(np.where(valid, cost, np.inf), axis=1)]
+                    # Same fallback as apply: from middle C up, above the previous voice
+                    fallback = pitch_class + 6 * 12
+                    fallback += np.where(
+                        fallback < lower_bound, (lower_bound - fallback + 11) // 12 * 12, 0
+                    )
+                    chosen = np.where(valid.any(axis=1), best, fallback)
+                    result[:, i] = np.where(live, chosen, curr[:, i])
+                voiced[:, t] = np.where(active[:, None], result, curr)
+            present = curr_counts > 0
+            prev = np.where(present[:, None], voiced[:, t], prev)
+            prev_counts = np.where(present, curr_counts, prev_counts)
+        return voiced
+
+    @staticmethod
+    def _pad_progressions(progressions: Sequence[Sequence[Sequence[int]]]) -> Any:
+        """Ragged lists of progressions as a (B, T, M) array padded with -1."""
+        progressions = [list(progression) for progression in progressions]
+        n_chords = max((len(p) for p in progressions), default=0)
+        max_notes = max((len(c) for p in progressions for c in p), default=0)
+        notes = np.full((len(progressions), n_chords, max_notes), -1, dtype=np.int64)
+        for b, progression in enumerate(progressions):
+            for t, chord in enumerate(progression):
+                notes[b, t, : len(chord)] = chord
+        return notes
+
 
 # -----------------------------------------------------------------------------
 # Class MidiGenerator
 # -----------------------------------------------------------------------------
 class MidiGenerator:
-    def __init__(self, theory: MusicTheory):
-        self.theory = theory
+    def __init__(self, theory: Optional[MusicTheory] = None):
+        self.theory = theory if theory is not None else MusicTheory.shared()
+        # Kept across exports so candidate voicings and cost matrices are reused
+        self.voice_leading_optimizer = VoiceLeadingOptimizer(generator=ChordGenerator(self.theory))
 
     def _calculate_strum_delay_ticks(
         self, midi_options: Dict[str, Any], ticks_per_beat: int
@@ -542,11 +1144,29 @@ class MidiGenerator:
                 midi_options["arpeggio_note_duration_beats"] * ticks_per_beat
             )
 
-        use_voice_leading = midi_options.get("voice_leading", False)
+        # voice_leading: False, True / "greedy" (VoiceLeader) or "optimal"
+        # (VoiceLeadingOptimizer, windowed when voice_leading_window is set, with
+        # the key's cost table when voice_leading_key is (tonic, scale_info, ext, inv))
+        voice_leading = midi_options.get("voice_leading", False)
+        use_voice_leading = bool(voice_leading) and voice_leading != "optimal"
+        optimal_notes: Optional[Iterator[List[int]]] = None
+        if voice_leading == "optimal":
+            optimizer = self.voice_leading_optimizer
+            key = midi_options.get("voice_leading_key")
+            table = optimizer.key_table(*key) if key else None
+            progression = [chord_data["midi_notes"] for chord_data in chords_to_process]
+            window = midi_options.get("voice_leading_window")
+            optimal_notes = (
+                optimizer.stream(progression, window, table)
+                if window
+                else iter(optimizer.optimize(progression, table))
+            )
         prev_chord_midi: Optional[List[int]] = None
 
         for chord_data in chords_to_process:
             chord_midi_notes = chord_data["midi_notes"]
+            if optimal_notes is not None:
+                chord_midi_notes = next(optimal_notes)
             if not chord_midi_notes:
                 continue
 
@@ -27,6 +27,7 @@ class IconManager:
         "view": "\uf06e",
         "jam": "\ufb1e",
         "music": "\uf001",
+        "reharm": "\uf0d0",
     }
 
     # Standard fallback characters
@@ -54,6 +55,7 @@ class IconManager:
         "view": "V",
         "jam": "J",
         "music": "M",
+        "reharm": "R",
     }
 
     _has_nerd = None
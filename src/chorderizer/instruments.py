@@ -0,0 +1,158 @@
+"""
+instruments.py — Fretted instrument tunings
+===========================================
+A registry of tunings for guitars (standard, drop D, DADGAD, 7 and 8 strings),
+4 and 5-string bass and ukulele, shared by TablatureGenerator and the TUI
+fretboard. Strings are listed in string order, from the highest-numbered
+string (the low E of a guitar) to string 1. A capo raises every open string
+and frets are then counted from the capo.
+
+Lookup tables are built lazily, once per tuning and capo: fretboard_index
+gives the pitch grid and pitch → (string, fret) index, fingering_search the
+cached chord fingering search. Switching tunings only swaps these objects.
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Tuple
+
+from .fingerings import FingeringSearch, FretboardIndex
+
+DEFAULT_TUNING = "guitar_standard"
+# Frets shown by the fretboard view and indexed by fretboard_index
+FRETBOARD_FRETS = 24
+# Tunings (with capo positions) whose lookup tables are kept
+TABLE_CACHE_SIZE = 32
+
+
+class Tuning(NamedTuple):
+    """Open strings of an instrument, in string order (highest-numbered first)."""
+
+    key: str
+    name: str
+    strings: Tuple[int, ...]
+    string_names: Tuple[str, ...]
+    capo: int = 0
+
+    @property
+    def open_strings(self) -> Tuple[int, ...]:
+        """Sounding MIDI notes of the open strings, capo included."""
+        return tuple(note + self.capo for note in self.strings)
+
+    @property
+    def label(self) -> str:
+        return f"{self.name} (capo {self.capo})" if self.capo else self.name
+
+    def with_capo(self, capo: int) -> "Tuning":
+        """
+        Raises:
+            ValueError: If the capo is negative or above the 12th fret.
+        """
+        if not 0 <= capo <= 12:
+            raise ValueError(f"Capo must be between 0 and 12, got {capo}")
+        return self._replace(capo=capo)
+
+
+def _tuning(key: str, name: str, *strings: Tuple[str, int]) -> Tuning:
+    return Tuning(key, name, tuple(n for _, n in strings), tuple(s for s, _ in strings))
+
+
+TUNINGS: Mapping[str, Tuning] = MappingProxyType(
+    {
+        tuning.key: tuning
+        for tuning in (
+            _tuning(
+                "guitar_standard",
+                "Guitar (Standard)",
+                ("E", 40),
+                ("A", 45),
+                ("D", 50),
+                ("G", 55),
+                ("B", 59),
+                ("e", 64),
+            ),
+            _tuning(
+                "guitar_drop_d",
+                "Guitar (Drop D)",
+                ("D", 38),
+                ("A", 45),
+                ("D", 50),
+                ("G", 55),
+                ("B", 59),
+                ("e", 64),
+            ),
+            _tuning(
+                "guitar_dadgad",
+                "Guitar (DADGAD)",
+                ("D", 38),
+                ("A", 45),
+                ("D", 50),
+                ("G", 55),
+                ("A", 57),
+                ("d", 62),
+            ),
+            _tuning(
+                "guitar_7_string",
+                "7-String Guitar",
+                ("B", 35),
+                ("E", 40),
+                ("A", 45),
+                ("D", 50),
+                ("G", 55),
+                ("B", 59),
+                ("e", 64),
+            ),
+            _tuning(
+                "guitar_8_string",
+                "8-String Guitar",
+                ("F#", 30),
+                ("B", 35),
+                ("E", 40),
+                ("A", 45),
+                ("D", 50),
+                ("G", 55),
+                ("B", 59),
+                ("e", 64),
+            ),
+            _tuning("bass_4", "Bass (4-String)", ("E", 28), ("A", 33), ("D", 38), ("G", 43)),
+            _tuning(
+                "bass_5",
+                "Bass (5-String)",
+                ("B", 23),
+                ("E", 28),
+                ("A", 33),
+                ("D", 38),
+                ("G", 43),
+            ),
+            # Re-entrant: the 4th string is tuned above the 3rd
+            _tuning("ukulele", "Ukulele (GCEA)", ("G", 67), ("C", 60), ("E", 64), ("A", 69)),
+        )
+    }
+)
+
+
+def get_tuning(key: str = DEFAULT_TUNING, capo: int = 0) -> Tuning:
+    """
+    Returns a registered tuning, optionally with a capo.
+
+    Raises:
+        ValueError: If the tuning is unknown or the capo is out of range.
+    """
+    tuning = TUNINGS.get(key)
+    if tuning is None:
+        raise ValueError(f"Unknown tuning '{key}' (known: {', '.join(TUNINGS)}).")
+    return tuning.with_capo(capo) if capo else tuning
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def fretboard_index(tuning: Tuning, max_fret: int = FRETBOARD_FRETS) -> FretboardIndex:
+    """Pitch grid and pitch → (string, fret) index of a tuning, built on first use."""
+    return FretboardIndex(tuning.open_strings, max_fret - tuning.capo)
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def fingering_search(tuning: Tuning) -> FingeringSearch:
+    """The fingering search (and its fingering cache) of a tuning, built on first use."""
+    return FingeringSearch(
+        tuning.open_strings, max_fret=FingeringSearch.DEFAULT_MAX_FRET - tuning.capo
+    )
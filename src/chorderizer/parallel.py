@@ -0,0 +1,235 @@
+"""
+parallel.py — Process-pool batch generation of chord sets
+=========================================================
+generate_parallel fans an iterable of generation requests out over a
+ProcessPoolExecutor and streams the resulting ScaleChordSets back, in request
+order or as soon as each chunk finishes.
+
+Requests are sent in chunks to keep pickling overhead low, and only a bounded
+number of chunks is in flight at a time, so an endless or very large request
+stream never has to fit in memory.
+
+Each worker attaches to the same scales file, cache directory and scale packs as
+the caller's MusicTheory. With the fork start method the workers inherit the
+process-wide theory tables; otherwise they load them from the compiled catalog
+cache that the parent has already written.
+"""
+
+import itertools
+import os
+import weakref
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .chord_set import ScaleChordSet
+from .theory_utils import MusicTheory, MusicTheoryUtils
+
+DEFAULT_CHUNKSIZE = 64
+# Chunks kept in flight per worker while streaming
+PREFETCH_PER_WORKER = 2
+
+
+class GenerationRequest(NamedTuple):
+    """
+    One generate_chord_set call. scale is a catalog key (including pack keys such
+    as "exotic:hijaz") or a scale definition dict.
+    """
+
+    tonic: str
+    scale: Union[str, Mapping[str, Any]]
+    extension_level: int = 2
+    inversion: int = 0
+
+
+# Per-process generator, set up by _init_worker
+_WORKER_GENERATOR = None
+
+# Pool size of each executor built by make_executor, used to size the in-flight window
+_EXECUTOR_WORKERS: "weakref.WeakKeyDictionary[Executor, int]" = weakref.WeakKeyDictionary()
+
+
+def _init_worker(
+    scales_path: str,
+    cache_dir: Optional[str],
+    pack_dirs: Tuple[str, ...],
+    cache_size: int,
+) -> None:
+    global _WORKER_GENERATOR
+    # Imported here: generators imports this module for ChordGenerator.generate_parallel
+    from .generators import ChordGenerator
+
+    theory = MusicTheory(scales_path, cache_dir, pack_dirs)
+    _WORKER_GENERATOR = ChordGenerator(theory, cache_size=cache_size)
+
+
+def _generate_chunk(chunk: List[GenerationRequest]) -> List[ScaleChordSet]:
+    generator = _WORKER_GENERATOR
+    scales = generator.theory.AVAILABLE_SCALES
+    return [
+        generator.generate_chord_set(
+            request.tonic,
+            scales[request.scale] if isinstance(request.scale, str) else request.scale,
+            request.extension_level,
+            request.inversion,
+        )
+        for request in chunk
+    ]
+
+
+def _normalize(theory: MusicTheory, request: Any) -> GenerationRequest:
+    """Turns a request tuple into a picklable GenerationRequest."""
+    request = GenerationRequest(*request)
+    scale = request.scale
+    if not isinstance(scale, str):
+        # Catalog scales travel as their key; custom ones as plain dicts
+        scale = theory.scale_key_of(scale) or MusicTheoryUtils.thaw(scale)
+    return request._replace(scale=scale)
+
+
+def _chunks(
+    theory: MusicTheory, requests: Iterable[Any], chunksize: int
+) -> Iterator[Tuple[int, List[GenerationRequest]]]:
+    """Yields (index of first request, chunk) pairs."""
+    iterator = iter(requests)
+    start = 0
+    while True:
+        chunk = [_normalize(theory, r) for r in itertools.islice(iterator, chunksize)]
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def generate_parallel(
+    requests: Iterable[Any],
+    theory: Optional[MusicTheory] = None,
+    max_workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+    cache_size: int = 256,
+    executor: Optional[Executor] = None,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Generates chord sets for many requests on a process pool.
+
+    Args:
+        requests: GenerationRequest objects or (tonic, scale, extension_level,
+            inversion) tuples; the last two may be omitted.
+        theory: Catalog the workers attach to (default: MusicTheory.shared()).
+        max_workers: Pool size (default: os.cpu_count()).
+        chunksize: Requests sent to a worker at a time.
+        ordered: If True, yields ScaleChordSets in request order. If False, yields
+            (request index, ScaleChordSet) pairs as chunks complete.
+        cache_size: Chord cache size of each worker's ChordGenerator.
+        executor: A pool from make_executor to reuse across calls, instead of
+            starting (and shutting down) a new one.
+        max_in_flight: Chunks submitted but not yet consumed (default:
+            PREFETCH_PER_WORKER per worker of the pool; for executors not made
+            by make_executor, per max_workers or CPU).
+
+    Raises:
+        ValueError: If chunksize or max_in_flight is not positive.
+        KeyError: (while iterating) for an unknown scale key.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be >= 1, got {chunksize}")
+    if max_in_flight is not None and max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+    theory = theory if theory is not None else MusicTheory.shared()
+    return _stream(
+        theory, requests, max_workers, chunksize, ordered, cache_size, executor, max_in_flight
+    )
+
+
+def _stream(
+    theory: MusicTheory,
+    requests: Iterable[Any],
+    max_workers: Optional[int],
+    chunksize: int,
+    ordered: bool,
+    cache_size: int,
+    executor: Optional[Executor],
+    max_in_flight: Optional[int],
+) -> Iterator[Any]:
+    owns_executor = executor is None
+    if executor is None:
+        executor = make_executor(theory, max_workers, cache_size)
+    if max_in_flight is None:
+        workers = _EXECUTOR_WORKERS.get(executor) or max_workers or os.cpu_count() or 1
+        max_in_flight = workers * PREFETCH_PER_WORKER
+
+    try:
+        chunks = _chunks(theory, requests, chunksize)
+        if ordered:
+            yield from _stream_ordered(executor, chunks, max_in_flight)
+        else:
+            yield from _stream_unordered(executor, chunks, max_in_flight)
+    finally:
+        if owns_executor:
+            executor.shutdown(wait=True)
+
+
+def make_executor(
+    theory: Optional[MusicTheory] = None,
+    max_workers: Optional[int] = None,
+    cache_size: int = 256,
+) -> ProcessPoolExecutor:
+    """Creates a process pool whose workers attach to the given theory's catalog."""
+    theory = theory if theory is not None else MusicTheory.shared()
+    workers = max_workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(
+        workers,
+        initializer=_init_worker,
+        initargs=(theory.scales_path, theory.cache_dir, theory.pack_dirs, cache_size),
+    )
+    _EXECUTOR_WORKERS[executor] = workers
+    return executor
+
+
+def _stream_ordered(
+    executor: Executor,
+    chunks: Iterator[Tuple[int, List[GenerationRequest]]],
+    max_in_flight: int,
+) -> Iterator[ScaleChordSet]:
+    pending: Deque[Future] = deque()
+    for _, chunk in chunks:
+        pending.append(executor.submit(_generate_chunk, chunk))
+        if len(pending) >= max_in_flight:
+            yield from pending.popleft().result()
+    for future in pending:
+        yield from future.result()
+
+
+def _stream_unordered(
+    executor: Executor,
+    chunks: Iterator[Tuple[int, List[GenerationRequest]]],
+    max_in_flight: int,
+) -> Iterator[Tuple[int, ScaleChordSet]]:
+    pending: Dict[Future, int] = {}
+
+    def drain() -> Iterator[Tuple[int, ScaleChordSet]]:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            start = pending.pop(future)
+            yield from enumerate(future.result(), start)
+
+    for start, chunk in chunks:
+        pending[executor.submit(_generate_chunk, chunk)] = start
+        if len(pending) >= max_in_flight:
+            yield from drain()
+    while pending:
+        yield from drain()
@@ -0,0 +1,420 @@
+"""
+progressions.py — Generated chord progressions
+==============================================
+MarkovProgression walks a weighted transition matrix over the degrees of a
+scale and yields degrees (or generated chords) lazily, for a fixed length or
+forever. It is seeded, so the same seed always gives the same progression.
+
+Transition matrices are JSON documents:
+
+    {"start": {"I": 1},
+     "transitions": {"I": {"IV": 2, "V": 3, "vi": 1}, "V": {"I": 4, "vi": 1}, ...}}
+
+Degrees are named as in the scale definition ("I", "ii", ...) or by their
+1-based position ("1", "5"), so one matrix can serve every seven-degree scale.
+Without a matrix every degree moves to any other with equal weight. A degree
+without outgoing transitions restarts from the start distribution.
+
+The walk only does a random draw and a bisect per chord over precomputed
+cumulative weight tables, and yields prebuilt chord objects.
+
+ProgressionSearch finds the best progressions of a given length under hard
+constraints (start degree, closing cadence, no repeated chord) and pluggable
+scorers, with a beam search that stops widening once its time budget is spent.
+Start and cadence chords may lie outside the scale, such as the major V of a
+minor mode.
+"""
+
+import heapq
+import json
+import math
+import random
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .chord_set import ScaleChord
+from .theory_utils import MusicTheory
+
+Weights = Mapping[str, float]
+
+# scorer(previous chord or None, chord, position, length) -> score (higher is better)
+Scorer = Callable[[Optional[ScaleChord], ScaleChord, int, int], float]
+
+# A start/end chord: a scale degree (name or 1-based position), a prebuilt chord,
+# or a (degree label, root name, chord type) triple built with ChordGenerator.build_chord
+ChordSpec = Union[str, int, ScaleChord, Tuple[str, str, str]]
+
+
+def _degree_index(degrees: Tuple[str, ...], name: Any) -> int:
+    name = str(name)
+    if name in degrees:
+        return degrees.index(name)
+    if name.isdigit() and 1 <= int(name) <= len(degrees):
+        return int(name) - 1
+    raise ValueError(f"Unknown scale degree '{name}' (degrees: {', '.join(degrees)}).")
+
+
+def _cumulative(
+    degrees: Tuple[str, ...], weights: Weights
+) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    targets: List[int] = []
+    values: List[float] = []
+    for name, weight in weights.items():
+        weight = float(weight)
+        if weight < 0:
+            raise ValueError(f"Negative transition weight {weight} for degree '{name}'.")
+        if weight > 0:
+            targets.append(_degree_index(degrees, name))
+            values.append(weight)
+    return tuple(accumulate(values)), tuple(targets)
+
+
+# -----------------------------------------------------------------------------
+# Class MarkovProgression
+# -----------------------------------------------------------------------------
+class MarkovProgression:
+    """A seeded Markov chain over the degrees of one scale."""
+
+    def __init__(
+        self,
+        scale_info: Mapping[str, Any],
+        transitions: Optional[Mapping[str, Weights]] = None,
+        start: Optional[Weights] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Raises:
+            ValueError: If the scale has no degrees, the matrix names unknown
+                degrees or has negative weights, or the start distribution is empty.
+        """
+        self.scale_info = scale_info
+        self.degrees: Tuple[str, ...] = tuple(scale_info["degrees"])
+        if not self.degrees:
+            raise ValueError("Cannot build a progression over a scale without degrees.")
+        self.seed = seed
+
+        if transitions is None:
+            transitions = {
+                degree: {other: 1 for other in self.degrees if other != degree}
+                for degree in self.degrees
+            }
+        rows: List[Tuple[Tuple[float, ...], Tuple[int, ...]]] = [((), ())] * len(self.degrees)
+        for name, weights in transitions.items():
+            rows[_degree_index(self.degrees, name)] = _cumulative(self.degrees, weights)
+
+        self._start = _cumulative(self.degrees, start if start is not None else {"1": 1})
+        if not self._start[1]:
+            raise ValueError("The start distribution has no positive weight.")
+        # Dead ends restart from the start distribution
+        self._rows = tuple(row if row[1] else self._start for row in rows)
+
+    @classmethod
+    def from_json(
+        cls,
+        source: Union[str, Mapping[str, Any]],
+        scale_info: Mapping[str, Any],
+        seed: Optional[int] = None,
+    ) -> "MarkovProgression":
+        """
+        Builds a progression from a transition matrix document or a path to one.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the file is not valid JSON or the matrix is invalid.
+        """
+        if isinstance(source, str):
+            with open(source, encoding="utf-8") as f:
+                source = json.load(f)
+        if "transitions" not in source:
+            raise ValueError("Transition matrix document has no 'transitions' entry.")
+        return cls(scale_info, source["transitions"], source.get("start"), seed)
+
+    def indices(self, length: Optional[int] = None) -> Iterator[int]:
+        """Yields degree positions (0-based), forever if length is None."""
+        rand = random.Random(self.seed).random  # nosec: S311  # noqa: S311
+        rows = self._rows
+        cum, targets = self._start
+        remaining = length
+        while remaining is None or remaining > 0:
+            state = targets[bisect_right(cum, rand() * cum[-1])]
+            yield state
+            cum, targets = rows[state]
+            if remaining is not None:
+                remaining -= 1
+
+    def degree_names(self, length: Optional[int] = None) -> Iterator[str]:
+        """Yields degree names ("I", "V", ...), forever if length is None."""
+        degrees = self.degrees
+        for index in self.indices(length):
+            yield degrees[index]
+
+    def chords(
+        self,
+        tonic: str,
+        length: Optional[int] = None,
+        extension_level: int = 2,
+        inversion: int = 0,
+        generator=None,
+    ) -> Iterator[ScaleChord]:
+        """
+        Yields the generated chords of the walk in a key, forever if length is None.
+        Degrees whose chord cannot be built are skipped.
+        """
+        if generator is None:
+            # Imported here: generators is the heavier module and only needed for chords
+            from .generators import ChordGenerator
+
+            generator = ChordGenerator(MusicTheory.shared())
+        chord_set = generator.generate_chord_set(tonic, self.scale_info, extension_level, inversion)
+        by_index: Dict[int, ScaleChord] = {
+            i: chord_set[degree] for i, degree in enumerate(self.degrees) if degree in chord_set
+        }
+        for index in self.indices(length):
+            chord = by_index.get(index)
+            if chord is not None:
+                yield chord
+
+
+class ProgressionResult(NamedTuple):
+    """A progression found by ProgressionSearch and its total score."""
+
+    chords: Tuple[ScaleChord, ...]
+    score: float
+
+    @property
+    def degrees(self) -> Tuple[str, ...]:
+        return tuple(chord.degree for chord in self.chords)
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(chord.name for chord in self.chords)
+
+
+def voice_leading_score(
+    previous: Optional[ScaleChord], chord: ScaleChord, position: int, length: int
+) -> float:
+    """
+    Minus the voice-leading distance from the previous chord: for every note, the
+    pitch-class distance (0-6 semitones) to the nearest note of the previous chord.
+    """
+    if previous is None or not previous.midi_notes:
+        return 0.0
+    prev_pcs = {note % 12 for note in previous.midi_notes}
+    motion = 0
+    for note in chord.midi_notes:
+        motion += min(min((note - p) % 12, (p - note) % 12) for p in prev_pcs)
+    return -float(motion)
+
+
+def transition_scorer(transitions: Mapping[str, Weights], missing: float = -10.0) -> Scorer:
+    """
+    Scores each step by the log of its normalized weight in a transition matrix
+    (degree names as in the scale), and steps the matrix lacks with ``missing``.
+    """
+    log_weights: Dict[Tuple[str, str], float] = {}
+    for source, weights in transitions.items():
+        total = sum(float(w) for w in weights.values())
+        for target, weight in weights.items():
+            if float(weight) > 0:
+                log_weights[(source, target)] = math.log(float(weight) / total)
+
+    def score(
+        previous: Optional[ScaleChord], chord: ScaleChord, position: int, length: int
+    ) -> float:
+        if previous is None:
+            return 0.0
+        return log_weights.get((previous.degree, chord.degree), missing)
+
+    return score
+
+
+# -----------------------------------------------------------------------------
+# Class ProgressionSearch
+# -----------------------------------------------------------------------------
+class ProgressionSearch:
+    """
+    Beam search for progressions over the chords ChordGenerator builds for a scale.
+
+    Each step extends the best ``beam_width`` partial progressions by every chord
+    allowed at that position and keeps the best extensions. Once ``time_budget``
+    seconds have passed, every partial progression is finished greedily with its
+    best-scoring next chord, so a search always returns complete progressions.
+    """
+
+    DEFAULT_BEAM_WIDTH: int = 32
+    DEFAULT_TIME_BUDGET: float = 0.1  # seconds
+
+    def __init__(
+        self,
+        generator=None,
+        beam_width: int = DEFAULT_BEAM_WIDTH,
+        time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+        scorers: Optional[Sequence[Tuple[Scorer, float]]] = None,
+    ):
+        """
+        Args:
+            generator: ChordGenerator to build chords with (default: a shared-theory one).
+            beam_width: Partial progressions kept per step.
+            time_budget: Wall-clock seconds before the search narrows to greedy
+                completion (None for no limit).
+            scorers: (scorer, weight) pairs summed per step; defaults to
+                voice_leading_score.
+        """
+        if beam_width < 1:
+            raise ValueError(f"beam_width must be >= 1, got {beam_width}")
+        if generator is None:
+            # Imported here: generators is the heavier module and only needed for chords
+            from .generators import ChordGenerator
+
+            generator = ChordGenerator(MusicTheory.shared())
+        self.generator = generator
+        self.beam_width = beam_width
+        self.time_budget = time_budget
+        self.scorers: Tuple[Tuple[Scorer, float], ...] = tuple(
+            scorers if scorers is not None else ((voice_leading_score, 1.0),)
+        )
+
+    def search(
+        self,
+        tonic: str,
+        scale_info: Mapping[str, Any],
+        length: int,
+        start: Optional[Iterable[ChordSpec]] = None,
+        end: Sequence[ChordSpec] = (),
+        no_repeat: bool = True,
+        extension_level: int = 2,
+        inversion: int = 0,
+        top_n: int = 5,
+    ) -> Tuple[ProgressionResult, ...]:
+        """
+        Returns up to top_n progressions of ``length`` chords, best score first.
+
+        Args:
+            start: Chords allowed as the first chord (see ChordSpec).
+            end: Chords the progression must close with, e.g. ("V", "i"). Only
+                these positions may use chords outside the scale.
+            no_repeat: Forbid the same chord twice in a row.
+
+        Start and end degrees are scale degrees by name or position. A Roman
+        numeral whose case differs from the scale's ("V" in Dorian, whose fifth
+        degree is "v") is that degree's root with the other quality: major
+        (dominant 7th from extension level 2) for upper case, minor for lower.
+
+        Raises:
+            ValueError: If length is shorter than ``end`` or a chord spec is invalid.
+        """
+        if length < len(end):
+            raise ValueError(f"length {length} is shorter than the required ending {end}.")
+        chord_set = self.generator.generate_chord_set(tonic, scale_info, extension_level, inversion)
+        diatonic = tuple(chord_set)
+        if not diatonic or length < 1:
+            return ()
+
+        # Chords from outside the scale are appended after the diatonic ones
+        chords: List[ScaleChord] = list(diatonic)
+
+        def resolve(spec: ChordSpec) -> int:
+            chord = self._chord_from_spec(spec, diatonic, extension_level, inversion)
+            if chord is None:
+                return _degree_index(tuple(c.degree for c in diatonic), spec)
+            if chord in chords:
+                return chords.index(chord)
+            chords.append(chord)
+            return len(chords) - 1
+
+        every = tuple(range(len(diatonic)))
+        allowed: List[Tuple[int, ...]] = [every] * length
+        if start is not None:
+            allowed[0] = tuple(sorted({resolve(spec) for spec in start}))
+        for offset, spec in enumerate(end):
+            position = length - len(end) + offset
+            index = resolve(spec)
+            if position == 0 and start is not None and index not in allowed[0]:
+                allowed[position] = ()
+            else:
+                allowed[position] = (index,)
+
+        # Scores depend only on (previous, chord, position), so memoize each step
+        step_scores: Dict[Tuple[int, int, int], float] = {}
+        scorers = self.scorers
+
+        def step(prev: int, index: int, position: int) -> float:
+            key = (prev, index, position)
+            value = step_scores.get(key)
+            if value is None:
+                previous = chords[prev] if prev >= 0 else None
+                value = sum(
+                    weight * scorer(previous, chords[index], position, length)
+                    for scorer, weight in scorers
+                )
+                step_scores[key] = value
+            return value
+
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        beam: List[Tuple[float, Tuple[int, ...]]] = [(0.0, ())]
+        for position in range(length):
+            greedy = deadline is not None and time.perf_counter() > deadline
+            expansions: List[Tuple[float, Tuple[int, ...]]] = []
+            for score, sequence in beam:
+                prev = sequence[-1] if sequence else -1
+                options = [
+                    (score + step(prev, index, position), sequence + (index,))
+                    for index in allowed[position]
+                    if not (no_repeat and index == prev)
+                ]
+                if greedy and options:
+                    options = [max(options, key=lambda option: option[0])]
+                expansions.extend(options)
+            beam = heapq.nlargest(self.beam_width, expansions, key=lambda option: option[0])
+            if not beam:
+                return ()
+
+        return tuple(
+            ProgressionResult(tuple(chords[i] for i in sequence), score)
+            for score, sequence in beam[:top_n]
+        )
+
+    def _chord_from_spec(
+        self,
+        spec: ChordSpec,
+        diatonic: Tuple[ScaleChord, ...],
+        extension_level: int,
+        inversion: int,
+    ) -> Optional[ScaleChord]:
+        """The chord a start/end spec names, or None for a plain scale degree."""
+        if isinstance(spec, ScaleChord):
+            return spec
+        if isinstance(spec, tuple):
+            label, root_name, chord_type = spec
+            return self.generator.build_chord(label, root_name, chord_type, inversion)
+        name = str(spec)
+        degrees = tuple(chord.degree for chord in diatonic)
+        if name in degrees or name.isdigit():
+            return None
+        # A Roman numeral with the other case than the scale's degree
+        matches = [chord for chord in diatonic if chord.degree.lower() == name.lower()]
+        if not matches or not name.isalpha():
+            return None
+        degree = matches[0]
+        root_name = degree.name[: len(degree.name) - len(degree.suffix)]
+        triads = extension_level == 0
+        if name.isupper():
+            chord_type = "major" if triads else "dom7"
+        else:
+            chord_type = "minor" if triads else "min7"
+        return self.generator.build_chord(name, root_name, chord_type, inversion)
@@ -0,0 +1,142 @@
+"""
+recognition.py — Reverse lookup from MIDI notes to chord names
+===============================================================
+Every CHORD_STRUCTURES entry is expanded once for all 12 roots and every
+possible bass note, then stored in a hash table keyed by its 12-bit
+pitch-class mask plus the bass pitch class. Naming a voicing is therefore a
+mask computation followed by a single dict lookup.
+"""
+
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .theory_utils import MusicTheory, MusicTheoryUtils
+
+
+class ChordCandidate(NamedTuple):
+    """A possible name for a set of notes. Lower scores rank first."""
+
+    name: str
+    root: int  # Pitch class of the chord root (0-11)
+    quality: str  # Key into MusicTheory.CHORD_STRUCTURES
+    bass: int  # Pitch class of the lowest note (0-11)
+    inversion: int  # 0 = root position, 1 = 3rd in bass, 2 = 5th in bass, ...
+    score: int
+
+
+# -----------------------------------------------------------------------------
+# Class ChordRecognizer
+# -----------------------------------------------------------------------------
+class ChordRecognizer:
+    """
+    Names chords from MIDI notes in constant time.
+
+    Candidates sharing a pitch-class set (e.g. C6 / Am7/C) are ranked so that
+    root-position readings come first, followed by the more common quality.
+    """
+
+    # Most common qualities first; used to break ties between enharmonic readings.
+    QUALITY_PREFERENCE: Tuple[str, ...] = (
+        "major",
+        "minor",
+        "dom7",
+        "maj7",
+        "min7",
+        "diminished",
+        "halfdim7",
+        "dim7",
+        "augmented",
+        "sus4",
+        "sus2",
+        "major6",
+        "minor6",
+        "minMaj7",
+        "aug7",
+        "augMaj7",
+        "dom9",
+        "maj9",
+        "min9",
+        "minMaj9",
+        "halfdim9",
+        "dimM9",
+        "dom11",
+        "maj11",
+        "min11",
+        "dom13",
+        "maj13",
+        "min13",
+    )
+
+    INVERSION_PENALTY: int = 100
+
+    def __init__(self, theory: Optional[MusicTheory] = None, use_flats: bool = False):
+        self.theory = theory if theory is not None else MusicTheory.shared()
+        self.use_flats = use_flats
+        self._index: Dict[int, Tuple[ChordCandidate, ...]] = {}
+        self._build_index()
+
+    @staticmethod
+    def _index_key(mask: int, bass_pc: int) -> int:
+        return mask | (bass_pc << 12)
+
+    def _build_index(self) -> None:
+        """Expands every structure for all roots and bass notes into the lookup table."""
+        preference = {quality: rank for rank, quality in enumerate(self.QUALITY_PREFERENCE)}
+        buckets: Dict[int, List[ChordCandidate]] = {}
+
+        for quality, intervals in self.theory.CHORD_STRUCTURES.items():
+            suffix = self.theory.CHORD_SUFFIXES.get(quality, quality)
+            quality_rank = preference.get(quality, len(preference))
+
+            # Chord tones in stacking order (root, 3rd, 5th, 7th, ...), octave-reduced
+            tone_order: List[int] = []
+            for interval in intervals:
+                if interval % 12 not in tone_order:
+                    tone_order.append(interval % 12)
+
+            for root in range(12):
+                root_name = MusicTheoryUtils.get_note_name(root, self.use_flats)
+                mask = MusicTheoryUtils.pitch_classes_to_mask(root + iv for iv in tone_order)
+
+                for inversion, interval in enumerate(tone_order):
+                    bass = (root + interval) % 12
+                    name = root_name + suffix
+                    if inversion:
+                        name += "/" + MusicTheoryUtils.get_note_name(bass, self.use_flats)
+                    score = quality_rank + (self.INVERSION_PENALTY if inversion else 0)
+                    buckets.setdefault(self._index_key(mask, bass), []).append(
+                        ChordCandidate(name, root, quality, bass, inversion, score)
+                    )
+
+        self._index = {
+            key: tuple(sorted(candidates, key=lambda c: (c.score, c.root)))
+            for key, candidates in buckets.items()
+        }
+
+    def recognize_mask(self, mask: int, bass_pc: int) -> Tuple[ChordCandidate, ...]:
+        """Returns ranked candidates for a pitch-class mask with the given bass pitch class."""
+        return self._index.get(mask | ((bass_pc % 12) << 12), ())
+
+    def recognize(self, notes: Iterable[int]) -> Tuple[ChordCandidate, ...]:
+        """Returns ranked candidate names for MIDI notes (empty if nothing matches)."""
+        mask = 0
+        lowest: Optional[int] = None
+        for note in notes:
+            mask |= 1 << (note % 12)
+            if lowest is None or note < lowest:
+                lowest = note
+        if lowest is None:
+            return ()
+        return self._index.get(mask | ((lowest % 12) << 12), ())
+
+    def best(self, notes: Iterable[int]) -> Optional[ChordCandidate]:
+        """Returns the top-ranked candidate for MIDI notes, or None if unrecognized."""
+        candidates = self.recognize(notes)
+        return candidates[0] if candidates else None
+
+    def recognize_many(
+        self, voicings: Iterable[Iterable[int]]
+    ) -> Iterator[Tuple[ChordCandidate, ...]]:
+        """Lazily labels a stream of voicings, one ranked candidate tuple per voicing."""
+        recognize = self.recognize
+        for notes in voicings:
+            yield recognize(notes)
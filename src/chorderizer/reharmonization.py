@@ -0,0 +1,226 @@
+"""
+reharmonization.py — Chord substitutions for diatonic progressions
+==================================================================
+Reharmonizer proposes substitutions for the chords of a key:
+
+    tritone             a dominant chord replaced by the dominant a tritone away
+    secondary_dominant  the dominant of a chord inserted before it (V/ii ii)
+    ii_v                the ii-V of a chord inserted before it (ii/V V/V V)
+    modal_interchange   the chord on the same degree of a parallel scale
+
+The substitutions of every chord of a (tonic, scale, extension, inversion)
+context form a substitution graph that is built once and kept in an LRU cache.
+Reharmonizing a progression is then one dictionary lookup per chord, so long
+progressions take linear time.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .caching import CacheInfo, LRUCache, scale_fingerprint
+from .chord_set import ScaleChord
+from .spelling import parse_note, spell
+from .theory_utils import MusicTheory
+
+KIND_TRITONE = "tritone"
+KIND_SECONDARY_DOMINANT = "secondary_dominant"
+KIND_II_V = "ii_v"
+KIND_MODAL_INTERCHANGE = "modal_interchange"
+KINDS: Tuple[str, ...] = (
+    KIND_TRITONE,
+    KIND_SECONDARY_DOMINANT,
+    KIND_II_V,
+    KIND_MODAL_INTERCHANGE,
+)
+# Kinds that put new chords in front of the target instead of replacing it
+INSERTING_KINDS = frozenset((KIND_SECONDARY_DOMINANT, KIND_II_V))
+
+
+class Substitution(NamedTuple):
+    """Replaces ``target`` by ``chords`` (which end with the target for insertions)."""
+
+    kind: str
+    target: ScaleChord
+    chords: Tuple[ScaleChord, ...]
+
+
+SubstitutionGraph = Mapping[ScaleChord, Tuple[Substitution, ...]]
+
+
+# -----------------------------------------------------------------------------
+# Class Reharmonizer
+# -----------------------------------------------------------------------------
+class Reharmonizer:
+    """Builds, caches and applies substitution graphs for diatonic chord sets."""
+
+    DEFAULT_CACHE_SIZE: int = 64
+    # Parallel scales to borrow from: Major and Natural Minor of the bundled catalog
+    DEFAULT_BORROW_FROM: Tuple[str, ...] = ("1", "2")
+
+    def __init__(
+        self,
+        generator=None,
+        borrow_from: Sequence[str] = DEFAULT_BORROW_FROM,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        if generator is None:
+            # Imported here: generators is the heavier module and only needed for chords
+            from .generators import ChordGenerator
+
+            generator = ChordGenerator(MusicTheory.shared())
+        self.generator = generator
+        self.theory: MusicTheory = generator.theory
+        self.borrow_from = tuple(borrow_from)
+        self._graphs = LRUCache(cache_size)
+
+    def cache_info(self) -> CacheInfo:
+        """Hit/miss/eviction statistics of the substitution graph cache."""
+        return self._graphs.cache_info()
+
+    def substitution_graph(
+        self,
+        tonic: str,
+        scale_info: Mapping[str, Any],
+        extension_level: int = 2,
+        inversion: int = 0,
+    ) -> SubstitutionGraph:
+        """Substitutions of every chord of a key, built on first use and cached."""
+        cache_key = (tonic, scale_fingerprint(scale_info), extension_level, inversion)
+        graph = self._graphs.get(cache_key)
+        if graph is None:
+            graph = self._build_graph(tonic, scale_info, extension_level, inversion)
+            self._graphs.put(cache_key, graph)
+        return graph
+
+    def _build_graph(
+        self,
+        tonic: str,
+        scale_info: Mapping[str, Any],
+        extension_level: int,
+        inversion: int,
+    ) -> SubstitutionGraph:
+        chord_set = self.generator.generate_chord_set(tonic, scale_info, extension_level, inversion)
+        chords = tuple(chord_set)
+        scale_key = self.theory.scale_key_of(scale_info)
+        borrowed_sets = [
+            tuple(
+                self.generator.generate_chord_set(
+                    tonic, self.theory.AVAILABLE_SCALES[key], extension_level, inversion
+                )
+            )
+            for key in self.borrow_from
+            if key != scale_key and key in self.theory.AVAILABLE_SCALES
+        ]
+        triads = extension_level == 0
+
+        graph: Dict[ScaleChord, Tuple[Substitution, ...]] = {}
+        for index, chord in enumerate(chords):
+            parsed = parse_note(chord.name)
+            if parsed is None:
+                graph[chord] = ()
+                continue
+            letter, root_pc = parsed
+            substitutions: List[Substitution] = []
+
+            if chord.chord_type.startswith("dom"):
+                sub = self._relative(letter, root_pc, 4, 6, f"sub{chord.degree}", chord.chord_type)
+                substitutions.append(Substitution(KIND_TRITONE, chord, (sub,)))
+
+            if chord.base_quality in ("major", "minor"):
+                dominant = self._relative(
+                    letter, root_pc, 4, 7, f"V/{chord.degree}", "major" if triads else "dom7"
+                )
+                # The dominant of the tonic is the diatonic V, not a secondary dominant
+                if index > 0:
+                    substitutions.append(
+                        Substitution(KIND_SECONDARY_DOMINANT, chord, (dominant, chord))
+                    )
+                if chord.base_quality == "minor":
+                    ii_type = "diminished" if triads else "halfdim7"
+                else:
+                    ii_type = "minor" if triads else "min7"
+                two = self._relative(letter, root_pc, 1, 2, f"ii/{chord.degree}", ii_type)
+                substitutions.append(Substitution(KIND_II_V, chord, (two, dominant, chord)))
+
+            for borrowed in borrowed_sets:
+                if index < len(borrowed) and len(borrowed) == len(chords):
+                    other = borrowed[index]
+                    if (other.root_pc, other.chord_type) != (chord.root_pc, chord.chord_type):
+                        substitutions.append(Substitution(KIND_MODAL_INTERCHANGE, chord, (other,)))
+
+            graph[chord] = tuple(substitutions)
+        return MappingProxyType(graph)
+
+    def _relative(
+        self, letter: int, root_pc: int, steps: int, semitones: int, degree: str, chord_type: str
+    ) -> ScaleChord:
+        """A chord whose root lies ``steps`` letters / ``semitones`` above a root."""
+        pitch_class = (root_pc + semitones) % 12
+        name = spell(letter + steps, pitch_class, prefer_flats=True)
+        return self.generator.build_chord(degree, name, chord_type)
+
+    def propose(
+        self,
+        progression: Iterable[ScaleChord],
+        tonic: str,
+        scale_info: Mapping[str, Any],
+        extension_level: int = 2,
+        inversion: int = 0,
+    ) -> List[Tuple[Substitution, ...]]:
+        """Substitutions for each chord of a progression (empty for non-diatonic chords)."""
+        graph = self.substitution_graph(tonic, scale_info, extension_level, inversion)
+        return [graph.get(chord, ()) for chord in progression]
+
+    def reharmonize(
+        self,
+        progression: Iterable[ScaleChord],
+        tonic: str,
+        scale_info: Mapping[str, Any],
+        kinds: Sequence[str] = KINDS,
+        extension_level: int = 2,
+        inversion: int = 0,
+    ) -> Tuple[ScaleChord, ...]:
+        """
+        Applies to every chord the first available substitution, trying ``kinds``
+        in order. Chords without one (or outside the key) are kept. Insertions are
+        skipped when the previous chord already is the inserted chord.
+        """
+        return tuple(
+            chord
+            for substitution in self.reharmonize_steps(
+                progression, tonic, scale_info, kinds, extension_level, inversion
+            )
+            for chord in substitution
+        )
+
+    def reharmonize_steps(
+        self,
+        progression: Iterable[ScaleChord],
+        tonic: str,
+        scale_info: Mapping[str, Any],
+        kinds: Sequence[str] = KINDS,
+        extension_level: int = 2,
+        inversion: int = 0,
+    ) -> List[Tuple[ScaleChord, ...]]:
+        """Like reharmonize, but returns the chords replacing each input chord."""
+        graph = self.substitution_graph(tonic, scale_info, extension_level, inversion)
+        priority = {kind: rank for rank, kind in enumerate(kinds)}
+        steps: List[Tuple[ScaleChord, ...]] = []
+        previous: Optional[ScaleChord] = None
+        for chord in progression:
+            replacement: Tuple[ScaleChord, ...] = (chord,)
+            best = len(priority)
+            for substitution in graph.get(chord, ()):
+                rank = priority.get(substitution.kind)
+                if rank is None or rank >= best:
+                    continue
+                if (
+                    substitution.kind in INSERTING_KINDS
+                    and previous is not None
+                    and previous.name == substitution.chords[0].name
+                ):
+                    continue
+                replacement, best = substitution.chords, rank
+            steps.append(replacement)
+            previous = replacement[-1]
+        return steps
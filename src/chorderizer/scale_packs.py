@@ -0,0 +1,178 @@
+"""
+scale_packs.py — Lazily loaded scale packs
+==========================================
+Besides the bundled scales.json, scales can come from pack files: JSON documents
+of the form
+
+    {"pack": {"name": "...", "namespace": "...", "description": "..."},
+     "scales": {"<key>": {<scale definition as in scales.json>}, ...}}
+
+found in the package's data/packs directory and in the user's pack directory.
+Pack scales are addressed as "<namespace>:<key>" (the namespace defaults to the
+file name).
+
+At startup only each pack's manifest (names and pitch-class masks, cached by
+catalog.py) is read. A pack's degree tables are loaded, compiled and cached the
+first time one of its scales is looked up.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Iterator, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .catalog import load_catalog, load_pack_manifest
+
+PACKS_DIR_ENV = "CHORDERIZER_PACKS_DIR"
+PACKAGE_PACKS_DIR = os.path.join(os.path.dirname(__file__), "data", "packs")
+NAMESPACE_SEPARATOR = ":"
+
+
+def user_packs_dir() -> str:
+    """Returns the per-user pack directory (overridable via CHORDERIZER_PACKS_DIR)."""
+    override = os.environ.get(PACKS_DIR_ENV)
+    if override:
+        return override
+    if os.name == "nt":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    return os.path.join(base, "chorderizer", "packs")
+
+
+def default_pack_dirs() -> Tuple[str, ...]:
+    """Package packs first, then user packs (which override same-namespace packs)."""
+    return (PACKAGE_PACKS_DIR, user_packs_dir())
+
+
+class ScalePack(NamedTuple):
+    """Metadata of a registered scale pack. Keys in names/masks are namespaced."""
+
+    namespace: str
+    name: str
+    description: str
+    path: str
+    names: Mapping[str, str]
+    masks: Mapping[str, Tuple[int, ...]]
+
+
+def discover_packs(
+    pack_dirs: Sequence[str], cache_dir: Optional[str] = None
+) -> Tuple[ScalePack, ...]:
+    """
+    Registers every *.json pack in the given directories from its manifest.
+    Unreadable or malformed packs are logged and skipped.
+    """
+    packs: Dict[str, ScalePack] = {}
+    for directory in pack_dirs:
+        if not os.path.isdir(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(".json"):
+                continue
+            path = os.path.join(directory, filename)
+            try:
+                manifest = load_pack_manifest(path, cache_dir)
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                logging.warning(f"Skipping scale pack {path}: {e}")
+                continue
+
+            namespace = manifest["namespace"] or os.path.splitext(filename)[0]
+            if NAMESPACE_SEPARATOR in namespace:
+                logging.warning(f"Skipping scale pack {path}: invalid namespace '{namespace}'")
+                continue
+            if namespace in packs:
+                logging.info(f"Scale pack {path} overrides namespace '{namespace}'")
+
+            prefix = namespace + NAMESPACE_SEPARATOR
+            packs[namespace] = ScalePack(
+                namespace,
+                manifest["name"] or namespace,
+                manifest["description"],
+                path,
+                {prefix + key: name for key, name in manifest["names"].items()},
+                {prefix + key: tuple(masks) for key, masks in manifest["masks"].items()},
+            )
+    return tuple(packs.values())
+
+
+# -----------------------------------------------------------------------------
+# Class ScaleCatalog
+# -----------------------------------------------------------------------------
+class ScaleCatalog(Mapping):
+    """
+    Read-only mapping of scale key -> scale definition over the core catalog and
+    the registered packs. Listing keys and names never loads a pack; looking up a
+    pack scale loads (and keeps) that pack's compiled catalog.
+    """
+
+    def __init__(
+        self,
+        core_scales: Mapping[str, Mapping[str, Any]],
+        packs: Sequence[ScalePack] = (),
+        cache_dir: Optional[str] = None,
+        finalize: Callable[[Dict[str, Any]], Mapping[str, Any]] = lambda catalog: catalog,
+    ):
+        self._core = core_scales
+        self._packs = {pack.namespace: pack for pack in packs}
+        self._cache_dir = cache_dir
+        self._finalize = finalize
+        self._loaded: Dict[str, Mapping[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._names: Dict[str, str] = {key: scale["name"] for key, scale in core_scales.items()}
+        # Scale definitions are immutable and kept alive here, so identity maps them to keys
+        self._keys_by_id: Dict[int, str] = {id(scale): key for key, scale in core_scales.items()}
+        for pack in self._packs.values():
+            self._names.update(pack.names)
+
+    @property
+    def packs(self) -> Tuple[ScalePack, ...]:
+        return tuple(self._packs.values())
+
+    @property
+    def core(self) -> Mapping[str, Mapping[str, Any]]:
+        """The scales of the core catalog (scales.json) only."""
+        return self._core
+
+    def names(self) -> Mapping[str, str]:
+        """Scale key -> display name for every scale, without loading packs."""
+        return self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._names
+
+    def __getitem__(self, key: str) -> Mapping[str, Any]:
+        if key in self._core:
+            return self._core[key]
+        namespace, _, local_key = key.partition(NAMESPACE_SEPARATOR)
+        if key not in self._names:
+            raise KeyError(key)
+        return self.pack_catalog(namespace)["scales"][local_key]
+
+    def key_of(self, scale_info: Mapping[str, Any]) -> Optional[str]:
+        """Key of a scale definition taken from this catalog, or None for other objects."""
+        return self._keys_by_id.get(id(scale_info))
+
+    def is_loaded(self, namespace: str) -> bool:
+        return namespace in self._loaded
+
+    def pack_catalog(self, namespace: str) -> Mapping[str, Any]:
+        """Compiled catalog of a pack (scales, intervals, masks, qualities), loaded once."""
+        catalog = self._loaded.get(namespace)
+        if catalog is None:
+            with self._lock:
+                catalog = self._loaded.get(namespace)
+                if catalog is None:
+                    pack = self._packs[namespace]
+                    catalog = self._finalize(load_catalog(pack.path, self._cache_dir))
+                    prefix = namespace + NAMESPACE_SEPARATOR
+                    for local_key, scale in catalog["scales"].items():
+                        self._keys_by_id[id(scale)] = prefix + local_key
+                    self._loaded[namespace] = catalog
+        return catalog
@@ -0,0 +1,182 @@
+"""
+spelling.py — Table-driven enharmonic spelling
+==============================================
+Spells notes with proper letter names instead of choosing between a sharp and
+a flat name list. A scale degree's letter comes from its roman numeral (degree
+III of an Eb scale is always a G of some kind), and the accidental is read from
+a precomputed (letter, pitch class) table, which includes double accidentals
+(e.g. F## in G# harmonic minor).
+
+Keys whose spelling would need more than MAX_KEY_ACCIDENTALS accidentals are
+spelled from the enharmonic tonic instead (D# major is written as Eb major).
+Spellings are cached per (tonic, scale degrees), so generating chords costs one
+index lookup per note.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .theory_utils import MusicTheoryUtils
+
+LETTERS = "CDEFGAB"
+NATURAL_PCS: Tuple[int, ...] = (0, 2, 4, 5, 7, 9, 11)
+ACCIDENTALS = {-2: "bb", -1: "b", 0: "", 1: "#", 2: "##"}
+
+# SPELLINGS[letter][pitch class] -> name, or None when it would need more than a
+# double accidental
+SPELLINGS: Tuple[Tuple[Optional[str], ...], ...] = tuple(
+    tuple(
+        LETTERS[letter] + ACCIDENTALS[offset] if offset in ACCIDENTALS else None
+        for offset in (((pc - NATURAL_PCS[letter] + 6) % 12) - 6 for pc in range(12))
+    )
+    for letter in range(7)
+)
+
+# A key needing more accidentals than this is respelled from its enharmonic tonic
+MAX_KEY_ACCIDENTALS = 7
+
+# Letter steps above a root for each interval in semitones (a scale-wise default)
+SIMPLE_STEPS: Tuple[int, ...] = (0, 1, 1, 2, 2, 3, 4, 4, 5, 5, 6, 6)
+# Letter steps for extensions: b9/9/#9 are seconds, 11/#11 fourths, b13/13 sixths
+COMPOUND_STEPS = {13: 1, 14: 1, 15: 1, 17: 3, 18: 3, 20: 5, 21: 5}
+
+_NOTE_RE = re.compile(r"^\s*([A-Ga-g])(bb|##|b|#|x)?")
+_ROMAN_RE = re.compile(r"^[b#]*(VII|VI|IV|V|III|II|I)", re.IGNORECASE)
+_ROMAN_VALUES = {"I": 1, "II": 2, "III": 3, "IV": 4, "V": 5, "VI": 6, "VII": 7}
+_ACCIDENTAL_VALUES = {None: 0, "b": -1, "bb": -2, "#": 1, "##": 2, "x": 2}
+
+
+class KeySpelling(NamedTuple):
+    """Letter-name spelling of one scale's degree roots."""
+
+    tonic: str
+    root_letters: Tuple[int, ...]
+    root_names: Tuple[str, ...]
+    accidentals: int
+    prefers_flats: bool
+
+
+def parse_note(name: str) -> Optional[Tuple[int, int]]:
+    """Returns (letter index, pitch class) for a note name such as 'Eb' or 'F##'."""
+    match = _NOTE_RE.match(name or "")
+    if match is None:
+        return None
+    letter = LETTERS.index(match.group(1).upper())
+    return letter, (NATURAL_PCS[letter] + _ACCIDENTAL_VALUES[match.group(2)]) % 12
+
+
+def spell(letter: int, pitch_class: int, prefer_flats: bool = False) -> str:
+    """Spells a pitch class on a letter, falling back to a plain name if impossible."""
+    name = SPELLINGS[letter % 7][pitch_class % 12]
+    if name is None:
+        return MusicTheoryUtils.get_note_name(pitch_class, prefer_flats)
+    return name
+
+
+def degree_letter_offset(degree: str, root_interval: int) -> int:
+    """Letter steps from the tonic to a degree, read from its roman numeral."""
+    match = _ROMAN_RE.match(degree)
+    if match is not None:
+        return _ROMAN_VALUES[match.group(1).upper()] - 1
+    return SIMPLE_STEPS[root_interval % 12]
+
+
+def _accidental_count(name: str) -> int:
+    return len(name) - 1
+
+
+def _spell_from(
+    tonic_letter: int, tonic_pc: int, degrees: Tuple[Tuple[str, int], ...]
+) -> KeySpelling:
+    letters = []
+    names = []
+    for degree, interval in degrees:
+        pitch_class = (tonic_pc + interval) % 12
+        letter = (tonic_letter + degree_letter_offset(degree, interval)) % 7
+        name = SPELLINGS[letter][pitch_class]
+        if name is None:
+            # The numeral does not fit the interval (e.g. "V/V"); use the interval
+            letter = (tonic_letter + SIMPLE_STEPS[interval % 12]) % 7
+            name = SPELLINGS[letter][pitch_class]
+        if name is None:
+            name = MusicTheoryUtils.get_note_name(pitch_class)
+            letter = LETTERS.index(name[0])
+        letters.append(letter)
+        names.append(name)
+    tonic = SPELLINGS[tonic_letter][tonic_pc]
+    flats = sum(name.count("b") for name in names)
+    sharps = sum(name.count("#") for name in names)
+    return KeySpelling(tonic, tuple(letters), tuple(names), flats + sharps, flats > sharps)
+
+
+@lru_cache(maxsize=1024)
+def _key_spelling(tonic_name: str, degrees: Tuple[Tuple[str, int], ...]) -> Optional[KeySpelling]:
+    parsed = parse_note(tonic_name)
+    if parsed is None:
+        return None
+    tonic_letter, tonic_pc = parsed
+
+    spelling = _spell_from(tonic_letter, tonic_pc, degrees)
+    if spelling.accidentals <= MAX_KEY_ACCIDENTALS:
+        return spelling
+
+    # Enharmonic switch: try the neighbouring letters that can carry this tonic
+    for letter in ((tonic_letter + 1) % 7, (tonic_letter - 1) % 7):
+        tonic = SPELLINGS[letter][tonic_pc]
+        if tonic is None or _accidental_count(tonic) > 1:
+            continue
+        alternative = _spell_from(letter, tonic_pc, degrees)
+        if alternative.accidentals < spelling.accidentals:
+            spelling = alternative
+    return spelling
+
+
+def key_spelling(tonic_name: str, scale_info: Mapping[str, Any]) -> Optional[KeySpelling]:
+    """
+    Spells the degree roots of a scale on a tonic, in degree order.
+
+    Returns None if the tonic is not a note name.
+    """
+    degrees = tuple((degree, d["root_interval"]) for degree, d in scale_info["degrees"].items())
+    return _key_spelling(tonic_name, degrees)
+
+
+def key_spelling_for_degrees(
+    tonic_name: str, degrees: Sequence[Tuple[str, int]]
+) -> Optional[KeySpelling]:
+    """key_spelling for (degree, root interval) pairs, e.g. taken from existing chords."""
+    return _key_spelling(tonic_name, tuple(degrees))
+
+
+@lru_cache(maxsize=256)
+def chord_tone_steps(intervals: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Letter steps above the root for each pitch-class interval (0-11) of a chord
+    structure. Augmented fifths read as fifths (#5) and the diminished seventh as
+    a seventh (bb7); other tones follow SIMPLE_STEPS / COMPOUND_STEPS.
+    """
+    steps = list(SIMPLE_STEPS)
+    simple = {i % 12 for i in intervals}
+    for interval in intervals:
+        if interval >= 12 and interval in COMPOUND_STEPS:
+            steps[interval % 12] = COMPOUND_STEPS[interval]
+    if 8 in simple and 4 in simple and 7 not in simple:
+        steps[8] = 4
+    if 9 in simple and 6 in simple and 3 in simple and not simple & {10, 11}:
+        steps[9] = 6
+    return tuple(steps)
+
+
+def spell_chord_tones(
+    root_letter: int,
+    root_pc: int,
+    intervals: Tuple[int, ...],
+    midi_notes: Sequence[int],
+    prefer_flats: bool = False,
+) -> Tuple[str, ...]:
+    """Spells the notes of a chord relative to its (already spelled) root."""
+    steps = chord_tone_steps(intervals)
+    return tuple(
+        spell(root_letter + steps[(note - root_pc) % 12], note, prefer_flats) for note in midi_notes
+    )
@@ -1,10 +1,65 @@
-import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Tuple
+import re
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from colorama import Fore, Style
 
+from .catalog import compile_scales, load_catalog
+from .scale_packs import NAMESPACE_SEPARATOR, ScaleCatalog, default_pack_dirs, discover_packs
+
+# Flat spelling of every pitch class (sharps live in MusicTheory.CHROMATIC_NOTES)
+_FLAT_NOTE_NAMES: Tuple[str, ...] = (
+    "C",
+    "Db",
+    "D",
+    "Eb",
+    "E",
+    "F",
+    "Gb",
+    "G",
+    "Ab",
+    "A",
+    "Bb",
+    "B",
+)
+
+# Note names: a letter followed by accidentals ("x" is a double sharp). An upper-case
+# "B" counts as a flat unless a lower-case suffix follows, so "DB" and "BBM" still work.
+_NOTE_PREFIX_RE = re.compile(r"^\s*([A-Ga-g])((?:bb|##|[#bx\u266f\u266d]|B(?![a-z]))*)")
+_NATURAL_PITCH_CLASSES = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+_ACCIDENTAL_OFFSETS = {
+    "#": 1,
+    "\u266f": 1,
+    "##": 2,
+    "x": 2,
+    "b": -1,
+    "B": -1,
+    "\u266d": -1,
+    "bb": -2,
+}
+
+# Number of set bits for every 12-bit pitch-class mask
+_MASK_POPCOUNT: Tuple[int, ...] = tuple(bin(mask).count("1") for mask in range(4096))
+
+# Process-wide registry of read-only theory tables, keyed by (scales_path, cache_dir,
+# pack_dirs). Built lazily on first use; forked workers inherit it copy-on-write.
+_SHARED_TABLES: Dict[Tuple[str, Optional[str], Tuple[str, ...]], Tuple[Any, ...]] = {}
+_SHARED_LOCK = threading.RLock()
+
 
 # -----------------------------------------------------------------------------
 # Class MusicTheoryUtils: Utility functions for music theory
@@ -13,76 +68,77 @@ class MusicTheoryUtils:
     @staticmethod
     def get_note_name(note_index: int, use_flats: bool = False) -> str:
         if use_flats:
-            flat_names = [
-                "C",
-                "Db",
-                "D",
-                "Eb",
-                "E",
-                "F",
-                "Gb",
-                "G",
-                "Ab",
-                "A",
-                "Bb",
-                "B",
-            ]
-            return flat_names[note_index % 12]
+            return _FLAT_NOTE_NAMES[note_index % 12]
         return MusicTheory.CHROMATIC_NOTES[note_index % 12]
 
     @staticmethod
     def should_use_flats(tonic_str: str) -> bool:
-        """Heuristic to determine if a scale/key should conventionally use flats."""
-        tonic_upper = tonic_str.upper()
-        # Explicit flat in name ('b') or known flat keys (F is the classic one)
-        # We check for 'b' in lowercase string.
-        if "b" in tonic_str.lower():
+        """
+        Whether a key written from this tonic name uses flats: flat tonics and F do.
+        Only the accidental right after the letter counts, so 'B' and 'F#' use sharps.
+        """
+        if not tonic_str:
+            return False
+        accidental = tonic_str[1:2]
+        if accidental == "b":
             return True
-        # Check start of the string for keys that use flats but don't have 'b' in name (F Major)
-        for flat_key in ["F", "BB", "EB", "AB", "DB", "GB"]:
-            if tonic_upper.startswith(flat_key):
-                return True
-        return False
-
-    # Pre-calculated cache for get_note_index to improve performance
-    _NOTE_INDEX_CACHE: Dict[str, int] = {}
+        if accidental == "#":
+            return False
+        return tonic_str[0].upper() == "F"
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def get_note_index(note_name: str) -> int:
-        base_note = note_name.upper()
-
-        # Check cache first for common notes
-        if base_note in MusicTheoryUtils._NOTE_INDEX_CACHE:
-            return MusicTheoryUtils._NOTE_INDEX_CACHE[base_note]
-
-        flat_to_sharp_equivalents = {
-            "DB": "C#",
-            "EB": "D#",
-            "FB": "E",
-            "GB": "F#",
-            "AB": "G#",
-            "BB": "A#",
-            "CB": "B",
-        }
-        for flat, sharp in flat_to_sharp_equivalents.items():
-            if base_note.startswith(flat):
-                base_note = sharp + base_note[len(flat) :]
-                break
-        root_note_str = ""
-        for char_note in base_note:
-            if char_note.isalpha() or char_note == "#":
-                root_note_str += char_note
-            else:
-                break
-        try:
-            res = MusicTheory.CHROMATIC_NOTES.index(root_note_str)
-            # Cache the result for future calls
-            MusicTheoryUtils._NOTE_INDEX_CACHE[note_name.upper()] = res
-            return res
-        except ValueError as err:
+        """
+        Pitch class of the note a name starts with: a letter plus any accidentals,
+        so 'Db', 'C#m7' and 'Cm' resolve to their root. Results are memoized.
+        """
+        match = _NOTE_PREFIX_RE.match(note_name)
+        if match is None:
             raise ValueError(
-                f"Base note '{root_note_str}' from '{note_name}' not recognized."
-            ) from err
+                f"Base note '{note_name.strip()[:1]}' from '{note_name}' not recognized."
+            )
+        letter, accidentals = match.groups()
+        offset = sum(_ACCIDENTAL_OFFSETS[a] for a in accidentals)
+        return (_NATURAL_PITCH_CLASSES[letter.upper()] + offset) % 12
+
+    @staticmethod
+    def pitch_classes_to_mask(pitches: Iterable[int]) -> int:
+        """Packs pitches (MIDI notes or pitch classes) into a 12-bit pitch-class mask."""
+        mask = 0
+        for pitch in pitches:
+            mask |= 1 << (pitch % 12)
+        return mask
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def mask_to_pitch_classes(mask: int) -> FrozenSet[int]:
+        """Unpacks a 12-bit pitch-class mask (memoized, so repeated masks are a table read)."""
+        return frozenset(pc for pc in range(12) if mask >> pc & 1)
+
+    @staticmethod
+    def rotate_mask(mask: int, semitones: int) -> int:
+        """Transposes a 12-bit pitch-class mask upwards by the given number of semitones."""
+        semitones %= 12
+        return ((mask << semitones) | (mask >> (12 - semitones))) & 0xFFF
+
+    @staticmethod
+    def freeze(value: Any) -> Any:
+        """Recursively converts dicts to read-only mappings and lists to tuples."""
+        if isinstance(value, Mapping):
+            return MappingProxyType({k: MusicTheoryUtils.freeze(v) for k, v in value.items()})
+        if isinstance(value, (list, tuple)):
+            return tuple(MusicTheoryUtils.freeze(v) for v in value)
+        return value
+
+    @staticmethod
+    def thaw(value: Any) -> Any:
+        """Inverse of freeze: returns plain (picklable, JSON-friendly) dicts and lists."""
+        if isinstance(value, Mapping):
+            return {k: MusicTheoryUtils.thaw(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [MusicTheoryUtils.thaw(v) for v in value]
+        return value
 
     @staticmethod
     def split_chord_name(chord_name: str) -> Tuple[str, str]:
@@ -115,6 +171,8 @@ class MusicTheoryUtils:
             return None
 
         transposition_interval = new_tonic_idx - original_tonic_idx
+        # Spelling depends only on the new tonic, so decide it once
+        use_flats = MusicTheoryUtils.should_use_flats(new_scale_tonic_str)
         transposed_chords_dict = {}
 
         for degree, original_chord_name in original_chords_dict.items():
@@ -128,42 +186,222 @@ class MusicTheoryUtils:
                 continue
 
             new_root_idx = (original_root_idx + transposition_interval) % 12
-            # Determine whether to use flats based on the new tonic
-            use_flats = MusicTheoryUtils.should_use_flats(new_scale_tonic_str)
-
             new_root_name = MusicTheoryUtils.get_note_name(new_root_idx, use_flats)
             transposed_chords_dict[degree] = new_root_name + suffix
 
         return transposed_chords_dict
 
 
+class ScaleMatch(NamedTuple):
+    """A scale/tonic combination returned by MusicTheory.find_scales."""
+
+    scale_key: str
+    tonic: int  # Pitch class of the scale tonic (0-11)
+    name: str
+    extra_notes: int  # Notes on one side of the comparison that the other lacks
+
+
 # -----------------------------------------------------------------------------
 # Class MusicTheory: Constants and basic music theory definitions
 # -----------------------------------------------------------------------------
 class MusicTheory:
-    def __init__(self):
-        self.AVAILABLE_SCALES = {}
-        self._load_scales()
+    # Scale finder comparison modes
+    FIND_CONTAINS = "contains"  # Scales that contain every queried note
+    FIND_WITHIN = "within"  # Scales whose notes are all among the queried notes
+
+    DEFAULT_SCALES_PATH = os.path.join(os.path.dirname(__file__), "data", "scales.json")
+
+    _shared_instance: Optional["MusicTheory"] = None
+
+    def __init__(
+        self,
+        scales_path: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        pack_dirs: Optional[Sequence[str]] = None,
+    ):
+        """
+        Attaches to the read-only tables for a scales file, loading them on first use.
+
+        Instances built for the same scales file share one set of tables, so
+        constructing a MusicTheory is cheap after the first time. Prefer
+        MusicTheory.shared() for the bundled catalog.
+
+        Scale packs are registered from pack_dirs (by default the package and user
+        pack directories, or none when a custom scales_path is given). Only their
+        manifests are read here; see scale_packs.py.
+        """
+        self.scales_path = os.path.abspath(scales_path or self.DEFAULT_SCALES_PATH)
+        self.cache_dir = cache_dir
+        if pack_dirs is None:
+            pack_dirs = default_pack_dirs() if scales_path is None else ()
+        self.pack_dirs = tuple(os.path.abspath(d) for d in pack_dirs)
+        registry_key = (self.scales_path, cache_dir, self.pack_dirs)
+
+        tables = _SHARED_TABLES.get(registry_key)
+        if tables is None:
+            with _SHARED_LOCK:
+                tables = _SHARED_TABLES.get(registry_key)
+                if tables is None:
+                    self._load_scales()
+                    self._register_packs()
+                    self._build_scale_index()
+                    tables = (
+                        self._catalog,
+                        self.AVAILABLE_SCALES,
+                        self._scale_masks,
+                        self._scale_table,
+                    )
+                    _SHARED_TABLES[registry_key] = tables
+
+        self._catalog, self.AVAILABLE_SCALES, self._scale_masks, self._scale_table = tables
+        self._find_cache: Dict[Tuple[int, str], Tuple[ScaleMatch, ...]] = {}
+
+    @classmethod
+    def shared(cls) -> "MusicTheory":
+        """Returns the process-wide MusicTheory for the bundled scale catalog."""
+        if cls._shared_instance is None:
+            with _SHARED_LOCK:
+                if cls._shared_instance is None:
+                    cls._shared_instance = cls()
+        return cls._shared_instance
 
     def note_to_midi(self, note_name: str) -> int:
         """Converts a note name (e.g., 'C#') to its 0-11 pitch class index."""
         return MusicTheoryUtils.get_note_index(note_name)
 
+    def _register_packs(self) -> None:
+        """Wraps the core scales and the packs found in pack_dirs in a lazy ScaleCatalog."""
+        self.AVAILABLE_SCALES = ScaleCatalog(
+            self._catalog["scales"],
+            discover_packs(self.pack_dirs, self.cache_dir),
+            self.cache_dir,
+            MusicTheoryUtils.freeze,
+        )
+
+    def _build_scale_index(self) -> None:
+        """Precomputes pitch-class masks for every scale x tonic combination."""
+        # Pack masks come from the manifests, so the finder never loads a pack
+        masks = dict(self._catalog["masks"])
+        for pack in self.AVAILABLE_SCALES.packs:
+            masks.update(pack.masks)
+        self._scale_masks: Mapping[str, Tuple[int, ...]] = MappingProxyType(masks)
+
+        # Flat (mask, scale_key, tonic) table scanned by the scale finder
+        self._scale_table: Tuple[Tuple[int, str, int], ...] = tuple(
+            (mask, scale_key, tonic)
+            for scale_key, masks in self._scale_masks.items()
+            for tonic, mask in enumerate(masks)
+        )
+
+    def scale_mask(self, scale_key: str, tonic_pc: int) -> int:
+        """Returns the 12-bit pitch-class mask of a scale built on the given tonic."""
+        return self._scale_masks[scale_key][tonic_pc % 12]
+
+    def scale_pitch_classes(self, scale_key: str, tonic_pc: int) -> FrozenSet[int]:
+        """Returns the pitch classes (0-11) of a scale built on the given tonic."""
+        return MusicTheoryUtils.mask_to_pitch_classes(self._scale_masks[scale_key][tonic_pc % 12])
+
+    def is_pitch_in_scale(self, pitch: int, scale_key: str, tonic_pc: int) -> bool:
+        """Checks whether a MIDI note or pitch class belongs to the scale."""
+        return bool(self._scale_masks[scale_key][tonic_pc % 12] >> (pitch % 12) & 1)
+
+    def scale_intersection(
+        self, scale_key_a: str, tonic_a: int, scale_key_b: str, tonic_b: int
+    ) -> FrozenSet[int]:
+        """Returns the pitch classes shared by two scale/tonic combinations."""
+        mask = (
+            self._scale_masks[scale_key_a][tonic_a % 12]
+            & self._scale_masks[scale_key_b][tonic_b % 12]
+        )
+        return MusicTheoryUtils.mask_to_pitch_classes(mask)
+
+    def find_scales(
+        self,
+        notes: Iterable[int],
+        mode: str = FIND_CONTAINS,
+        tonic_pc: Optional[int] = None,
+    ) -> Tuple[ScaleMatch, ...]:
+        """
+        Finds every scale/tonic combination matching a set of notes.
+
+        Args:
+            notes: MIDI notes or pitch classes.
+            mode: FIND_CONTAINS for scales containing all notes (ranked by how many
+                extra notes the scale adds), FIND_WITHIN for scales made only of the
+                given notes (ranked by how many notes the scale leaves out).
+            tonic_pc: Optionally restrict results to a single tonic.
+
+        Returns:
+            Matches sorted by extra-note count, then catalog order.
+        """
+        if mode not in (self.FIND_CONTAINS, self.FIND_WITHIN):
+            raise ValueError(f"Unknown scale finder mode '{mode}'.")
+
+        query = MusicTheoryUtils.pitch_classes_to_mask(notes)
+        cache_key = (query, mode)
+        matches = self._find_cache.get(cache_key)
+        if matches is None:
+            found = []
+            for mask, scale_key, tonic in self._scale_table:
+                if mode == self.FIND_CONTAINS:
+                    if query & ~mask:
+                        continue
+                    extra = _MASK_POPCOUNT[mask & ~query]
+                else:
+                    if mask & ~query:
+                        continue
+                    extra = _MASK_POPCOUNT[query & ~mask]
+                found.append((extra, len(found), scale_key, tonic))
+            found.sort()
+            names = self.AVAILABLE_SCALES.names()
+            matches = tuple(
+                ScaleMatch(scale_key, tonic, names[scale_key], extra)
+                for extra, _, scale_key, tonic in found
+            )
+            self._find_cache[cache_key] = matches
+
+        if tonic_pc is None:
+            return matches
+        tonic_pc %= 12
+        return tuple(match for match in matches if match.tonic == tonic_pc)
+
+    def scale_degree_table(self, scale_key: str) -> Tuple[Tuple[str, int, str, str, str], ...]:
+        """Returns (degree, root_interval, base_quality, full_quality, display_suffix) rows."""
+        qualities = self._catalog["qualities"]
+        if scale_key in qualities:
+            return qualities[scale_key]
+        namespace, _, local_key = scale_key.partition(NAMESPACE_SEPARATOR)
+        return self.AVAILABLE_SCALES.pack_catalog(namespace)["qualities"][local_key]
+
+    @property
+    def core_scales(self) -> Mapping[str, Mapping[str, Any]]:
+        """The scales of the core catalog (the scales file), without pack scales."""
+        return self._catalog["scales"]
+
+    def scale_names(self) -> Mapping[str, str]:
+        """Scale key -> display name for every scale, core and packs, loading no pack."""
+        return self.AVAILABLE_SCALES.names()
+
+    def scale_key_of(self, scale_info: Mapping[str, Any]) -> Optional[str]:
+        """Catalog key of a scale definition taken from AVAILABLE_SCALES, else None."""
+        return self.AVAILABLE_SCALES.key_of(scale_info)
+
     def _load_scales(self):
-        """Loads scale definitions from a JSON file."""
-        data_path = os.path.join(os.path.dirname(__file__), "data", "scales.json")
+        """Loads scale definitions and their derived tables from the compiled catalog."""
+        data_path = self.scales_path
         try:
             if os.path.exists(data_path):
-                with open(data_path, encoding="utf-8") as f:
-                    self.AVAILABLE_SCALES = json.load(f)
+                self._catalog = load_catalog(data_path, self.cache_dir)
             else:
                 logging.warning(
                     f"Scales data file not found at {data_path}. Using internal defaults."
                 )
-                self.AVAILABLE_SCALES = self._get_default_scales()
+                self._catalog = compile_scales(self._get_default_scales())
         except Exception as e:
             logging.error(f"Error loading scales from JSON: {e}")
-            self.AVAILABLE_SCALES = self._get_default_scales()
+            self._catalog = compile_scales(self._get_default_scales())
+        self._catalog = MusicTheoryUtils.freeze(self._catalog)
+        self.AVAILABLE_SCALES = self._catalog["scales"]
 
     def _get_default_scales(self) -> Dict[str, Any]:
         """Provides a fallback set of scales if the JSON file cannot be loaded."""
@@ -219,7 +457,7 @@ class MusicTheory:
             }
         }
 
-    CHROMATIC_NOTES: List[str] = [
+    CHROMATIC_NOTES: Tuple[str, ...] = (
         "C",
         "C#",
         "D",
@@ -232,37 +470,39 @@ class MusicTheory:
         "A",
         "A#",
         "B",
-    ]
+    )
     MIDI_BASE_OCTAVE: int = 60  # C4
 
-    INTERVALS: Dict[str, int] = {
-        "R": 0,
-        "m2": 1,
-        "M2": 2,
-        "m3": 3,
-        "M3": 4,
-        "P4": 5,
-        "A4": 6,
-        "TRITONE": 6,
-        "d5": 6,
-        "P5": 7,
-        "A5": 8,
-        "m6": 8,
-        "M6": 9,
-        "d7": 9,
-        "m7": 10,
-        "M7": 11,
-        "P8": 12,
-        "m9": 13,
-        "M9": 14,
-        "A9": 15,
-        "P11": 17,
-        "A11": 18,
-        "m13": 20,
-        "M13": 21,
-    }
+    INTERVALS: Mapping[str, int] = MappingProxyType(
+        {
+            "R": 0,
+            "m2": 1,
+            "M2": 2,
+            "m3": 3,
+            "M3": 4,
+            "P4": 5,
+            "A4": 6,
+            "TRITONE": 6,
+            "d5": 6,
+            "P5": 7,
+            "A5": 8,
+            "m6": 8,
+            "M6": 9,
+            "d7": 9,
+            "m7": 10,
+            "M7": 11,
+            "P8": 12,
+            "m9": 13,
+            "M9": 14,
+            "A9": 15,
+            "P11": 17,
+            "A11": 18,
+            "m13": 20,
+            "M13": 21,
+        }
+    )
 
-    CHORD_STRUCTURES: Dict[str, List[int]] = {
+    CHORD_STRUCTURES: Mapping[str, Tuple[int, ...]] = {
         "major": [INTERVALS["R"], INTERVALS["M3"], INTERVALS["P5"]],
         "minor": [INTERVALS["R"], INTERVALS["m3"], INTERVALS["P5"]],
         "diminished": [INTERVALS["R"], INTERVALS["m3"], INTERVALS["d5"]],
@@ -376,61 +616,100 @@ class MusicTheory:
         ],
     }
 
-    AVAILABLE_SCALES: Dict[str, Dict[str, Any]] = {}
-
-    MIDI_PROGRAMS: Dict[int, str] = {
-        0: "Acoustic Grand Piano",
-        1: "Bright Acoustic Piano",
-        2: "Electric Grand Piano",
-        3: "Honky-tonk Piano",
-        4: "Electric Piano 1 (Rhodes)",
-        5: "Electric Piano 2 (Chorused)",
-        6: "Harpsichord",
-        7: "Clavinet",
-        8: "Celesta",
-        9: "Glockenspiel",
-        10: "Music Box",
-        11: "Vibraphone",
-        12: "Marimba",
-        13: "Xylophone",
-        16: "Drawbar Organ",
-        17: "Percussive Organ",
-        19: "Church Organ",
-        24: "Acoustic Guitar (nylon)",
-        25: "Acoustic Guitar (steel)",
-        26: "Electric Guitar (jazz)",
-        27: "Electric Guitar (clean)",
-        28: "Electric Guitar (muted)",
-        29: "Overdriven Guitar",
-        30: "Distortion Guitar",
-        32: "Acoustic Bass",
-        33: "Electric Bass (finger)",
-        34: "Electric Bass (pick)",
-        35: "Fretless Bass",
-        36: "Slap Bass 1",
-        37: "Slap Bass 2",
-        38: "Synth Bass 1",
-        39: "Synth Bass 2",
-        40: "Violin",
-        41: "Viola",
-        42: "Cello",
-        43: "Contrabass",
-        48: "String Ensemble 1",
-        49: "String Ensemble 2",
-        52: "Choir Aahs",
-        53: "Voice Oohs",
-        54: "Synth Voice",
-        56: "Trumpet",
-        57: "Trombone",
-        60: "French Horn",
-        64: "Soprano Sax",
-        65: "Alto Sax",
-        66: "Tenor Sax",
-        67: "Baritone Sax",
-        71: "Clarinet",
-        73: "Flute",
-        80: "Synth Lead 1 (square)",
-        81: "Synth Lead 2 (sawtooth)",
-        88: "Synth Pad 1 (new age)",
-        90: "Synth Pad 3 (polysynth)",
-    }
+    # Interval lists are exposed as tuples so the shared table cannot be mutated
+    CHORD_STRUCTURES = MappingProxyType({q: tuple(iv) for q, iv in CHORD_STRUCTURES.items()})
+
+    # Display suffix used when naming a chord of each CHORD_STRUCTURES quality
+    CHORD_SUFFIXES: Mapping[str, str] = MappingProxyType(
+        {
+            "major": "",
+            "minor": "m",
+            "diminished": "dim",
+            "augmented": "aug",
+            "sus4": "sus4",
+            "sus2": "sus2",
+            "major6": "6",
+            "minor6": "m6",
+            "dom7": "7",
+            "maj7": "maj7",
+            "min7": "m7",
+            "minMaj7": "m(maj7)",
+            "dim7": "dim7",
+            "halfdim7": "m7b5",
+            "aug7": "aug7",
+            "augMaj7": "aug(maj7)",
+            "dom9": "9",
+            "maj9": "maj9",
+            "min9": "m9",
+            "minMaj9": "m(maj9)",
+            "halfdim9": "m9b5",
+            "dimM9": "dim(maj9)",
+            "dom11": "11",
+            "maj11": "maj11",
+            "min11": "m11",
+            "dom13": "13",
+            "maj13": "maj13",
+            "min13": "m13",
+        }
+    )
+
+    AVAILABLE_SCALES: Mapping[str, Mapping[str, Any]] = MappingProxyType({})
+
+    MIDI_PROGRAMS: Mapping[int, str] = MappingProxyType(
+        {
+            0: "Acoustic Grand Piano",
+            1: "Bright Acoustic Piano",
+            2: "Electric Grand Piano",
+            3: "Honky-tonk Piano",
+            4: "Electric Piano 1 (Rhodes)",
+            5: "Electric Piano 2 (Chorused)",
+            6: "Harpsichord",
+            7: "Clavinet",
+            8: "Celesta",
+            9: "Glockenspiel",
+            10: "Music Box",
+            11: "Vibraphone",
+            12: "Marimba",
+            13: "Xylophone",
+            16: "Drawbar Organ",
+            17: "Percussive Organ",
+            19: "Church Organ",
+            24: "Acoustic Guitar (nylon)",
+            25: "Acoustic Guitar (steel)",
+            26: "Electric Guitar (jazz)",
+            27: "Electric Guitar (clean)",
+            28: "Electric Guitar (muted)",
+            29: "Overdriven Guitar",
+            30: "Distortion Guitar",
+            32: "Acoustic Bass",
+            33: "Electric Bass (finger)",
+            34: "Electric Bass (pick)",
+            35: "Fretless Bass",
+            36: "Slap Bass 1",
+            37: "Slap Bass 2",
+            38: "Synth Bass 1",
+            39: "Synth Bass 2",
+            40: "Violin",
+            41: "Viola",
+            42: "Cello",
+            43: "Contrabass",
+            48: "String Ensemble 1",
+            49: "String Ensemble 2",
+            52: "Choir Aahs",
+            53: "Voice Oohs",
+            54: "Synth Voice",
+            56: "Trumpet",
+            57: "Trombone",
+            60: "French Horn",
+            64: "Soprano Sax",
+            65: "Alto Sax",
+            66: "Tenor Sax",
+            67: "Baritone Sax",
+            71: "Clarinet",
+            73: "Flute",
+            80: "Synth Lead 1 (square)",
+            81: "Synth Lead 2 (sawtooth)",
+            88: "Synth Pad 1 (new age)",
+            90: "Synth Pad 3 (polysynth)",
+        }
+    )
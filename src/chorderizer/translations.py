@@ -22,6 +22,12 @@ class Translations:
             "status_scale_loaded": "Scale [bold cyan]{tonic} {scale_name}[/] loaded.",
             "status_chord_added": "Chord [bold cyan]{name}[/] added.",
             "status_list_reset": "Progression list reset.",
+            "status_reharmonized": "Progression reharmonized: [bold cyan]{names}[/]",
+            "status_reharm_empty": "Add chords to the progression before reharmonizing.",
+            "status_tuning": "Tuning: [bold cyan]{name}[/]",
+            "status_prog_tab": "Progression tab: [bold cyan]{count}[/] chords, fingered for minimal hand movement.",
+            "status_prog_tab_empty": "Add chords to the progression to see its tab sheet.",
+            "prog_tab_title": "Progression · {name}",
             "status_exported": "Exported: [bold green]{filename}[/]\nPath: [dim]{path}[/]",
             "status_export_failed": "[red]Export failed: {error}[/red]",
             "notify_exported": "MIDI Exported",
@@ -57,6 +63,9 @@ class Translations:
             "manual_phase_4": "4. [bold]EXPORT:[/] Press [bold][E][/bold] to save MIDI",
             "manual_add": "• [white][A][/white] Add chord to progression (Right Sidebar).",
             "manual_clear": "• [white][X][/white] Clear progression list.",
+            "manual_reharm": "• [white][R][/white] Reharmonize the progression (substitutions).",
+            "manual_tuning": "• [white][T][/white] Cycle instrument tuning (fretboard and tabs).",
+            "manual_prog_tab": "• [white][P][/white] Tab sheet of the progression (minimal hand movement).",
             "manual_export": "• [white][E][/white] Export current composition to MIDI.",
             "manual_jam": "[bold cyan]JAM MODE (PRACTICE)[/bold cyan]",
             "manual_jam_desc": "• [bold green][J][/bold green] Toggle Jam Mode: Horizontal practice focus.\n• [bold green][S][/bold green] Toggle Submode: Dots vs Musical Degrees.\n• [bold green]MOODS:[/] Expert presets that filter scales by emotion.",
@@ -82,6 +91,8 @@ class Translations:
             "inv_2nd": "2nd",
             "inv_3rd": "3rd",
             "moods": "MOODS",
+            "jam_notes_placeholder": "Filter by notes (e.g. C E G)",
+            "status_scales_found": "{count} scale(s) contain [bold cyan]{notes}[/]",
             # Legacy UI
             "legacy_welcome": "♩  C H O R D E R I Z E R  ♩",
             "legacy_sub": "Advanced Chord Generator",
@@ -120,6 +131,12 @@ class Translations:
             "status_scale_loaded": "Escala [bold cyan]{tonic} {scale_name}[/] cargada.",
             "status_chord_added": "Acorde [bold cyan]{name}[/] añadido.",
             "status_list_reset": "Lista de progresión reiniciada.",
+            "status_reharmonized": "Progresión rearmonizada: [bold cyan]{names}[/]",
+            "status_reharm_empty": "Añade acordes a la progresión antes de rearmonizar.",
+            "status_tuning": "Afinación: [bold cyan]{name}[/]",
+            "status_prog_tab": "Tablatura de la progresión: [bold cyan]{count}[/] acordes, digitados con el mínimo movimiento de mano.",
+            "status_prog_tab_empty": "Añade acordes a la progresión para ver su tablatura.",
+            "prog_tab_title": "Progresión · {name}",
             "status_exported": "Exportado: [bold green]{filename}[/]\nRuta: [dim]{path}[/]",
             "status_export_failed": "[red]Error al exportar: {error}[/red]",
             "notify_exported": "MIDI Exportado",
@@ -155,6 +172,9 @@ class Translations:
             "manual_phase_4": "4. [bold]EXPORTAR:[/] Pulse [bold][E][/bold] para MIDI",
             "manual_add": "• [white][A][/white] Añadir acorde a la progresión (Barra lateral).",
             "manual_clear": "• [white][X][/white] Limpiar lista de progresión.",
+            "manual_reharm": "• [white][R][/white] Rearmonizar la progresión (sustituciones).",
+            "manual_tuning": "• [white][T][/white] Cambiar la afinación del instrumento (diapasón y tablaturas).",
+            "manual_prog_tab": "• [white][P][/white] Tablatura de la progresión (mínimo movimiento de mano).",
             "manual_export": "• [white][E][/white] Exportar composición actual a MIDI.",
             "manual_jam": "[bold cyan]MODO JAM (PRÁCTICA)[/bold cyan]",
             "manual_jam_desc": "• [bold green][J][/bold green] Alternar Jam: Enfoque horizontal de práctica.\n• [bold green][S][/bold green] Alternar Submodo: Puntos vs Grados Musicales.\n• [bold green]ESTADOS:[/] Ajustes expertos que filtran escalas por emoción.",
@@ -180,6 +200,8 @@ class Translations:
             "inv_2nd": "2da",
             "inv_3rd": "3ra",
             "moods": "ESTADOS",
+            "jam_notes_placeholder": "Filtrar por notas (ej. C E G)",
+            "status_scales_found": "{count} escala(s) contienen [bold cyan]{notes}[/]",
             "legacy_welcome": "♩  C H O R D E R I Z E R  ♩",
             "legacy_sub": "Generador Avanzado de Acordes",
             "legacy_phase1": "Fase 1  ·  Configuración de Escala",
@@ -217,6 +239,12 @@ class Translations:
             "status_scale_loaded": "Гамма [bold cyan]{tonic} {scale_name}[/] загружена.",
             "status_chord_added": "Аккорд [bold cyan]{name}[/] добавлен.",
             "status_list_reset": "Список прогрессии очищен.",
+            "status_reharmonized": "Прогрессия реармонизована: [bold cyan]{names}[/]",
+            "status_reharm_empty": "Добавьте аккорды в прогрессию перед реармонизацией.",
+            "status_tuning": "Строй: [bold cyan]{name}[/]",
+            "status_prog_tab": "Табулатура прогрессии: [bold cyan]{count}[/] аккордов, аппликатуры с минимальным перемещением руки.",
+            "status_prog_tab_empty": "Добавьте аккорды в прогрессию, чтобы увидеть её табулатуру.",
+            "prog_tab_title": "Прогрессия · {name}",
             "status_exported": "Экспортировано: [bold green]{filename}[/]\nПуть: [dim]{path}[/]",
             "status_export_failed": "[red]Ошибка экспорта: {error}[/red]",
             "notify_exported": "MIDI экспортирован",
@@ -245,6 +273,9 @@ class Translations:
             "manual_phase_4": "4. [bold]ЭКСПОРТ:[/] Нажмите [bold][E][/bold] для MIDI",
             "manual_add": "• [white][A][/white] Добавить аккорд в прогрессию (боковая панель).",
             "manual_clear": "• [white][X][/white] Очистить список прогрессии.",
+            "manual_reharm": "• [white][R][/white] Реармонизовать прогрессию (замены).",
+            "manual_tuning": "• [white][T][/white] Сменить строй инструмента (гриф и табулатуры).",
+            "manual_prog_tab": "• [white][P][/white] Табулатура прогрессии (минимальное перемещение руки).",
             "manual_export": "• [white][E][/white] Экспортировать текущую композицию в MIDI.",
             "manual_help": "• [white][H][/white] или [white][F1][/white] Показать это руководство.",
             "manual_quit": "• [white][Q][/white] Выйти из приложения.",
@@ -304,6 +335,12 @@ class Translations:
             "status_scale_loaded": "Escala [bold cyan]{tonic} {scale_name}[/] carregada.",
             "status_chord_added": "Acorde [bold cyan]{name}[/] adicionado.",
             "status_list_reset": "Lista de progressão reiniciada.",
+            "status_reharmonized": "Progressão rearmonizada: [bold cyan]{names}[/]",
+            "status_reharm_empty": "Adicione acordes à progressão antes de rearmonizar.",
+            "status_tuning": "Afinação: [bold cyan]{name}[/]",
+            "status_prog_tab": "Tablatura da progressão: [bold cyan]{count}[/] acordes, digitados com o mínimo movimento da mão.",
+            "status_prog_tab_empty": "Adicione acordes à progressão para ver a sua tablatura.",
+            "prog_tab_title": "Progressão · {name}",
             "status_exported": "Exportado: [bold green]{filename}[/]\nCaminho: [dim]{path}[/]",
             "status_export_failed": "[red]Falha na exportação: {error}[/red]",
             "notify_exported": "MIDI Exportado",
@@ -332,6 +369,9 @@ class Translations:
             "manual_phase_4": "4. [bold]EXPORTAR:[/] Pressione [bold][E][/bold] para MIDI",
             "manual_add": "• [white][A][/white] Adicionar acorde à progressão (Barra lateral).",
             "manual_clear": "• [white][X][/white] Limpar lista de progressão.",
+            "manual_reharm": "• [white][R][/white] Rearmonizar a progressão (substituições).",
+            "manual_tuning": "• [white][T][/white] Alternar a afinação do instrumento (braço e tablaturas).",
+            "manual_prog_tab": "• [white][P][/white] Tablatura da progressão (mínimo movimento da mão).",
             "manual_export": "• [white][E][/white] Exportar composição atual para MIDI.",
             "manual_help": "• [white][H][/white] ou [white][F1][/white] Ver este manual.",
             "manual_quit": "• [white][Q][/white] Sair da aplicação.",
@@ -391,6 +431,12 @@ class Translations:
             "status_scale_loaded": "音阶 [bold cyan]{tonic} {scale_name}[/] 已加载。",
             "status_chord_added": "和弦 [bold cyan]{name}[/] 已添加。",
             "status_list_reset": "进行列表已重置。",
+            "status_reharmonized": "进行已重新配和声：[bold cyan]{names}[/]",
+            "status_reharm_empty": "请先向进行中添加和弦再重新配和声。",
+            "status_tuning": "调弦: [bold cyan]{name}[/]",
+            "status_prog_tab": "和弦进行六线谱: [bold cyan]{count}[/] 个和弦，按最小换把选择指法。",
+            "status_prog_tab_empty": "请先向和弦进行中添加和弦以查看六线谱。",
+            "prog_tab_title": "和弦进行 · {name}",
             "status_exported": "已导出: [bold green]{filename}[/]\n路径: [dim]{path}[/]",
             "status_export_failed": "[red]导出失败: {error}[/red]",
             "notify_exported": "MIDI 已导出",
@@ -419,6 +465,9 @@ class Translations:
             "manual_phase_4": "4. [bold]导出:[/] 按 [bold][E][/bold] 导出 MIDI",
             "manual_add": "• [white][A][/white] 将和弦添加到进行（右侧栏）。",
             "manual_clear": "• [white][X][/white] 清空进行列表。",
+            "manual_reharm": "• [white][R][/white] 重新配和声（和弦替换）。",
+            "manual_tuning": "• [white][T][/white] 切换乐器调弦（指板和六线谱）。",
+            "manual_prog_tab": "• [white][P][/white] 和弦进行的六线谱（最小换把）。",
             "manual_export": "• [white][E][/white] 将当前作品导出为 MIDI。",
             "manual_help": "• [white][H][/white] 或 [white][F1][/white] 查看此手册。",
             "manual_quit": "• [white][Q][/white] 退出应用程序。",
@@ -0,0 +1,211 @@
+"""
+transposition.py — Pitch-class transposition of chords and progressions
+=======================================================================
+Transposes ScaleChord objects and MIDI arrays by arithmetic on pitch classes.
+Chord names are rebuilt from the chord's root pitch class and suffix through
+precomputed spelling tables (see spelling.py), so no chord name is ever parsed.
+
+transpose_to_all_keys renders a progression in all 12 keys in one pass (with
+NumPy when it is installed: pip install chorderizer[fast]).
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from .chord_set import ScaleChord, ScaleChordSet
+from .spelling import KeySpelling, key_spelling_for_degrees, spell_chord_tones
+from .theory_utils import MusicTheory, MusicTheoryUtils
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the "fast" extra
+    np = None
+
+# Note names per pitch class, indexed by use_flats
+NOTE_NAMES: Tuple[Tuple[str, ...], Tuple[str, ...]] = (
+    tuple(MusicTheory.CHROMATIC_NOTES),
+    tuple(MusicTheoryUtils.get_note_name(pc, use_flats=True) for pc in range(12)),
+)
+
+# Conventional tonic spelling for each of the 12 keys and whether it is a flat key
+KEY_TONIC_NAMES: Tuple[str, ...] = (
+    "C",
+    "Db",
+    "D",
+    "Eb",
+    "E",
+    "F",
+    "F#",
+    "G",
+    "Ab",
+    "A",
+    "Bb",
+    "B",
+)
+KEY_USES_FLATS: Tuple[bool, ...] = tuple(pc in (1, 3, 5, 8, 10) for pc in range(12))
+
+MidiNotes = Union[Sequence[int], "np.ndarray"]
+
+
+def shortest_shift(from_pc: int, to_pc: int) -> int:
+    """Smallest transposition (-6..+5 semitones) taking one pitch class to another."""
+    return (to_pc - from_pc + 6) % 12 - 6
+
+
+def transpose_midi(notes: MidiNotes, semitones: int) -> MidiNotes:
+    """Shifts MIDI notes by a number of semitones, keeping the input container type."""
+    if np is not None and isinstance(notes, np.ndarray):
+        return notes + semitones
+    return type(notes)(n + semitones for n in notes)
+
+
+def transpose_chord(chord: ScaleChord, semitones: int, use_flats: bool = False) -> ScaleChord:
+    """Returns the chord moved by ``semitones`` and respelled with the given accidentals."""
+    names = NOTE_NAMES[use_flats]
+    root_pc = (chord.root_pc + semitones) % 12
+    midi_notes = tuple(n + semitones for n in chord.midi_notes)
+    return ScaleChord(
+        chord.degree,
+        names[root_pc] + chord.suffix,
+        root_pc,
+        chord.suffix,
+        chord.chord_type,
+        chord.base_quality,
+        tuple(names[n % 12] for n in midi_notes),
+        midi_notes,
+    )
+
+
+def _key_for(chords: Sequence[ScaleChord], from_pc: int, to_tonic: str) -> Optional[KeySpelling]:
+    """Spelling of the chords' degrees in the target key."""
+    return key_spelling_for_degrees(
+        to_tonic, [(chord.degree, (chord.root_pc - from_pc) % 12) for chord in chords]
+    )
+
+
+def _respelled(
+    chord: ScaleChord,
+    root_pc: int,
+    midi_notes: Tuple[int, ...],
+    key: Optional[KeySpelling],
+    index: int,
+    use_flats: bool,
+) -> ScaleChord:
+    structure = MusicTheory.CHORD_STRUCTURES.get(
+        chord.chord_type, MusicTheory.CHORD_STRUCTURES.get(chord.base_quality)
+    )
+    if key is None or not structure:
+        names = NOTE_NAMES[use_flats]
+        root_name = names[root_pc]
+        note_names = tuple(names[n % 12] for n in midi_notes)
+    else:
+        root_name = key.root_names[index]
+        note_names = spell_chord_tones(
+            key.root_letters[index], root_pc, tuple(structure), midi_notes, key.prefers_flats
+        )
+    return ScaleChord(
+        chord.degree,
+        root_name + chord.suffix,
+        root_pc,
+        chord.suffix,
+        chord.chord_type,
+        chord.base_quality,
+        note_names,
+        midi_notes,
+    )
+
+
+def transpose_progression(
+    chords: Sequence[ScaleChord], from_tonic: str, to_tonic: str
+) -> Tuple[ScaleChord, ...]:
+    """
+    Transposes a progression from one tonic to another by the shortest interval,
+    so voicings stay in the same register. Names are spelled for the target key.
+
+    Raises:
+        ValueError: If either tonic is not a valid note name.
+    """
+    from_pc = MusicTheoryUtils.get_note_index(from_tonic)
+    semitones = shortest_shift(from_pc, MusicTheoryUtils.get_note_index(to_tonic))
+    use_flats = MusicTheoryUtils.should_use_flats(to_tonic)
+    key = _key_for(chords, from_pc, to_tonic)
+    return tuple(
+        _respelled(
+            chord,
+            (chord.root_pc + semitones) % 12,
+            tuple(n + semitones for n in chord.midi_notes),
+            key,
+            index,
+            use_flats,
+        )
+        for index, chord in enumerate(chords)
+    )
+
+
+def transpose_chord_set(chord_set: ScaleChordSet, to_tonic: str) -> ScaleChordSet:
+    """Transposes every chord of a ScaleChordSet to a new tonic."""
+    return ScaleChordSet(
+        to_tonic,
+        chord_set.scale_name,
+        chord_set.extension_level,
+        chord_set.inversion,
+        transpose_progression(chord_set.chords, chord_set.tonic, to_tonic),
+    )
+
+
+def transpose_midi_all_keys(midi: "np.ndarray", from_pc: int) -> "np.ndarray":
+    """
+    Transposes a MIDI array (any shape) to all 12 keys at once.
+
+    Returns:
+        An array of shape (12,) + midi.shape whose row k holds the notes moved to
+        the key with tonic pitch class k. Negative entries (padding) are kept.
+    """
+    if np is None:
+        raise ImportError(
+            "transpose_midi_all_keys requires NumPy. Install it with: pip install chorderizer[fast]"
+        )
+    midi = np.asarray(midi)
+    shifts = (np.arange(12) - from_pc + 6) % 12 - 6
+    shifts = shifts.reshape((12,) + (1,) * midi.ndim)
+    return np.where(midi >= 0, midi + shifts, midi)
+
+
+def transpose_to_all_keys(
+    chords: Sequence[ScaleChord], from_tonic: str
+) -> Dict[str, Tuple[ScaleChord, ...]]:
+    """
+    Renders a progression in all 12 keys, keyed by the conventional tonic name
+    (KEY_TONIC_NAMES). Each key is reached by the shortest interval and spelled
+    for that key.
+
+    Raises:
+        ValueError: If from_tonic is not a valid note name.
+    """
+    from_pc = MusicTheoryUtils.get_note_index(from_tonic)
+    if np is None or not chords:
+        return {
+            key_name: transpose_progression(chords, from_tonic, key_name)
+            for key_name in KEY_TONIC_NAMES
+        }
+
+    width = max(len(chord.midi_notes) for chord in chords)
+    padded = np.full((len(chords), width), -1, dtype=np.int16)
+    for row, chord in enumerate(chords):
+        padded[row, : len(chord.midi_notes)] = chord.midi_notes
+    roots = np.array([chord.root_pc for chord in chords], dtype=np.int16)
+
+    all_midi = transpose_midi_all_keys(padded, from_pc).tolist()
+    all_roots = ((roots[None, :] + np.arange(12)[:, None] - from_pc) % 12).tolist()
+
+    result: Dict[str, Tuple[ScaleChord, ...]] = {}
+    for key_pc, key_name in enumerate(KEY_TONIC_NAMES):
+        key = _key_for(chords, from_pc, key_name)
+        use_flats = KEY_USES_FLATS[key_pc]
+        transposed: List[ScaleChord] = []
+        for index, (chord, root_pc, row) in enumerate(
+            zip(chords, all_roots[key_pc], all_midi[key_pc])
+        ):
+            midi_notes = tuple(row[: len(chord.midi_notes)])
+            transposed.append(_respelled(chord, root_pc, midi_notes, key, index, use_flats))
+        result[key_name] = tuple(transposed)
+    return result
@@ -24,6 +24,7 @@ from textual.widgets import (
     DataTable,
     Footer,
     Header,
+    Input,
     Label,
     ListItem,
     ListView,
@@ -34,8 +35,11 @@ from textual.widgets import (
     Static,
 )
 
+from .chord_space import open_chord_space
 from .generators import ChordGenerator, MidiGenerator, TablatureGenerator
 from .icons import IconManager
+from .instruments import DEFAULT_TUNING, TUNINGS, Tuning, get_tuning
+from .reharmonization import Reharmonizer
 from .theory_utils import MusicTheory
 from .translations import Translations
 from .tui_widgets import FretboardWidget, GuitarTabWidget, PianoWidget, ProgressionPanel
@@ -88,6 +92,9 @@ class ManualScreen(ModalScreen):
                 f"{Translations.t('manual_shortcuts')}\n"
                 f"{Translations.t('manual_add')}\n"
                 f"{Translations.t('manual_clear')}\n"
+                f"{Translations.t('manual_reharm')}\n"
+                f"{Translations.t('manual_prog_tab')}\n"
+                f"{Translations.t('manual_tuning')}\n"
                 f"{Translations.t('manual_export')}\n"
                 f"{Translations.t('manual_jam')}\n"
                 f"{Translations.t('manual_jam_desc')}\n"
@@ -151,7 +158,12 @@ class ConfigManager:
                     return json.load(f)
             except Exception:
                 pass
-        return {"theme": "chromatic-pro", "mouse_enabled": True, "advanced_mode": False}
+        return {
+            "theme": "chromatic-pro",
+            "mouse_enabled": True,
+            "advanced_mode": False,
+            "chord_cache_size": ChordGenerator.DEFAULT_CACHE_SIZE,
+        }
 
     def save(self, settings: Dict[str, Any]):
         try:
@@ -235,6 +247,11 @@ class ChorderizerProvider(Provider):
                 app.action_add_to_progression,
                 "Add current selection to composition",
             ),
+            (
+                "Reharmonize Progression",
+                app.action_reharmonize_progression,
+                "Tritone subs, secondary dominants, ii-V and borrowed chords",
+            ),
             (
                 "Clear Progression List",
                 app.action_clear_progression,
@@ -247,6 +264,16 @@ class ChorderizerProvider(Provider):
                 app.action_toggle_submode,
                 "Show musical degrees on neck",
             ),
+            (
+                "Progression Tab Sheet",
+                app.action_progression_tab,
+                "Fingerings chosen for minimal hand movement",
+            ),
+            (
+                "Cycle Instrument Tuning",
+                app.action_cycle_tuning,
+                "Drop D, DADGAD, 7/8-string, bass, ukulele",
+            ),
             ("Toggle Mouse Support", app.action_toggle_mouse, "Enable/Disable mouse interaction"),
             (
                 "Change Theme (Live Preview)",
@@ -303,6 +330,12 @@ class ChorderizerApp(App):
             f"{IconManager.get('plus')} {Translations.t('Add Chord')}",
             show=True,
         ),
+        Binding(
+            "r",
+            "reharmonize_progression",
+            f"{IconManager.get('reharm')} {Translations.t('Reharmonize')}",
+            show=True,
+        ),
         Binding(
             "x",
             "clear_progression",
@@ -327,6 +360,18 @@ class ChorderizerApp(App):
             f"{IconManager.get('jam')} {Translations.t('mode_jam')}",
             show=True,
         ),
+        Binding(
+            "p",
+            "progression_tab",
+            f"{IconManager.get('guitar')} {Translations.t('Prog Tab')}",
+            show=True,
+        ),
+        Binding(
+            "t",
+            "cycle_tuning",
+            f"{IconManager.get('guitar')} {Translations.t('Tuning')}",
+            show=True,
+        ),
         Binding(
             "s",
             "toggle_submode",
@@ -488,12 +533,22 @@ class ChorderizerApp(App):
         self.register_theme(THEME_HARMONIC)
         self.register_theme(THEME_DORIAN)
 
-        self.theory = MusicTheory()
-        self.chord_gen = ChordGenerator(self.theory)
+        self.theory = MusicTheory.shared()
+        cache_size = self.settings.get("chord_cache_size")
+        if cache_size is not None and (not isinstance(cache_size, int) or cache_size < 0):
+            logging.warning(f"Ignoring invalid chord_cache_size in config: {cache_size!r}")
+            cache_size = None
+        self.chord_gen = ChordGenerator(
+            self.theory, chord_space=open_chord_space(self.theory), cache_size=cache_size
+        )
+        self.reharmonizer = Reharmonizer(self.chord_gen)
         self.midi_gen = MidiGenerator(self.theory)
-        self.tab_gen = TablatureGenerator(self.theory)
+        self.tuning = self._configured_tuning()
+        self.tab_gen = TablatureGenerator(self.theory, self.tuning)
         self.current_chords = {}
         self.current_midi = {}
+        self.current_chord_set = None
+        self.current_scale_info = None
         self.mouse_enabled = self.settings.get("mouse_enabled", True)
         self.active_theme_name = self.settings.get("theme", "chromatic-pro")
         self.theme = self.active_theme_name
@@ -529,7 +584,7 @@ class ChorderizerApp(App):
                         classes="config-label",
                     )
                     yield Select(
-                        [(v["name"], k) for k, v in self.theory.AVAILABLE_SCALES.items()],
+                        [(name, k) for k, name in self.theory.scale_names().items()],
                         id="scale-select",
                         value="1",
                     )
@@ -602,6 +657,10 @@ class ChorderizerApp(App):
                             classes="jam-list-label",
                             id="jam-scale-title",
                         )
+                        yield Input(
+                            placeholder=Translations.t("jam_notes_placeholder"),
+                            id="jam-notes-input",
+                        )
                         yield ListView(id="jam-scale-list")
                     with Vertical(id="jam-info-container"):
                         yield Label(Translations.t("jam_hint"), classes="config-label-small")
@@ -649,15 +708,12 @@ class ChorderizerApp(App):
                 icon="i",
             )
 
+        for fretboard in self.query(FretboardWidget):
+            fretboard.set_tuning(self.tuning)
+
         self.log_status(Translations.t("status_welcome"), "WELCOME", icon=IconManager.get("rocket"))
         self.update_chords()
 
-        # Populate jam scale list
-        jam_list = self.query_one("#jam-scale-list", ListView)
-        for k, v in self.theory.AVAILABLE_SCALES.items():
-            item = ListItem(Label(f" {v['name']} "), id=f"jam-scale-{k}")
-            jam_list.append(item)
-
         # Populate moods
         mood_list = self.query_one("#jam-mood-list", ListView)
         moods = [
@@ -684,21 +740,56 @@ class ChorderizerApp(App):
         jam_list = self.query_one("#jam-scale-list", ListView)
         jam_list.clear()
 
-        for k, v in self.theory.AVAILABLE_SCALES.items():
-            if filter_keys is None or k in filter_keys:
-                item = ListItem(Label(f" {v['name']} "))
-                item.scale_key = k
-                jam_list.append(item)
+        names = self.theory.scale_names()
+        keys = names if filter_keys is None else filter_keys
+        for k in keys:
+            name = names.get(k)
+            if name is None:
+                continue
+            item = ListItem(Label(f" {name} "))
+            item.scale_key = k
+            jam_list.append(item)
 
         if len(jam_list.children) > 0:
             jam_list.index = 0
 
     def on_select_changed(self, event: Select.Changed) -> None:
-        if event.select.id in ["jam-tonic-select", "jam-scale-list"]:
+        if event.select.id == "jam-tonic-select" and self.query_one("#jam-notes-input").value:
+            self.filter_jam_scales_by_notes(self.query_one("#jam-notes-input").value)
+        elif event.select.id in ["jam-tonic-select", "jam-scale-list"]:
             self.update_jam_view()
         else:
             self.update_chords()
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id == "jam-notes-input":
+            self.filter_jam_scales_by_notes(event.value)
+
+    def filter_jam_scales_by_notes(self, raw_notes: str) -> None:
+        """Re-filters the jam scale list to scales on the current tonic containing the notes."""
+        pitch_classes = []
+        for token in raw_notes.replace(",", " ").split():
+            try:
+                pitch_classes.append(self.theory.note_to_midi(token))
+            except ValueError:
+                continue
+
+        if not pitch_classes:
+            self.rebuild_jam_scales()
+            self.update_jam_view()
+            return
+
+        t_sel = self.query_one("#jam-tonic-select", Select)
+        tonic_pc = None if t_sel.value is Select.BLANK else self.theory.note_to_midi(t_sel.value)
+        matches = self.theory.find_scales(pitch_classes, tonic_pc=tonic_pc)
+        self.rebuild_jam_scales(list(dict.fromkeys(m.scale_key for m in matches)))
+        self.update_jam_view()
+        self.log_status(
+            Translations.t("status_scales_found", count=len(matches), notes=escape(raw_notes)),
+            "JAM",
+            icon=IconManager.get("tonic"),
+        )
+
     def on_radio_set_changed(self) -> None:
         self.update_chords()
 
@@ -745,6 +836,32 @@ class ChorderizerApp(App):
             jam_fret.display_mode = "simple"
             self.log_status(Translations.t("submode_simple"), "JAM", icon=IconManager.get("gear"))
 
+    def action_cycle_tuning(self) -> None:
+        """Switches the fretboards and tabs to the next registered tuning."""
+        keys = list(TUNINGS)
+        next_key = keys[(keys.index(self.tuning.key) + 1) % len(keys)]
+        self.tuning = get_tuning(next_key, self.tuning.capo)
+        self.tab_gen.set_tuning(self.tuning)
+        for fretboard in self.query(FretboardWidget):
+            fretboard.set_tuning(self.tuning)
+        self.update_tab()
+        self.save_config()
+        self.log_status(
+            Translations.t("status_tuning", name=escape(self.tuning.label)),
+            "INSTRUMENT",
+            icon=IconManager.get("guitar"),
+        )
+
+    def _configured_tuning(self) -> Tuning:
+        """Tuning and capo from config.json, standard tuning if they are invalid."""
+        try:
+            return get_tuning(
+                self.settings.get("tuning", DEFAULT_TUNING), int(self.settings.get("capo", 0))
+            )
+        except (TypeError, ValueError) as e:
+            logging.warning(f"Ignoring invalid tuning in config: {e}")
+            return get_tuning(DEFAULT_TUNING)
+
     def action_toggle_mouse(self) -> None:
         """Toggles mouse support."""
         self.mouse_enabled = not self.mouse_enabled
@@ -774,6 +891,8 @@ class ChorderizerApp(App):
         """Saves current settings to global config.json."""
         self.settings["theme"] = self.active_theme_name
         self.settings["mouse_enabled"] = self.mouse_enabled
+        self.settings["tuning"] = self.tuning.key
+        self.settings["capo"] = self.tuning.capo
         self.config_mgr.save(self.settings)
         self.update_jam_view()
 
@@ -845,14 +964,25 @@ class ChorderizerApp(App):
             self.query_one("#fretboard", FretboardWidget).update_view(
                 self.scale_notes_pc, midi_notes, self.tonic_pc
             )
-            tabs = self.tab_gen.generate_simple_tab(name, midi_notes)
-            self.query_one("#guitar-tab", GuitarTabWidget).update_tab(name, tabs)
             self.selected_row_data = {
                 "degree": degree,
                 "name": name,
                 "midi_notes": midi_notes,
                 "duration_beats": 4.0,
+                "chord": self.current_chord_set.get(degree),
             }
+            self.update_tab()
+
+    def update_tab(self) -> None:
+        """Shows the best fingering of the selected chord in the current tuning."""
+        data = self.selected_row_data
+        if not data:
+            return
+        chord = data.get("chord")
+        tabs = self.tab_gen.generate_fingering_tab(
+            data["name"], data["midi_notes"], chord.root_pc if chord is not None else None
+        )
+        self.query_one("#guitar-tab", GuitarTabWidget).update_tab(data["name"], tabs)
 
     def action_add_to_progression(self) -> None:
         if self.selected_row_data:
@@ -871,6 +1001,88 @@ class ChorderizerApp(App):
             Translations.t("status_list_reset"), "COMPOSER", icon=IconManager.get("broom")
         )
 
+    def action_reharmonize_progression(self) -> None:
+        """Replaces the progression with a reharmonization in the current key."""
+        prog_panel = self.query_one("#progression-sidebar", ProgressionPanel)
+        prog_data = prog_panel.get_progression_data()
+        t_sel = self.query_one("#tonic-select", Select)
+        s_sel = self.query_one("#scale-select", Select)
+        if not prog_data or t_sel.value is Select.BLANK or s_sel.value is Select.BLANK:
+            self.log_status(
+                Translations.t("status_reharm_empty"), "COMPOSER", icon=IconManager.get("warn")
+            )
+            return
+
+        ext = self.query_one("#extension-set", RadioSet).pressed_index
+        inv = self.query_one("#inversion-set", RadioSet).pressed_index
+        # Chords added from another key (or before chord objects were kept) stay as they are
+        with_chords = [item for item in prog_data if item.get("chord") is not None]
+        steps = iter(
+            self.reharmonizer.reharmonize_steps(
+                [item["chord"] for item in with_chords],
+                t_sel.value,
+                self.theory.AVAILABLE_SCALES[s_sel.value],
+                extension_level=ext,
+                inversion=inv,
+            )
+        )
+
+        new_data = []
+        for item in prog_data:
+            if item.get("chord") is None:
+                new_data.append(item)
+                continue
+            step = next(steps)
+            # Inserted chords share the duration of the chord they lead into
+            duration = item["duration_beats"] / len(step)
+            for chord in step:
+                new_data.append(
+                    {
+                        "degree": chord.degree,
+                        "name": chord.name,
+                        "midi_notes": list(chord.midi_notes),
+                        "duration_beats": duration,
+                        "chord": chord,
+                    }
+                )
+
+        prog_panel.set_progression(new_data)
+        self.log_status(
+            Translations.t(
+                "status_reharmonized", names=escape(" ".join(d["name"] for d in new_data))
+            ),
+            "COMPOSER",
+            icon=IconManager.get("reharm"),
+        )
+
+    def action_progression_tab(self) -> None:
+        """Shows the progression as one tab sheet, fingered for minimal hand movement."""
+        prog_data = self.query_one("#progression-sidebar", ProgressionPanel).get_progression_data()
+        if not prog_data:
+            self.log_status(
+                Translations.t("status_prog_tab_empty"), "TABS", icon=IconManager.get("warn")
+            )
+            return
+
+        chords = [
+            (
+                item["name"],
+                item["midi_notes"],
+                item["chord"].root_pc if item.get("chord") is not None else None,
+            )
+            for item in prog_data
+        ]
+        tab_widget = self.query_one("#guitar-tab", GuitarTabWidget)
+        sheet = self.tab_gen.generate_progression_tab(chords, width=tab_widget.sheet_width)
+        tab_widget.update_sheet(
+            Translations.t("prog_tab_title", name=escape(self.tuning.label)), sheet
+        )
+        self.log_status(
+            Translations.t("status_prog_tab", count=len(chords)),
+            "TABS",
+            icon=IconManager.get("guitar"),
+        )
+
     def action_export_midi(self) -> None:
         prog_panel = self.query_one("#progression-sidebar", ProgressionPanel)
         prog_data = prog_panel.get_progression_data()
@@ -897,8 +1109,17 @@ class ChorderizerApp(App):
             "add_bass_track": True,
             "bass_instrument": 33,
             "arpeggio_style": None,
-            "voice_leading": True,
+            "voice_leading": "optimal",
         }
+        if self.current_chord_set is not None:
+            # Transitions between chords of the current key come from a cached table
+            chord_set = self.current_chord_set
+            midi_opts["voice_leading_key"] = (
+                chord_set.tonic,
+                self.current_scale_info,
+                chord_set.extension_level,
+                chord_set.inversion,
+            )
 
         try:
             self.midi_gen.generate_midi_file(prog_data, filename, midi_opts)
@@ -931,19 +1152,22 @@ class ChorderizerApp(App):
         scale_info = self.theory.AVAILABLE_SCALES[s_sel.value]
 
         try:
-            res = self.chord_gen.generate_scale_chords(t_sel.value, scale_info, ext, inv)
-            self.current_chords, _, self.current_midi, _ = res
+            chord_set = self.chord_gen.generate_chord_set(t_sel.value, scale_info, ext, inv)
+            self.current_chord_set = chord_set
+            self.current_scale_info = scale_info
+            self.current_chords = chord_set.names()
+            self.current_midi = chord_set.midi()
 
             tonic_idx = self.theory.note_to_midi(t_sel.value)
-            self.scale_notes_pc = {
-                (tonic_idx + d["root_interval"]) % 12 for d in scale_info["degrees"].values()
-            }
+            self.scale_notes_pc = self.theory.scale_pitch_classes(s_sel.value, tonic_idx)
             self.tonic_pc = tonic_idx % 12
 
             table = self.query_one("#chord-table", DataTable)
             table.clear()
-            for deg, name in self.current_chords.items():
-                table.add_row(deg, name, str(self.current_midi[deg]), key=deg)
+            for chord in chord_set:
+                table.add_row(
+                    chord.degree, chord.name, str(list(chord.midi_notes)), key=chord.degree
+                )
             self.log_status(
                 Translations.t(
                     "status_scale_loaded", tonic=t_sel.value, scale_name=scale_info["name"]
@@ -977,14 +1201,11 @@ class ChorderizerApp(App):
                 return
 
             scale_key = getattr(highlighted, "scale_key", "1")
-            scale_info = self.theory.AVAILABLE_SCALES.get(
-                scale_key, self.theory.AVAILABLE_SCALES["1"]
-            )
+            if scale_key not in self.theory.AVAILABLE_SCALES:
+                scale_key = "1"
 
             tonic_idx = self.theory.note_to_midi(t_sel.value)
-            scale_notes_pc = {
-                (tonic_idx + d["root_interval"]) % 12 for d in scale_info["degrees"].values()
-            }
+            scale_notes_pc = self.theory.scale_pitch_classes(scale_key, tonic_idx)
 
             fretboard = self.query_one("#jam-fretboard", FretboardWidget)
             fretboard.update_view(scale_notes_pc, [], tonic_idx % 12, fretboard.display_mode)
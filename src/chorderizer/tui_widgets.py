@@ -11,6 +11,7 @@ from textual.app import ComposeResult
 from textual.widgets import Label, ListItem, ListView, Static
 
 from .icons import IconManager
+from .instruments import DEFAULT_TUNING, Tuning, fretboard_index, get_tuning
 from .translations import Translations
 
 
@@ -95,10 +96,19 @@ class FretboardWidget(Static):
         self.scale_notes_pc = set()
         self.chord_notes_midi = set()
         self.tonic_pc = 0
-        self.strings = [64, 59, 55, 50, 45, 40]
-        self.string_names = ["e", "B", "G", "D", "A", "E"]
         self.display_mode = "simple"  # 'simple' or 'advanced'
         self.theory = None  # Will be set by app
+        self.set_tuning(get_tuning(DEFAULT_TUNING))
+
+    def set_tuning(self, tuning: Tuning) -> None:
+        """Swaps in the shared, lazily built lookup table of another tuning."""
+        self.tuning = tuning
+        self.fretboard = fretboard_index(tuning)
+        # String 1 (the highest) is drawn on top
+        self.string_rows = list(zip(tuning.string_names, self.fretboard.pitches))[::-1]
+        self.name_width = max(len(name) for name in tuning.string_names)
+        self.styles.height = len(tuning.strings) + 5
+        self.refresh()
 
     def update_view(
         self,
@@ -117,19 +127,18 @@ class FretboardWidget(Static):
         # Dynamic width calculation
         width = self.size.width
         num_frets = (width - 10) // 4
-        num_frets = max(12, min(num_frets, 24))
+        num_frets = max(12, min(num_frets, 24, self.fretboard.max_fret))
 
         fretboard = Text()
-        header = Text("      ")
+        header = Text(" " * (self.name_width + 5))
         for f in range(num_frets + 1):
             header.append(f"{f:<4}", style="dim")
         fretboard.append(header)
         fretboard.append("\n")
 
-        for i, start_midi in enumerate(self.strings):
-            line = Text(f" {self.string_names[i]} ║")
-            for fret in range(num_frets + 1):
-                midi = start_midi + fret
+        for string_name, pitches in self.string_rows:
+            line = Text(f" {string_name.rjust(self.name_width)} ║")
+            for midi in pitches[: num_frets + 1]:
                 pc = midi % 12
                 is_chord_note = midi in self.chord_notes_midi
                 is_scale_note = pc in self.scale_notes_pc
@@ -159,9 +168,10 @@ class FretboardWidget(Static):
             fretboard.append("\n")
 
         mode_label = f" ({self.display_mode.upper()})"
+        tuning_label = "" if self.tuning.key == DEFAULT_TUNING else f" · {self.tuning.label}"
         return Panel(
             Align.center(fretboard),
-            title=f"[bold yellow]{Translations.t('guitar_fretboard')}{mode_label}[/bold yellow]",
+            title=f"[bold yellow]{Translations.t('guitar_fretboard')}{tuning_label}{mode_label}[/bold yellow]",
             border_style="yellow",
         )
 
@@ -175,14 +185,41 @@ class GuitarTabWidget(Static):
         super().__init__(**kwargs)
         self.chord_name = "None"
         self.tab_lines = []
+        self.sheet_title = None
 
     def update_tab(self, chord_name: str, tab_lines: List[str]):
         self.chord_name = chord_name
         self.tab_lines = tab_lines
+        self.sheet_title = None
         self.refresh()
 
+    def update_sheet(self, title: str, sheet_lines: List[str]):
+        """Shows a multi-chord tab sheet (see TablatureGenerator.generate_progression_tab)."""
+        self.sheet_title = title
+        self.tab_lines = sheet_lines
+        self.refresh(layout=True)
+
+    @property
+    def sheet_width(self) -> int:
+        """Columns available to a tab sheet inside the panel."""
+        return max(24, self.size.width - 4)
+
     def render(self) -> Panel:
         content = Text()
+        if self.sheet_title is not None:
+            # Sheets keep their spacing: chord names are aligned over the fret columns
+            rows = max(1, self.size.height - 3)
+            for line in self.tab_lines[:rows]:
+                content.append(line, style="bright_green" if "|" in line else "bold yellow")
+                content.append("\n")
+            if len(self.tab_lines) > rows:
+                content.append("…", style="dim")
+            return Panel(
+                content,
+                title=f"[bold yellow]{self.sheet_title}[/bold yellow]",
+                border_style="bright_cyan",
+            )
+
         for line in self.tab_lines:
             if "|" in line:
                 content.append(line.replace(" ", ""), style="bright_green")
@@ -246,7 +283,7 @@ class ProgressionPanel(Static):
         yield Label(Translations.t("sidebar_empty_desc"), id="prog-empty")
         yield ListView(id="prog-list")
         yield Label(
-            f" [bold][A][/bold] {IconManager.get('plus')} Add  [bold][X][/bold] {IconManager.get('broom')} Clear",
+            f" [bold][A][/bold] {IconManager.get('plus')} Add  [bold][R][/bold] {IconManager.get('reharm')} Reharm  [bold][X][/bold] {IconManager.get('broom')} Clear",
             id="prog-help",
         )
 
@@ -258,6 +295,11 @@ class ProgressionPanel(Static):
         self.query_one("#prog-list", ListView).clear()
         self.query_one("#prog-empty", Label).remove_class("hidden")
 
+    def set_progression(self, chords_data: List[Dict[str, Any]]):
+        self.clear_prog()
+        for chord_data in chords_data:
+            self.add_chord(chord_data)
+
     def get_progression_data(self) -> List[Dict[str, Any]]:
         return [
             item.chord_data
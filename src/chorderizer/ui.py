@@ -7,7 +7,7 @@ Provides clean visual design, inline validation, and a streamlined
 """
 
 import shutil
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 from prompt_toolkit import prompt
 from prompt_toolkit.completion import WordCompleter
@@ -283,7 +283,7 @@ def prompt_menu(
 
     _pp(f"\n<section>  {_escape(title)}</section>")
     for k, v in display.items():
-        name = v.get("name", v) if isinstance(v, dict) else str(v)
+        name = v.get("name", v) if isinstance(v, Mapping) else str(v)
         _pp(f"  <key>{k.rjust(max_kw)}.</key>  <value>{_escape(name)}</value>")
     if allow_cancel:
         _pp(
@@ -374,8 +374,8 @@ class RangeValidator(Validator):
 class UIManager:
     """Manages all user interaction for the Chorderizer workflow."""
 
-    def __init__(self, theory: MusicTheory):
-        self.theory = theory
+    def __init__(self, theory: Optional[MusicTheory] = None):
+        self.theory = theory if theory is not None else MusicTheory.shared()
 
     # ── Phase 1: Scale Configuration ─────────────────────────────────────────
 
@@ -394,7 +394,7 @@ class UIManager:
             return None, None
         tonic = tonic_opts[tonic_key]
 
-        scale_key = prompt_menu(Translations.t("legacy_select_scale"), self.theory.AVAILABLE_SCALES)
+        scale_key = prompt_menu(Translations.t("legacy_select_scale"), self.theory.scale_names())
         if scale_key is None:
             return None, None
         scale_info = self.theory.AVAILABLE_SCALES[scale_key]
@@ -632,12 +632,10 @@ def get_numbered_option(
 def get_chord_settings() -> Tuple[Optional[int], Optional[int]]:
     """Standalone chord config — delegates to a temporary UIManager."""
     # Imported here to avoid circular; theory only needed for UIManager
-    theory = MusicTheory()
-    ui = UIManager(theory)
+    ui = UIManager(MusicTheory.shared())
     return ui.select_chord_config()
 
 
 def get_tablature_filter() -> str:
-    theory = MusicTheory()
-    ui = UIManager(theory)
+    ui = UIManager(MusicTheory.shared())
     return ui.prompt_tablature_filter()
@@ -0,0 +1,341 @@
+"""
+voice_leading.py — Globally optimal voice leading over a progression
+====================================================================
+VoiceLeader re-voices each chord greedily against the one before it. The
+VoiceLeadingOptimizer instead picks one voicing per chord for the whole
+progression at once, minimizing the total voice motion plus a small pull
+towards the middle of the keyboard.
+
+Each chord gets up to ``max_candidates`` voicings that keep its bass pitch class
+(so inversions survive), fit the register range, the maximum span and the gap
+allowed between upper voices. A Viterbi pass over the candidates then finds the
+cheapest path, in O(n·k²) for n chords with k candidates each.
+
+For very long or endless progressions, ``stream`` decodes overlapping windows
+and yields voicings as soon as they are final, in constant memory.
+
+The motion costs between the candidates of two chords form a transition matrix.
+Matrices are cached per chord pair, and ``key_table`` precomputes them for
+every pair of chords of a (tonic, scale, extension) context, so voicing any
+progression in that key is one table lookup and one vector minimum per step.
+"""
+
+import heapq
+from collections import deque
+from operator import add, sub
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .caching import CacheInfo, LRUCache, scale_fingerprint
+from .theory_utils import MusicTheory
+from .voicings import iter_voicings
+
+Voicing = Tuple[int, ...]
+# matrix[j][i]: cost from candidate i of the previous chord to candidate j
+CostMatrix = Tuple[Tuple[int, ...], ...]
+
+
+def motion_cost(prev: Sequence[int], curr: Sequence[int]) -> int:
+    """
+    Semitones moved between two ascending voicings, voice by voice. When the
+    chords differ in size the extra voices are compared with the top voice of the
+    smaller chord, as VoiceLeader does for extension notes.
+    """
+    size = max(len(prev), len(curr))
+    return sum(map(abs, map(sub, _padded(prev, size), _padded(curr, size))))
+
+
+def _padded(voicing: Sequence[int], size: int) -> Sequence[int]:
+    """A voicing extended to ``size`` voices by repeating its top voice."""
+    missing = size - len(voicing)
+    return tuple(voicing) + (voicing[-1],) * missing if missing > 0 else voicing
+
+
+# -----------------------------------------------------------------------------
+# Class VoiceLeadingOptimizer
+# -----------------------------------------------------------------------------
+class VoiceLeadingOptimizer:
+    """
+    Minimum-motion voicing of a whole progression by dynamic programming.
+
+    Register defaults follow VoiceLeader's playable range (C2 - C7).
+    """
+
+    DEFAULT_LOW: int = 36  # C2
+    DEFAULT_HIGH: int = 96  # C7
+    DEFAULT_MAX_SPAN: int = 24
+    DEFAULT_MAX_GAP: int = 12
+    DEFAULT_MAX_CANDIDATES: int = 32
+    DEFAULT_WINDOW: int = 32
+    REGISTER_CENTER: int = 60  # Middle C
+    CANDIDATE_CACHE_SIZE: int = 256
+    DEFAULT_MATRIX_CACHE_SIZE: int = 1024
+    DEFAULT_TABLE_CACHE_SIZE: int = 16
+
+    def __init__(
+        self,
+        low: int = DEFAULT_LOW,
+        high: int = DEFAULT_HIGH,
+        max_span: int = DEFAULT_MAX_SPAN,
+        max_gap: int = DEFAULT_MAX_GAP,
+        max_candidates: int = DEFAULT_MAX_CANDIDATES,
+        register_weight: float = 0.1,
+        generator=None,
+        matrix_cache_size: int = DEFAULT_MATRIX_CACHE_SIZE,
+        table_cache_size: int = DEFAULT_TABLE_CACHE_SIZE,
+    ):
+        """
+        Args:
+            low, high: Inclusive MIDI register range of the voicings.
+            max_span: Largest distance between the lowest and highest note.
+            max_gap: Largest distance between two adjacent voices above the bass.
+            max_candidates: Voicings considered per chord (k), closest to the
+                chord's own register first.
+            register_weight: Cost per semitone each note lies from middle C.
+            generator: ChordGenerator used by key_table (default: a shared-theory one).
+            matrix_cache_size: Chord pairs whose transition matrix is cached.
+            table_cache_size: Key contexts whose KeyCostTable is cached.
+        """
+        if max_candidates < 1:
+            raise ValueError(f"max_candidates must be >= 1, got {max_candidates}")
+        self.low = low
+        self.high = high
+        self.max_span = max_span
+        self.max_gap = max_gap
+        self.max_candidates = max_candidates
+        self.register_weight = register_weight
+        self.generator = generator
+        self._candidates = LRUCache(self.CANDIDATE_CACHE_SIZE)
+        self._matrices = LRUCache(matrix_cache_size)
+        self._tables = LRUCache(table_cache_size)
+
+    def candidates(self, notes: Sequence[int]) -> Tuple[Voicing, ...]:
+        """
+        Candidate voicings of a chord given as MIDI notes: the chord's own
+        voicing first, then up to max_candidates - 1 voicings of its pitch
+        classes with the same bass pitch class, nearest to its register.
+        """
+        return self._layer(tuple(sorted(notes)))[0]
+
+    def _layer(self, original: Voicing) -> Tuple[Tuple[Voicing, ...], Tuple[float, ...]]:
+        """Candidates of a chord and their register costs, cached per chord."""
+        layer = self._candidates.get(original)
+        if layer is not None:
+            return layer
+
+        max_gap = self.max_gap
+        center = sum(original) / len(original)
+        voicings = (
+            v.notes
+            for v in iter_voicings(
+                original,
+                low=self.low,
+                high=self.high,
+                max_span=self.max_span,
+                bass_pc=original[0],
+            )
+            if all(b - a <= max_gap for a, b in zip(v.notes[1:], v.notes[2:]))
+            and v.notes != original
+        )
+        nearest = heapq.nsmallest(
+            self.max_candidates - 1,
+            voicings,
+            key=lambda v: (abs(sum(v) / len(v) - center), v[-1] - v[0]),
+        )
+        candidates = (original, *nearest)
+        register = self.REGISTER_CENTER
+        weight = self.register_weight
+        unary = tuple(weight * sum(abs(note - register) for note in v) for v in candidates)
+        layer = (candidates, unary)
+        self._candidates.put(original, layer)
+        return layer
+
+    def transition_matrix(self, prev: Sequence[int], curr: Sequence[int]) -> CostMatrix:
+        """
+        Motion costs between the candidates of two chords: row j, column i is
+        the cost of moving from candidate i of ``prev`` to candidate j of ``curr``.
+        Matrices are kept in an LRU cache per chord pair.
+        """
+        key = (tuple(sorted(prev)), tuple(sorted(curr)))
+        matrix = self._matrices.get(key)
+        if matrix is None:
+            matrix = self._build_matrix(*key)
+            self._matrices.put(key, matrix)
+        return matrix
+
+    def _build_matrix(self, prev: Voicing, curr: Voicing) -> CostMatrix:
+        # Pad both layers to one size so each cost is a plain voice-wise sum
+        size = max(len(prev), len(curr))
+        prev_layer = [_padded(v, size) for v in self._layer(prev)[0]]
+        return tuple(
+            tuple(sum(map(abs, map(sub, p, padded))) for p in prev_layer)
+            for padded in (_padded(v, size) for v in self._layer(curr)[0])
+        )
+
+    def key_table(
+        self,
+        tonic: str,
+        scale_info: Mapping[str, Any],
+        extension_level: int = 2,
+        inversion: int = 0,
+    ) -> "KeyCostTable":
+        """
+        Transition costs between all chords of a key, computed once per
+        (tonic, scale, extension, inversion) and kept in an LRU cache.
+        """
+        cache_key = (tonic, scale_fingerprint(scale_info), extension_level, inversion)
+        table = self._tables.get(cache_key)
+        if table is None:
+            if self.generator is None:
+                # Imported here: generators imports this module for MidiGenerator
+                from .generators import ChordGenerator
+
+                self.generator = ChordGenerator(MusicTheory.shared())
+            chord_set = self.generator.generate_chord_set(
+                tonic, scale_info, extension_level, inversion
+            )
+            table = KeyCostTable(self, [chord.midi_notes for chord in chord_set])
+            self._tables.put(cache_key, table)
+        return table
+
+    def cache_info(self) -> Dict[str, CacheInfo]:
+        """Statistics of the candidate, pair-matrix and key-table caches."""
+        return {
+            "candidates": self._candidates.cache_info(),
+            "matrices": self._matrices.cache_info(),
+            "tables": self._tables.cache_info(),
+        }
+
+    def _decode(
+        self,
+        chords: Sequence[Sequence[int]],
+        start: Optional[Voicing] = None,
+        table: Optional["KeyCostTable"] = None,
+    ) -> List[Voicing]:
+        """Viterbi over non-empty chords, optionally continuing from a fixed voicing."""
+        originals = [tuple(sorted(notes)) for notes in chords]
+        layers = [self._layer(original) for original in originals]
+        matrix = table.matrix if table is not None else self.transition_matrix
+
+        first, unary = layers[0]
+        if start is None:
+            costs = list(unary)
+        else:
+            costs = [u + motion_cost(start, v) for u, v in zip(unary, first)]
+        back: List[List[int]] = []
+        for t in range(1, len(layers)):
+            step_costs: List[float] = []
+            step_back: List[int] = []
+            for row, own in zip(matrix(originals[t - 1], originals[t]), layers[t][1]):
+                totals = list(map(add, costs, row))
+                best = min(totals)
+                step_costs.append(best + own)
+                step_back.append(totals.index(best))
+            costs = step_costs
+            back.append(step_back)
+
+        state = costs.index(min(costs))
+        path = [layers[-1][0][state]]
+        for t in range(len(layers) - 2, -1, -1):
+            state = back[t][state]
+            path.append(layers[t][0][state])
+        path.reverse()
+        return path
+
+    def optimize(
+        self, progression: Sequence[Sequence[int]], table: Optional["KeyCostTable"] = None
+    ) -> List[List[int]]:
+        """
+        Re-voices a whole progression (lists of MIDI notes) for minimal total
+        motion. Empty chords are passed through and do not break the chain.
+        With a key_table, transitions between the key's chords are looked up.
+        """
+        voiced: List[List[int]] = [list(notes) for notes in progression]
+        indices = [i for i, notes in enumerate(voiced) if notes]
+        if indices:
+            path = self._decode([voiced[i] for i in indices], table=table)
+            for i, voicing in zip(indices, path):
+                voiced[i] = list(voicing)
+        return voiced
+
+    def stream(
+        self,
+        progression: Iterable[Sequence[int]],
+        window: int = DEFAULT_WINDOW,
+        table: Optional["KeyCostTable"] = None,
+    ) -> Iterator[List[int]]:
+        """
+        Lazily re-voices a progression of any length. Each window of ``window``
+        chords is decoded from the last voicing already yielded, and its first
+        half is yielded; the second half is decoded again with the next chords.
+        """
+        if window < 2:
+            raise ValueError(f"window must be >= 2, got {window}")
+        commit = window // 2
+        last: Optional[Voicing] = None
+        # Chords waiting to be decoded; empty ones pass through in place
+        buffer: Deque[Sequence[int]] = deque()
+        filled = 0
+
+        def flush(count: int) -> Iterator[List[int]]:
+            nonlocal filled, last
+            path = iter(self._decode([c for c in buffer if c], last, table)) if filled else iter(())
+            while buffer and count > 0:
+                chord = buffer.popleft()
+                if not chord:
+                    yield []
+                    continue
+                last = next(path)
+                filled -= 1
+                count -= 1
+                yield list(last)
+
+        for notes in progression:
+            buffer.append(notes)
+            if notes:
+                filled += 1
+            if filled >= window:
+                yield from flush(commit)
+        yield from flush(len(buffer))
+
+
+# -----------------------------------------------------------------------------
+# Class KeyCostTable
+# -----------------------------------------------------------------------------
+class KeyCostTable:
+    """
+    Transition matrices between the candidates of every pair of chords of one
+    key, precomputed by VoiceLeadingOptimizer.key_table. Chords outside the key
+    fall back to the optimizer's per-pair cache.
+    """
+
+    def __init__(self, optimizer: VoiceLeadingOptimizer, chords: Iterable[Sequence[int]]):
+        self.optimizer = optimizer
+        self.chords: Tuple[Voicing, ...] = tuple(
+            dict.fromkeys(tuple(sorted(notes)) for notes in chords if notes)
+        )
+        self._matrices: Dict[Tuple[Voicing, Voicing], CostMatrix] = {
+            (prev, curr): optimizer._build_matrix(prev, curr)
+            for prev in self.chords
+            for curr in self.chords
+        }
+
+    def __contains__(self, notes: Sequence[int]) -> bool:
+        return tuple(sorted(notes)) in self.chords
+
+    def matrix(self, prev: Voicing, curr: Voicing) -> CostMatrix:
+        """Transition matrix between two sorted chords (see transition_matrix)."""
+        matrix = self._matrices.get((prev, curr))
+        if matrix is None:
+            return self.optimizer.transition_matrix(prev, curr)
+        return matrix
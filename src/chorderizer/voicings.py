@@ -0,0 +1,215 @@
+"""
+voicings.py — Lazy enumeration of chord voicings
+================================================
+ChordGenerator builds one stacked voicing per chord and inversion. This module
+walks every voicing of a chord that fits a register range, a maximum span and
+a note-count limit, yielding them one at a time in ascending (bass first)
+order.
+
+The search is a depth-first walk over the chord's pitches in range. A branch is
+cut as soon as its next note would exceed the span, or when the notes left
+cannot cover the chord tones still missing, so only voicings that are actually
+yielded are ever built. Use itertools.islice to page through the results.
+
+Each voicing is labelled close, drop2, drop3, spread or open.
+"""
+
+from typing import FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .chord_set import ScaleChord
+from .theory_utils import MusicTheory
+
+STYLE_CLOSE = "close"
+STYLE_DROP2 = "drop2"
+STYLE_DROP3 = "drop3"
+STYLE_SPREAD = "spread"
+STYLE_OPEN = "open"
+STYLES: Tuple[str, ...] = (STYLE_CLOSE, STYLE_DROP2, STYLE_DROP3, STYLE_SPREAD, STYLE_OPEN)
+
+
+class Voicing(NamedTuple):
+    """One voicing of a chord: ascending MIDI notes and its style label."""
+
+    notes: Tuple[int, ...]
+    style: str
+
+    @property
+    def span(self) -> int:
+        """Semitones between the lowest and the highest note."""
+        return self.notes[-1] - self.notes[0]
+
+
+def _is_close(notes: List[int]) -> bool:
+    return notes[-1] - notes[0] < 12 and len({n % 12 for n in notes}) == len(notes)
+
+
+def classify_voicing(notes: Tuple[int, ...]) -> str:
+    """
+    Labels ascending MIDI notes with a voicing style.
+
+    close: all notes within an octave, no doublings. drop2/drop3: a close voicing
+    with its 2nd/3rd voice from the top lowered an octave. spread: the bass sits
+    an octave or more below the rest. open: anything else.
+    """
+    notes_list = list(notes)
+    if _is_close(notes_list):
+        return STYLE_CLOSE
+    # Dropping a voice of a close voicing always puts it in the bass
+    if len(notes_list) >= 3:
+        raised = sorted(notes_list[1:] + [notes_list[0] + 12])
+        if _is_close(raised):
+            depth = len(raised) - raised.index(notes_list[0] + 12)
+            if depth == 2:
+                return STYLE_DROP2
+            if depth == 3:
+                return STYLE_DROP3
+    if len(notes_list) >= 2 and notes_list[1] - notes_list[0] >= 12:
+        return STYLE_SPREAD
+    return STYLE_OPEN
+
+
+def iter_voicings(
+    pitch_classes: Iterable[int],
+    low: int = 36,
+    high: int = 96,
+    max_span: int = 24,
+    min_notes: Optional[int] = None,
+    max_notes: Optional[int] = None,
+    optional_pcs: Iterable[int] = (),
+    bass_pc: Optional[int] = None,
+    allow_doublings: bool = False,
+    styles: Optional[Iterable[str]] = None,
+) -> Iterator[Voicing]:
+    """
+    Lazily yields every voicing of a pitch-class set within the given limits.
+
+    Args:
+        pitch_classes: Chord tones as pitch classes (0-11).
+        low, high: Inclusive MIDI register range.
+        max_span: Largest allowed distance between the lowest and highest note.
+        min_notes, max_notes: Note-count limits. max_notes defaults to the number
+            of chord tones (or twice that with doublings).
+        optional_pcs: Chord tones that may be left out (e.g. the 5th).
+        bass_pc: Only yield voicings with this pitch class in the bass.
+        allow_doublings: Allow a pitch class to appear more than once.
+        styles: Only yield voicings with these style labels (see STYLES).
+
+    Voicings come out ordered by bass note, then by the notes above it.
+    """
+    tones: FrozenSet[int] = frozenset(pc % 12 for pc in pitch_classes)
+    if not tones:
+        return
+    required_mask = 0
+    optional = {pc % 12 for pc in optional_pcs}
+    for pc in tones - optional:
+        required_mask |= 1 << pc
+
+    if max_notes is None:
+        max_notes = len(tones) * (2 if allow_doublings else 1)
+    if not allow_doublings:
+        max_notes = min(max_notes, len(tones))
+    if min_notes is None:
+        min_notes = bin(required_mask).count("1")
+    min_notes = max(min_notes, 1)
+
+    wanted = None if styles is None else frozenset(styles)
+    if wanted is not None and wanted <= {STYLE_CLOSE}:
+        max_span = min(max_span, 11)
+
+    candidates = [n for n in range(max(low, 0), min(high, 127) + 1) if n % 12 in tones]
+    n_candidates = len(candidates)
+    notes: List[int] = []
+
+    def extend(start: int, used_mask: int, limit: int) -> Iterator[Voicing]:
+        depth = len(notes)
+        if depth >= min_notes and used_mask & required_mask == required_mask:
+            voicing = tuple(notes)
+            style = classify_voicing(voicing)
+            if wanted is None or style in wanted:
+                yield Voicing(voicing, style)
+        if depth == max_notes:
+            return
+        missing = bin(required_mask & ~used_mask).count("1")
+        for idx in range(start, n_candidates):
+            note = candidates[idx]
+            if note > limit:
+                break
+            bit = 1 << (note % 12)
+            if not allow_doublings and used_mask & bit:
+                continue
+            # Every remaining slot must still be able to cover a missing tone
+            if missing - (1 if bit & required_mask & ~used_mask else 0) > max_notes - depth - 1:
+                continue
+            notes.append(note)
+            yield from extend(idx + 1, used_mask | bit, limit)
+            notes.pop()
+
+    for idx, bass in enumerate(candidates):
+        if bass_pc is not None and bass % 12 != bass_pc % 12:
+            continue
+        notes.append(bass)
+        yield from extend(idx + 1, 1 << (bass % 12), bass + max_span)
+        notes.pop()
+
+
+# -----------------------------------------------------------------------------
+# Class VoicingEnumerator
+# -----------------------------------------------------------------------------
+class VoicingEnumerator:
+    """
+    Enumerates voicings of CHORD_STRUCTURES qualities and generated chords.
+
+    Register and span defaults follow VoiceLeader's playable range (C2 - C7).
+    """
+
+    DEFAULT_LOW: int = 36  # C2
+    DEFAULT_HIGH: int = 96  # C7
+    DEFAULT_MAX_SPAN: int = 24
+
+    def __init__(self, theory: Optional[MusicTheory] = None):
+        self.theory = theory if theory is not None else MusicTheory.shared()
+
+    def chord_pitch_classes(self, root_pc: int, chord_type: str) -> Tuple[int, ...]:
+        """Pitch classes of a chord quality on a root, in stacking order."""
+        intervals = self.theory.CHORD_STRUCTURES.get(chord_type)
+        if intervals is None:
+            raise ValueError(f"Unknown chord type '{chord_type}'.")
+        tones: List[int] = []
+        for interval in intervals:
+            pc = (root_pc + interval) % 12
+            if pc not in tones:
+                tones.append(pc)
+        return tuple(tones)
+
+    def voicings(
+        self,
+        root_pc: int,
+        chord_type: str,
+        low: int = DEFAULT_LOW,
+        high: int = DEFAULT_HIGH,
+        max_span: int = DEFAULT_MAX_SPAN,
+        omit_fifth: bool = False,
+        **limits,
+    ) -> Iterator[Voicing]:
+        """
+        Lazily yields the voicings of a chord quality on a root.
+
+        omit_fifth makes the perfect fifth optional; other keyword arguments are
+        passed to iter_voicings.
+        """
+        tones = self.chord_pitch_classes(root_pc, chord_type)
+        optional = set(limits.pop("optional_pcs", ()))
+        if omit_fifth:
+            optional.add((root_pc + 7) % 12)
+        return iter_voicings(
+            tones,
+            low=low,
+            high=high,
+            max_span=max_span,
+            optional_pcs=optional,
+            **limits,
+        )
+
+    def voicings_for_chord(self, chord: ScaleChord, **limits) -> Iterator[Voicing]:
+        """Lazily yields the voicings of a chord from a generated ScaleChordSet."""
+        return self.voicings(chord.root_pc, chord.chord_type, **limits)
@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_cache_dir(tmp_path_factory):
+    """Keep compiled catalogs (and user scale packs) out of the user's directories."""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("CHORDERIZER_CACHE_DIR", str(tmp_path_factory.mktemp("chorderizer-cache")))
+    mp.setenv("CHORDERIZER_PACKS_DIR", str(tmp_path_factory.mktemp("chorderizer-packs")))
+    yield
+    mp.undo()
@@ -0,0 +1,74 @@
+"""
+test_caching.py — Tests for the LRU cache and scale fingerprints.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.modules["mido"] = MagicMock()
+
+from chorderizer.caching import LRUCache, scale_fingerprint  # noqa: E402
+from chorderizer.generators import ChordGenerator  # noqa: E402
+from chorderizer.theory_utils import MusicTheory, MusicTheoryUtils  # noqa: E402
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the oldest
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.maxsize, info.currsize) == (1, 1, 1, 2, 2)
+
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 0, 2, 0)
+
+
+def test_lru_cache_size_zero_and_invalid():
+    cache = LRUCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=-1)
+
+
+def test_scale_fingerprint_tracks_content():
+    theory = MusicTheory()
+    major = theory.AVAILABLE_SCALES["1"]
+    assert scale_fingerprint(major) == scale_fingerprint(MusicTheoryUtils.thaw(major))
+
+    altered = MusicTheoryUtils.thaw(major)
+    altered["degrees"]["V"]["display_suffix"] = "7sus4"
+    assert scale_fingerprint(altered) != scale_fingerprint(major)
+
+
+def test_generator_cache_distinguishes_same_named_scales():
+    theory = MusicTheory()
+    generator = ChordGenerator(theory, cache_size=4)
+    major = MusicTheoryUtils.thaw(theory.AVAILABLE_SCALES["1"])
+    minor = MusicTheoryUtils.thaw(theory.AVAILABLE_SCALES["2"])
+    minor["name"] = major["name"]
+
+    assert generator.generate_chord_set("C", major)["I"].name == "Cmaj7"
+    assert generator.generate_chord_set("C", minor)["i"].name == "Cm7"
+    assert generator.generate_chord_set("C", major)["I"].name == "Cmaj7"
+    assert generator.cache_info().hits == 1
+    assert generator.cache_info().misses == 2
+
+
+def test_generator_cache_is_bounded():
+    theory = MusicTheory()
+    generator = ChordGenerator(theory, cache_size=3)
+    scale_info = theory.AVAILABLE_SCALES["1"]
+    for tonic in theory.CHROMATIC_NOTES:
+        generator.generate_chord_set(tonic, scale_info)
+
+    info = generator.cache_info()
+    assert info.currsize == 3
+    assert info.evictions == len(theory.CHROMATIC_NOTES) - 3
@@ -0,0 +1,89 @@
+"""
+test_catalog.py — Tests for the compiled scale catalog cache.
+"""
+
+import json
+import os
+
+from chorderizer import catalog
+from chorderizer.theory_utils import MusicTheory
+
+SCALES = {
+    "1": {
+        "name": "Test Major",
+        "tonic_suffix": "",
+        "degrees": {
+            "I": {
+                "root_interval": 0,
+                "base_quality": "major",
+                "full_quality": "maj7",
+                "display_suffix": "maj7",
+            },
+            "V": {
+                "root_interval": 7,
+                "base_quality": "major",
+                "full_quality": "dom7",
+                "display_suffix": "7",
+            },
+        },
+    }
+}
+
+
+def _write_scales(path, scales):
+    path.write_text(json.dumps(scales), encoding="utf-8")
+
+
+def test_compile_scales_derives_tables():
+    compiled = catalog.compile_scales(SCALES)
+    assert compiled["intervals"]["1"] == (0, 7)
+    assert compiled["masks"]["1"][0] == 0b000010000001
+    assert compiled["masks"]["1"][5] == (1 << 5) | (1 << 0)
+    assert compiled["qualities"]["1"][1] == ("V", 7, "major", "dom7", "7")
+
+
+def test_load_catalog_uses_cache(tmp_path, monkeypatch):
+    source = tmp_path / "scales.json"
+    _write_scales(source, SCALES)
+    cache_dir = tmp_path / "cache"
+
+    first = catalog.load_catalog(str(source), str(cache_dir))
+    assert len(os.listdir(cache_dir)) == 1
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("cache hit should not recompile")
+
+    monkeypatch.setattr(catalog, "compile_scales", _fail)
+    second = catalog.load_catalog(str(source), str(cache_dir))
+    assert second == first
+
+    # Touching the file without changing its content is resolved by the hash
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert catalog.load_catalog(str(source), str(cache_dir)) == first
+
+
+def test_load_catalog_invalidates_on_change(tmp_path):
+    source = tmp_path / "scales.json"
+    cache_dir = tmp_path / "cache"
+    _write_scales(source, SCALES)
+    catalog.load_catalog(str(source), str(cache_dir))
+
+    changed = json.loads(json.dumps(SCALES))
+    changed["1"]["name"] = "Renamed Major"
+    _write_scales(source, changed)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert catalog.load_catalog(str(source), str(cache_dir))["scales"]["1"]["name"] == (
+        "Renamed Major"
+    )
+
+
+def test_music_theory_reads_custom_catalog(tmp_path):
+    source = tmp_path / "scales.json"
+    _write_scales(source, SCALES)
+    theory = MusicTheory(scales_path=str(source), cache_dir=str(tmp_path / "cache"))
+    assert list(theory.AVAILABLE_SCALES) == ["1"]
+    assert theory.scale_pitch_classes("1", 2) == frozenset({2, 9})
+    assert theory.scale_degree_table("1")[0][0] == "I"
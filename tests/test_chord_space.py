@@ -0,0 +1,60 @@
+"""
+test_chord_space.py — Tests for the memory-mapped chord space table.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+sys.modules["mido"] = MagicMock()
+
+from chorderizer.chord_space import (  # noqa: E402
+    ChordSpaceTable,
+    build_chord_space,
+    open_chord_space,
+)
+from chorderizer.generators import ChordGenerator  # noqa: E402
+from chorderizer.theory_utils import MusicTheory, MusicTheoryUtils  # noqa: E402
+
+
+def test_chord_space_matches_live_generation(tmp_path):
+    theory = MusicTheory()
+    path = build_chord_space(str(tmp_path / "space.bin"), theory)
+    table = ChordSpaceTable(path)
+    live = ChordGenerator(theory)
+    try:
+        for tonic in theory.CHROMATIC_NOTES:
+            for scale_key, scale_info in theory.AVAILABLE_SCALES.items():
+                for ext in range(6):
+                    for inv in range(4):
+                        expected = live.generate_chord_set(tonic, scale_info, ext, inv)
+                        assert table.lookup(tonic, scale_key, ext, inv) == expected
+        assert table.lookup("Db", "1", 2, 0) is None  # Only canonical tonic spellings
+        assert table.lookup("C", "1", 9, 0) is None
+    finally:
+        table.close()
+
+
+def test_generator_uses_chord_space_with_custom_fallback(tmp_path):
+    theory = MusicTheory()
+    table = open_chord_space(theory, path=str(tmp_path / "space.bin"))
+    assert table is not None
+    generator = ChordGenerator(theory, chord_space=table)
+
+    chords, _, midi, _ = generator.generate_scale_chords("D", theory.AVAILABLE_SCALES["1"], 2, 0)
+    assert chords["I"] == "Dmaj7"
+
+    custom = MusicTheoryUtils.thaw(theory.AVAILABLE_SCALES["1"])
+    custom["degrees"]["I"]["display_suffix"] = "Δ7"
+    chords, _, _, _ = generator.generate_scale_chords("D", custom, 2, 0)
+    assert chords["I"] == "DΔ7"
+    table.close()
+
+
+def test_open_chord_space_without_build(tmp_path):
+    assert open_chord_space(path=str(tmp_path / "missing.bin"), build=False) is None
+
+
+def test_open_chord_space_rejects_foreign_file(tmp_path):
+    bogus = tmp_path / "space.bin"
+    bogus.write_bytes(b"not a chord space" * 8)
+    assert open_chord_space(path=str(bogus)) is None
@@ -0,0 +1,71 @@
+"""
+test_chord_symbols.py — Tests for the chord-symbol parser.
+"""
+
+import pytest
+
+from chorderizer.chord_symbols import parse_chord_chart, parse_chord_symbol
+
+
+@pytest.mark.parametrize(
+    "symbol, root_pc, quality, alterations, bass_pc, intervals",
+    [
+        ("F#m7b5/C", 6, "halfdim7", (), 0, (0, 3, 6, 10)),
+        ("Bb13(#11)", 10, "dom13", ("#11",), None, (0, 4, 7, 10, 14, 18, 21)),
+        ("Dsus4", 2, "sus4", (), None, (0, 5, 7)),
+        ("C", 0, "major", (), None, (0, 4, 7)),
+        ("Am/G", 9, "minor", (), 7, (0, 3, 7)),
+        ("E7(b9,#11)", 4, "dom7", ("b9", "#11"), None, (0, 4, 7, 10, 13, 18)),
+        ("Cadd9", 0, "major", ("add9",), None, (0, 4, 7, 14)),
+        ("G7b5", 7, "dom7", ("b5",), None, (0, 4, 6, 10)),
+        ("C7omit5", 0, "dom7", ("omit5",), None, (0, 4, 10)),
+        ("EbΔ7", 3, "maj7", (), None, (0, 4, 7, 11)),
+        ("Cm(maj7)", 0, "minMaj7", (), None, (0, 3, 7, 11)),
+        ("Bø", 11, "halfdim7", (), None, (0, 3, 6, 10)),
+        ("Ab+", 8, "augmented", (), None, (0, 4, 8)),
+        ("C5", 0, "major", ("omit3",), None, (0, 7)),
+        ("C7sus4", 0, "dom7", ("omit3", "add4"), None, (0, 5, 7, 10)),
+        ("C9sus4", 0, "dom9", ("omit3", "add4"), None, (0, 5, 7, 10, 14)),
+        ("C7alt", 0, "dom7", ("b5", "#5", "b9", "#9"), None, (0, 4, 6, 8, 10, 13, 15)),
+        ("C6/9", 0, "major6", ("add9",), None, (0, 4, 7, 9, 14)),
+        ("Cm6/9", 0, "minor6", ("add9",), None, (0, 3, 7, 9, 14)),
+        ("C6/9/E", 0, "major6", ("add9",), 4, (0, 4, 7, 9, 14)),
+        ("C13b9", 0, "dom13", ("b9",), None, (0, 4, 7, 10, 13, 21)),
+        ("C9#9", 0, "dom9", ("#9",), None, (0, 4, 7, 10, 15)),
+        ("C13(#11)", 0, "dom13", ("#11",), None, (0, 4, 7, 10, 14, 18, 21)),
+        ("C9addb9", 0, "dom9", ("addb9",), None, (0, 4, 7, 10, 13, 14)),
+    ],
+)
+def test_parse_chord_symbol(symbol, root_pc, quality, alterations, bass_pc, intervals):
+    parsed = parse_chord_symbol(symbol)
+    assert parsed.root_pc == root_pc
+    assert parsed.quality == quality
+    assert parsed.alterations == alterations
+    assert parsed.bass_pc == bass_pc
+    assert parsed.intervals == intervals
+
+
+def test_parse_chord_symbol_case_matters():
+    assert parse_chord_symbol("CM7").quality == "maj7"
+    assert parse_chord_symbol("Cm7").quality == "min7"
+
+
+@pytest.mark.parametrize("symbol", ["", "H7", "Cxyz", "C/Q", "C8", "C(b9", "Cb9)", "C7/9"])
+def test_parse_chord_symbol_rejects_invalid(symbol):
+    with pytest.raises(ValueError):
+        parse_chord_symbol(symbol)
+
+
+def test_parse_chord_symbol_is_interned():
+    assert parse_chord_symbol("F#m7b5/C") is parse_chord_symbol("F#m7b5/C")
+
+
+def test_pitch_classes_bass_first():
+    assert parse_chord_symbol("C/E").pitch_classes == (4, 0, 7)
+
+
+def test_parse_chord_chart():
+    chart = parse_chord_chart("| Dm7 G7 | Cmaj7 % | A7b9 |")
+    assert [c.symbol for c in chart] == ["Dm7", "G7", "Cmaj7", "Cmaj7", "A7b9"]
+    assert chart[3] is chart[2]
+    assert parse_chord_chart(["C", "G/B"])[1].bass == "B"
@@ -107,4 +107,4 @@ def test_process_single_run_missing_chord_settings():
 
     assert result is True
     ui_mock.select_chord_config.assert_called_once()
-    chord_builder_mock.generate_scale_chords.assert_not_called()
+    chord_builder_mock.generate_chord_set.assert_not_called()
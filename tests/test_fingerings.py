@@ -0,0 +1,124 @@
+"""
+test_fingerings.py — Tests for the guitar fingering search.
+"""
+
+from itertools import product
+
+from chorderizer.fingerings import (
+    STANDARD_TUNING,
+    FingeringPlanner,
+    FingeringSearch,
+    FretboardIndex,
+    hand_movement,
+)
+from chorderizer.generators import TablatureGenerator
+
+
+def test_fretboard_index_positions():
+    index = FretboardIndex(STANDARD_TUNING, max_fret=12)
+    assert index.positions(40) == ((0, 0),)
+    assert index.positions(64) == ((3, 9), (4, 5), (5, 0))
+    assert index.frets(1, 0) == (3,)
+
+
+def test_open_chords_rank_first():
+    search = FingeringSearch()
+    assert search.fingerings([0, 4, 7], root_pc=0)[0].shape == "x32010"
+    assert search.fingerings([7, 11, 2], root_pc=7)[0].shape == "320003"
+    assert search.fingerings([4, 8, 11], root_pc=4)[0].shape == "022100"
+    assert search.fingerings([5, 9, 0], root_pc=5)[0].shape == "133211"
+
+
+def test_fingerings_are_playable():
+    search = FingeringSearch(max_span=3)
+    fingerings = search.fingerings([0, 4, 7, 11], root_pc=0, bass_pc=4)
+    assert fingerings
+    scores = [f.score for f in fingerings]
+    assert scores == sorted(scores)
+    for fingering in fingerings:
+        assert fingering.span <= 3
+        assert min(fingering.notes) % 12 == 4
+        assert {n % 12 for n in fingering.notes} == {0, 4, 7, 11}
+
+
+def test_bass_is_the_lowest_sounding_note():
+    # C6: an open G or A below the fretted C would put another note in the bass
+    fingerings = FingeringSearch().fingerings_for_notes([60, 64, 67, 69], root_pc=0)
+    assert fingerings
+    assert all(min(f.notes) % 12 == 0 for f in fingerings)
+    shapes = {f.shape for f in fingerings}
+    assert "x-x-10-0-10-0" not in shapes and "807080" not in shapes
+
+
+def test_fifth_dropped_only_when_needed_and_cached():
+    search = FingeringSearch()
+    thirteenth = [0, 4, 7, 10, 2, 5, 9]
+    assert search.fingerings(thirteenth, root_pc=0, omit_fifth=False) == ()
+    fingerings = search.fingerings(thirteenth, root_pc=0)
+    assert fingerings and all(7 not in {n % 12 for n in f.notes} for f in fingerings)
+    assert search.fingerings(thirteenth, root_pc=0) is fingerings
+    assert search.cache_info().hits == 1
+
+    shells = search.fingerings([7, 11, 2, 5], root_pc=7, omit_fifth=True)
+    assert any(2 not in {n % 12 for n in f.notes} for f in shells)
+
+
+def test_tablature_fingering_tab():
+    tab = TablatureGenerator().generate_fingering_tab("C", [48, 52, 55, 60, 64])
+    assert tab[0].startswith("Chord: C (x32010, 1/")
+    assert tab[1:] == [
+        "e1|---0--|",
+        "B2|---1--|",
+        "G3|---0--|",
+        "D4|---2--|",
+        "A5|---3--|",
+        "E6|---x--|",
+    ]
+    assert TablatureGenerator().generate_fingering_tab("Empty", []) == []
+
+
+def _total_cost(path, move_weight=1.0):
+    return sum(f.score for f in path) + move_weight * sum(
+        hand_movement(a, b) for a, b in zip(path, path[1:])
+    )
+
+
+def test_planner_finds_the_cheapest_path():
+    planner = FingeringPlanner(max_candidates=6)
+    chords = [([48, 52, 55], 0), ([45, 49, 52], 9), ([50, 54, 57], 2), ([47, 51, 54], 11)]
+    plan = planner.plan(chords)
+    layers = [planner.candidates(notes, root) for notes, root in chords]
+    best = min(_total_cost(path) for path in product(*layers))
+    assert abs(_total_cost(plan) - best) < 1e-9
+    # Chord by chord, the best shapes would jump around the neck
+    assert _total_cost(plan) <= _total_cost([layer[0] for layer in layers])
+
+
+def test_planner_skips_unplayable_chords():
+    planner = FingeringPlanner()
+    plan = planner.plan([([48, 52, 55], 0), ([], None), ([43, 47, 50], 7)])
+    assert plan[1] is None
+    assert plan[0].shape == "x32010" and plan[2].shape == "320003"
+    assert planner.plan([]) == []
+
+
+def test_progression_tab_sheet():
+    tab_gen = TablatureGenerator()
+    chords = [("C", [48, 52, 55], 0), ("G", [43, 47, 50], None), ("Am", [45, 48, 52], None)]
+    sheet = tab_gen.generate_progression_tab(chords)
+    assert sheet == [
+        "     C  G  Am",
+        "e1|--0--3--0--|",
+        "B2|--1--0--1--|",
+        "G3|--0--0--2--|",
+        "D4|--2--0--2--|",
+        "A5|--3--2--0--|",
+        "E6|--x--3--x--|",
+    ]
+
+    long_sheet = tab_gen.generate_progression_tab(chords * 20, width=40)
+    assert max(len(line) for line in long_sheet) <= 40
+    name_rows = [line for line in long_sheet if line.startswith("     ")]
+    assert len(name_rows) > 1
+    assert sum(len(row.split()) for row in name_rows) == 60
+    assert tab_gen.generate_progression_tab([]) == []
@@ -1,6 +1,8 @@
 import sys
 from unittest.mock import MagicMock
 
+import pytest
+
 # Mock external dependencies
 sys.modules["mido"] = MagicMock()
 
@@ -94,10 +96,77 @@ def test_chord_generator_caching():
     # Results should be equal in value
     assert res1 == res2
 
-    # But they should NOT be the exact same object (because of copy.deepcopy)
+    # But they should NOT be the exact same object (as_dicts builds fresh dicts)
     assert id(res1[0]) != id(res2[0])
 
 
+def test_chord_set_cache_hit_is_shared_and_immutable():
+    theory = MusicTheory()
+    generator = ChordGenerator(theory)
+    scale_info = theory.AVAILABLE_SCALES["1"]
+
+    first = generator.generate_chord_set("C", scale_info)
+    assert generator.generate_chord_set("C", scale_info) is first
+    assert first["V"].name == "G7"
+    assert first["V"].midi_notes == (55, 59, 62, 65)
+    assert first.degrees[0] == "I"
+
+    with pytest.raises(AttributeError):
+        first["I"].name = "X"
+    with pytest.raises(AttributeError):
+        first.chords = ()
+
+    # The legacy view is detached from the shared result
+    names, _, midi, _ = first.as_dicts()
+    midi["I"].append(0)
+    names["I"] = "X"
+    assert first["I"].name == "Cmaj7"
+    assert 0 not in first["I"].midi_notes
+
+
+def test_inversion_change_reuses_scale_plan(monkeypatch):
+    from chorderizer import generators
+
+    theory = MusicTheory()
+    generator = ChordGenerator(theory, cache_size=0)
+    scale_info = theory.AVAILABLE_SCALES["1"]
+    expected = [
+        ChordGenerator(theory).generate_chord_set("D", scale_info, ext, inv)
+        for ext in (0, 2)
+        for inv in range(3)
+    ]
+
+    spelled = []
+    real_key_spelling = generators.key_spelling
+    monkeypatch.setattr(
+        generators, "key_spelling", lambda *a: spelled.append(a) or real_key_spelling(*a)
+    )
+    resolved = []
+    real_resolve = generator._resolve_degree
+    monkeypatch.setattr(
+        generator, "_resolve_degree", lambda *a: resolved.append(a) or real_resolve(*a)
+    )
+
+    results = [
+        generator.generate_chord_set("D", scale_info, ext, inv)
+        for ext in (0, 2)
+        for inv in range(3)
+    ]
+    assert results == expected
+    assert len(spelled) == 1
+    assert len(resolved) == 2 * len(scale_info["degrees"])
+
+
+def test_chord_set_pickles():
+    import pickle
+
+    theory = MusicTheory()
+    chord_set = ChordGenerator(theory).generate_chord_set("Eb", theory.AVAILABLE_SCALES["2"], 3, 1)
+    restored = pickle.loads(pickle.dumps(chord_set))  # noqa: S301
+    assert restored == chord_set
+    assert restored["i"].note_names == chord_set["i"].note_names
+
+
 # -----------------------------------------------------------------------------
 # VoiceLeader Tests
 # -----------------------------------------------------------------------------
@@ -139,6 +208,34 @@ def test_voice_leader_range_guard():
     assert all(VoiceLeader.MIDI_MIN <= n <= VoiceLeader.MIDI_MAX for n in voiced)
 
 
+def test_voice_leader_apply_batch_matches_scalar_chaining():
+    """apply_batch gives what chaining apply() chord by chord gives."""
+    np = pytest.importorskip("numpy")
+    progressions = [
+        [[60, 64, 67, 71], [65, 69, 72, 76], [], [55, 59, 62, 65, 69], [48, 52, 55]],
+        [[36, 40, 43], [90, 94, 97], [38, 42, 45, 48, 52, 55], [62, 66, 69]],
+        [[], [57, 60, 64], [59, 62, 65, 69]],
+    ]
+    voiced = VoiceLeader.apply_batch(progressions)
+    assert voiced.shape == (3, 5, 6)
+
+    for batch_row, progression in zip(voiced, progressions):
+        prev = None
+        for row, chord in zip(batch_row, progression):
+            expected = list(chord)
+            if chord and prev is not None:
+                expected = VoiceLeader.apply(prev, chord)
+            if chord:
+                prev = expected
+            assert [int(n) for n in row if n >= 0] == expected
+
+    # Arrays in ChordBatch layout go through unchanged in shape
+    array = np.full((2, 2, 4), -1)
+    array[:, 0, :3] = [60, 64, 67]
+    array[:, 1, :3] = [65, 69, 72]
+    assert VoiceLeader.apply_batch(array)[:, 1, :3].tolist() == [[65, 69, 72]] * 2
+
+
 # -----------------------------------------------------------------------------
 # TablatureGenerator Tests
 # -----------------------------------------------------------------------------
@@ -186,3 +283,67 @@ def test_generate_simple_tab_too_high_notes():
     assert len(tab_lines) == 7
     for line in tab_lines[1:]:
         assert "|------|" in line
+
+
+def test_generators_share_theory_by_default():
+    assert ChordGenerator().theory is MusicTheory.shared()
+    assert TablatureGenerator().theory is MusicTheory.shared()
+
+
+# -----------------------------------------------------------------------------
+# Batch generation Tests
+# -----------------------------------------------------------------------------
+def test_generate_batch_matches_scalar_generation():
+    np = pytest.importorskip("numpy")
+    theory = MusicTheory()
+    generator = ChordGenerator(theory)
+    scale_keys = list(theory.AVAILABLE_SCALES)
+
+    tonics, scales, exts, invs = [], [], [], []
+    for tonic in range(12):
+        for scale_key in scale_keys:
+            for ext in range(6):
+                for inv in range(4):
+                    tonics.append(tonic)
+                    scales.append(scale_key)
+                    exts.append(ext)
+                    invs.append(inv)
+
+    batch = generator.generate_batch(tonics, scales, exts, invs)
+    assert batch.midi.shape[0] == len(tonics)
+
+    codes = generator.chord_type_codes
+    for row in range(len(tonics)):
+        tonic_name = theory.CHROMATIC_NOTES[tonics[row]]
+        scale_info = theory.AVAILABLE_SCALES[scales[row]]
+        _, _, midi, _ = generator.generate_scale_chords(
+            tonic_name, scale_info, exts[row], invs[row]
+        )
+        for d_idx, degree in enumerate(scale_info["degrees"]):
+            count = batch.note_counts[row, d_idx]
+            assert batch.midi[row, d_idx, :count].tolist() == midi[degree]
+            assert np.all(batch.midi[row, d_idx, count:] == -1)
+            assert codes[batch.chord_types[row, d_idx]] in theory.CHORD_STRUCTURES
+
+
+def test_generate_batch_broadcasts_and_pads():
+    pytest.importorskip("numpy")
+    generator = ChordGenerator(MusicTheory())
+    batch = generator.generate_batch(["C", "D"], "10", extension_levels=0)
+    # Major Pentatonic has 5 degrees; slots past that are empty
+    assert batch.chord_types.shape[0] == 2
+    assert (batch.chord_types[:, 5:] == -1).all()
+    assert (batch.roots[:, 5:] == -1).all()
+    assert batch.midi[1, 0, :3].tolist() == [62, 66, 69]  # D major triad
+    with pytest.raises(ValueError):
+        generator.generate_batch([0], ["no-such-scale"])
+
+
+def test_generate_batch_tables_built_on_first_call():
+    pytest.importorskip("numpy")
+    generator = ChordGenerator(MusicTheory())
+    assert generator._batch_tables is None
+    generator.generate_batch([0], "1")
+    tables = generator._batch_tables
+    generator.generate_batch([2], "1")
+    assert generator._batch_tables is tables
@@ -0,0 +1,71 @@
+"""
+test_instruments.py — Tests for the tuning registry and per-tuning tables.
+"""
+
+import pytest
+
+from chorderizer.fingerings import STANDARD_TUNING
+from chorderizer.generators import TablatureGenerator
+from chorderizer.instruments import (
+    DEFAULT_TUNING,
+    TUNINGS,
+    fingering_search,
+    fretboard_index,
+    get_tuning,
+)
+
+
+def test_registry():
+    assert TUNINGS[DEFAULT_TUNING].open_strings == STANDARD_TUNING
+    assert get_tuning("guitar_drop_d").strings[0] == 38
+    assert len(get_tuning("guitar_7_string").strings) == 7
+    assert len(get_tuning("guitar_8_string").strings) == 8
+    assert get_tuning("bass_4").strings == (28, 33, 38, 43)
+    with pytest.raises(ValueError):
+        get_tuning("banjo")
+
+
+def test_capo():
+    tuning = get_tuning("guitar_standard", capo=2)
+    assert tuning.open_strings == tuple(n + 2 for n in STANDARD_TUNING)
+    assert tuning.label == "Guitar (Standard) (capo 2)"
+    assert get_tuning().label == "Guitar (Standard)"
+    with pytest.raises(ValueError):
+        get_tuning("guitar_standard", capo=13)
+
+
+def test_tables_are_built_once_per_tuning():
+    drop_d = get_tuning("guitar_drop_d")
+    assert fretboard_index(drop_d) is fretboard_index(get_tuning("guitar_drop_d"))
+    assert fingering_search(drop_d) is fingering_search(drop_d)
+    assert fingering_search(drop_d) is not fingering_search(get_tuning())
+    index = fretboard_index(drop_d)
+    assert index.positions(38) == ((0, 0),)
+    assert index.pitches[0][:3] == (38, 39, 40)
+
+
+def test_fingerings_follow_the_tuning():
+    # D5 power chord on the open drop-D bass string
+    d_major = fingering_search(get_tuning("guitar_drop_d")).fingerings([2, 6, 9], root_pc=2)
+    assert d_major[0].frets[0] == 0
+
+    bass = fingering_search(get_tuning("bass_4")).fingerings([0, 4, 7], root_pc=0)
+    assert bass and all(f.notes[0] % 12 == 0 for f in bass)
+
+    # Re-entrant ukulele: C major is 0003, the bass is the open C string
+    ukulele = fingering_search(get_tuning("ukulele")).fingerings([0, 4, 7], root_pc=0)
+    assert ukulele[0].shape == "0003"
+    assert all(min(f.notes) % 12 == 0 for f in ukulele)
+
+
+def test_tablature_uses_the_tuning():
+    tab_gen = TablatureGenerator(tuning=get_tuning("guitar_7_string"))
+    lines = tab_gen.generate_fingering_tab("E5", [40, 47, 52])
+    assert [line.split("|")[0].strip() for line in lines[1:]] == [
+        "e1", "B2", "G3", "D4", "A5", "E6", "B7"
+    ]  # fmt: skip
+
+    tab_gen.set_tuning(get_tuning("bass_4"))
+    lines = tab_gen.generate_fingering_tab("C", [36, 40, 43])
+    assert len(lines) == 5
+    assert lines[-1].startswith("E4")
@@ -0,0 +1,78 @@
+"""
+test_parallel.py — Tests for process-pool batch generation.
+"""
+
+import pytest
+
+from chorderizer.generators import ChordGenerator
+from chorderizer.parallel import GenerationRequest, generate_parallel, make_executor
+from chorderizer.theory_utils import MusicTheory, MusicTheoryUtils
+
+
+def _requests(theory):
+    scales = theory.AVAILABLE_SCALES
+    return [
+        GenerationRequest(tonic, key, ext, inv)
+        for tonic in ("C", "Eb", "F#")
+        for key in list(scales)[:3]
+        for ext in (0, 2)
+        for inv in (0, 1)
+    ]
+
+
+def test_generate_parallel_matches_serial_in_order():
+    theory = MusicTheory()
+    generator = ChordGenerator(theory)
+    requests = _requests(theory)
+    expected = [
+        generator.generate_chord_set(
+            r.tonic, theory.AVAILABLE_SCALES[r.scale], r.extension_level, r.inversion
+        )
+        for r in requests
+    ]
+    assert list(generator.generate_parallel(iter(requests), max_workers=2, chunksize=5)) == expected
+
+
+def test_generate_parallel_unordered_and_custom_scales():
+    theory = MusicTheory()
+    custom = MusicTheoryUtils.thaw(theory.AVAILABLE_SCALES["1"])
+    custom["name"] = "Custom Major"
+    requests = [("D", theory.AVAILABLE_SCALES["2"]), ("G", custom, 0)] * 4
+
+    with make_executor(theory, max_workers=2) as executor:
+        results = dict(
+            generate_parallel(requests, theory, chunksize=3, ordered=False, executor=executor)
+        )
+    assert sorted(results) == list(range(len(requests)))
+    assert results[0].tonic == "D"
+    assert results[1].scale_name == "Custom Major"
+    assert results[1].names()["I"] == "G"
+
+
+def test_generate_parallel_rejects_bad_chunksize():
+    with pytest.raises(ValueError):
+        generate_parallel([], MusicTheory(), chunksize=0)
+
+
+def test_in_flight_window_follows_the_pool_size(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from chorderizer import parallel
+
+    windows = []
+
+    def fake_stream(executor, chunks, max_in_flight):
+        windows.append(max_in_flight)
+        return iter(())
+
+    monkeypatch.setattr(parallel, "_stream_ordered", fake_stream)
+    theory = MusicTheory()
+    with make_executor(theory, max_workers=3) as executor:
+        list(generate_parallel([], theory, executor=executor))
+        list(generate_parallel([], theory, executor=executor, max_in_flight=1))
+    # Executors from elsewhere are never narrowed to a single chunk
+    with ThreadPoolExecutor(4) as executor:
+        list(generate_parallel([], theory, max_workers=4, executor=executor))
+    assert windows == [3 * parallel.PREFETCH_PER_WORKER, 1, 4 * parallel.PREFETCH_PER_WORKER]
+    with pytest.raises(ValueError):
+        generate_parallel([], theory, max_in_flight=0)
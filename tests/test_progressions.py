@@ -0,0 +1,117 @@
+"""
+test_progressions.py — Tests for generated chord progressions.
+"""
+
+import itertools
+import json
+
+import pytest
+
+from chorderizer.progressions import (
+    MarkovProgression,
+    ProgressionSearch,
+    transition_scorer,
+    voice_leading_score,
+)
+from chorderizer.theory_utils import MusicTheory
+
+MATRIX = {
+    "start": {"I": 1},
+    "transitions": {"I": {"IV": 1, "5": 1}, "IV": {"V": 1}, "V": {"1": 3, "vi": 1}},
+}
+
+
+def test_markov_is_seeded_and_bounded():
+    major = MusicTheory().AVAILABLE_SCALES["1"]
+    first = list(MarkovProgression(major, seed=7).degree_names(32))
+    assert len(first) == 32
+    assert first == list(MarkovProgression(major, seed=7).degree_names(32))
+    # The default matrix never repeats a degree
+    assert all(a != b for a, b in zip(first, first[1:]))
+
+
+def test_markov_follows_json_matrix(tmp_path):
+    path = tmp_path / "matrix.json"
+    path.write_text(json.dumps(MATRIX), encoding="utf-8")
+    major = MusicTheory().AVAILABLE_SCALES["1"]
+    walk = list(MarkovProgression.from_json(str(path), major, seed=3).degree_names(200))
+
+    assert walk[0] == "I"
+    allowed = {"I": {"IV", "V"}, "IV": {"V"}, "V": {"I", "vi"}, "vi": {"I"}}
+    for a, b in zip(walk, walk[1:]):
+        assert b in allowed[a]  # vi is a dead end and restarts on I
+
+
+def test_markov_streams_chords():
+    theory = MusicTheory()
+    numbered = {"1": {"4": 2, "6": 1}, "4": {"5": 1}, "5": {"1": 1}, "6": {"4": 1}}
+    progression = MarkovProgression(theory.AVAILABLE_SCALES["2"], numbered, seed=1)
+    chords = list(itertools.islice(progression.chords("A", extension_level=0), 10))
+    assert len(chords) == 10
+    assert chords[0].name == "Am"
+    assert {c.name for c in chords} <= {"Am", "Dm", "Em", "F"}
+
+
+def test_markov_rejects_invalid_matrices():
+    major = MusicTheory().AVAILABLE_SCALES["1"]
+    with pytest.raises(ValueError):
+        MarkovProgression(major, {"IX": {"I": 1}})
+    with pytest.raises(ValueError):
+        MarkovProgression(major, {"I": {"V": -1}})
+    with pytest.raises(ValueError):
+        MarkovProgression(major, start={"I": 0})
+    with pytest.raises(ValueError):
+        MarkovProgression.from_json({"start": {"I": 1}}, major)
+
+
+def _dorian():
+    theory = MusicTheory()
+    return next(s for s in theory.AVAILABLE_SCALES.values() if s["name"] == "Dorian")
+
+
+def test_search_respects_constraints_and_ranks():
+    results = ProgressionSearch(beam_width=16).search(
+        "D", _dorian(), 8, start=["i"], end=["V", "i"], top_n=3
+    )
+    assert len(results) == 3
+    assert [r.score for r in results] == sorted((r.score for r in results), reverse=True)
+    for result in results:
+        assert len(result.chords) == 8
+        assert result.degrees[0] == "i"
+        # Dorian's fifth degree is minor; "V" is the major dominant borrowed for the cadence
+        assert result.degrees[-2:] == ("V", "i")
+        assert result.names[-2:] == ("A7", "Dm7")
+        assert all(a != b for a, b in zip(result.degrees, result.degrees[1:]))
+        expected = sum(
+            voice_leading_score(prev, chord, 0, 8)
+            for prev, chord in zip((None,) + result.chords, result.chords)
+        )
+        assert result.score == expected
+
+
+def test_search_with_chords_outside_the_scale():
+    search = ProgressionSearch()
+    best = search.search("D", _dorian(), 4, start=["i"], end=[("V/V", "E", "dom7"), "V", "i"])[0]
+    assert best.names == ("Dm7", "E7", "A7", "Dm7")
+    triads = search.search("D", _dorian(), 3, end=["V", "i"], extension_level=0)[0]
+    assert triads.names[-2:] == ("A", "Dm")
+    with pytest.raises(ValueError):
+        search.search("D", _dorian(), 3, end=["X", "i"])
+
+
+def test_search_with_custom_scorer_and_exhausted_budget():
+    major = MusicTheory().AVAILABLE_SCALES["1"]
+    prefer = transition_scorer({"I": {"IV": 1}, "IV": {"V": 1}, "V": {"I": 1}})
+    search = ProgressionSearch(time_budget=0.0, scorers=[(prefer, 1.0)])
+    best = search.search("C", major, 6, start=["I"])[0]
+    assert best.names == ("Cmaj7", "Fmaj7", "G7", "Cmaj7", "Fmaj7", "G7")
+    assert best.score == 0.0
+
+
+def test_search_impossible_constraints():
+    major = MusicTheory().AVAILABLE_SCALES["1"]
+    search = ProgressionSearch()
+    assert search.search("C", major, 1, start=["I"], end=["V"]) == ()
+    assert search.search("C", major, 2, end=["V", "V"]) == ()
+    with pytest.raises(ValueError):
+        search.search("C", major, 1, end=["V", "I"])
@@ -0,0 +1,40 @@
+"""
+test_recognition.py — Tests for the notes → chord name recognizer.
+"""
+
+from chorderizer.recognition import ChordRecognizer
+from chorderizer.theory_utils import MusicTheory
+
+
+def test_recognize_root_position():
+    recognizer = ChordRecognizer(MusicTheory())
+    best = recognizer.best([60, 64, 67, 71])
+    assert best.name == "Cmaj7"
+    assert best.root == 0
+    assert best.quality == "maj7"
+    assert best.inversion == 0
+
+
+def test_recognize_inversion_and_octave_reduction():
+    recognizer = ChordRecognizer(MusicTheory())
+    best = recognizer.best([52, 60, 67, 79])  # E3 C4 G4 G5
+    assert best.name == "C/E"
+    assert best.bass == 4
+    assert best.inversion == 1
+
+
+def test_recognize_ranks_ambiguous_sets():
+    recognizer = ChordRecognizer(MusicTheory())
+    names = [c.name for c in recognizer.recognize([60, 64, 67, 69])]
+    assert names[0] == "C6"
+    assert "Am7/C" in names
+    assert recognizer.best([57, 60, 64, 67]).name == "Am7"
+
+
+def test_recognize_unknown_and_flats():
+    recognizer = ChordRecognizer(MusicTheory(), use_flats=True)
+    assert recognizer.recognize([]) == ()
+    assert recognizer.best([60, 61, 62]) is None
+    assert recognizer.best([70, 74, 77]).name == "Bb"
+    labels = list(recognizer.recognize_many([[62, 65, 69], [67, 71, 74, 77]]))
+    assert [c[0].name for c in labels] == ["Dm", "G7"]
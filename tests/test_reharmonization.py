@@ -0,0 +1,67 @@
+"""
+test_reharmonization.py — Tests for the substitution graph and reharmonizer.
+"""
+
+from chorderizer.generators import ChordGenerator
+from chorderizer.reharmonization import (
+    KIND_II_V,
+    KIND_MODAL_INTERCHANGE,
+    KIND_SECONDARY_DOMINANT,
+    KIND_TRITONE,
+    Reharmonizer,
+)
+from chorderizer.theory_utils import MusicTheory
+
+
+def _setup():
+    theory = MusicTheory()
+    generator = ChordGenerator(theory)
+    major = theory.AVAILABLE_SCALES["1"]
+    return Reharmonizer(generator), generator.generate_chord_set("C", major), major
+
+
+def _names(chords):
+    return [chord.name for chord in chords]
+
+
+def test_substitution_graph_is_cached():
+    reharmonizer, chords, major = _setup()
+    graph = reharmonizer.substitution_graph("C", major)
+    assert reharmonizer.substitution_graph("C", major) is graph
+    assert reharmonizer.cache_info().hits == 1
+
+    kinds = {sub.kind: _names(sub.chords) for sub in graph[chords["V"]]}
+    assert kinds[KIND_TRITONE] == ["Db7"]
+    assert kinds[KIND_SECONDARY_DOMINANT] == ["D7", "G7"]
+    assert kinds[KIND_II_V] == ["Am7", "D7", "G7"]
+    assert kinds[KIND_MODAL_INTERCHANGE] == ["Gm7"]
+    # V/I is the diatonic dominant, not a secondary one
+    assert KIND_SECONDARY_DOMINANT not in {sub.kind for sub in graph[chords["I"]]}
+
+
+def test_reharmonize_by_kind():
+    reharmonizer, chords, major = _setup()
+    progression = [chords["I"], chords["vi"], chords["ii"], chords["V"]]
+
+    tritone = reharmonizer.reharmonize(progression, "C", major, kinds=[KIND_TRITONE])
+    assert _names(tritone) == ["Cmaj7", "Am7", "Dm7", "Db7"]
+    assert tritone[-1].note_names == ("Db", "F", "Ab", "Cb")
+
+    two_fives = reharmonizer.reharmonize(progression, "C", major, kinds=[KIND_II_V])
+    assert _names(two_fives[:6]) == ["Dm7", "G7", "Cmaj7", "Bm7b5", "E7", "Am7"]
+
+    borrowed = reharmonizer.reharmonize(progression, "C", major, kinds=[KIND_MODAL_INTERCHANGE])
+    assert _names(borrowed) == ["Cm7", "Abmaj7", "Dm7b5", "Gm7"]
+
+
+def test_reharmonize_keeps_foreign_chords_and_scales_linearly():
+    reharmonizer, chords, major = _setup()
+    foreign = ChordGenerator(reharmonizer.theory).build_chord("x", "F#", "dom7")
+    steps = reharmonizer.reharmonize_steps([foreign, chords["V"]], "C", major)
+    assert steps[0] == (foreign,)
+    assert _names(steps[1]) == ["Db7"]
+
+    long = [chords["ii"], chords["V"], chords["I"]] * 2000
+    result = reharmonizer.reharmonize(long, "C", major, kinds=[KIND_TRITONE])
+    assert len(result) == len(long)
+    assert reharmonizer.cache_info().misses == 1
@@ -0,0 +1,132 @@
+"""
+test_scale_packs.py — Tests for lazily loaded scale packs.
+"""
+
+import json
+
+import pytest
+
+from chorderizer import catalog, scale_packs
+from chorderizer.generators import ChordGenerator
+from chorderizer.theory_utils import MusicTheory
+
+CORE = {
+    "1": {
+        "name": "Test Major",
+        "tonic_suffix": "",
+        "degrees": {
+            "I": {
+                "root_interval": 0,
+                "base_quality": "major",
+                "full_quality": "maj7",
+                "display_suffix": "maj7",
+            },
+        },
+    }
+}
+
+PACK = {
+    "pack": {"name": "Exotic", "namespace": "exotic", "description": "Test pack"},
+    "scales": {
+        "hijaz": {
+            "name": "Hijaz",
+            "tonic_suffix": "",
+            "degrees": {
+                "I": {
+                    "root_interval": 0,
+                    "base_quality": "major",
+                    "full_quality": "dom7",
+                    "display_suffix": "7",
+                },
+                "ii": {
+                    "root_interval": 1,
+                    "base_quality": "major",
+                    "full_quality": "maj7",
+                    "display_suffix": "maj7",
+                },
+            },
+        }
+    },
+}
+
+
+@pytest.fixture
+def theory(tmp_path):
+    core = tmp_path / "scales.json"
+    core.write_text(json.dumps(CORE), encoding="utf-8")
+    packs = tmp_path / "packs"
+    packs.mkdir()
+    (packs / "exotic.json").write_text(json.dumps(PACK), encoding="utf-8")
+    (packs / "broken.json").write_text("{not json", encoding="utf-8")
+    return MusicTheory(str(core), str(tmp_path / "cache"), pack_dirs=[str(packs)])
+
+
+def test_packs_are_registered_without_loading(theory):
+    scales = theory.AVAILABLE_SCALES
+    assert list(scales) == ["1", "exotic:hijaz"]
+    assert theory.scale_names()["exotic:hijaz"] == "Hijaz"
+    assert [pack.name for pack in scales.packs] == ["Exotic"]
+    assert theory.find_scales([0, 1])[0].scale_key == "exotic:hijaz"
+    assert not scales.is_loaded("exotic")
+
+
+def test_pack_scale_loads_on_first_lookup(theory):
+    hijaz = theory.AVAILABLE_SCALES["exotic:hijaz"]
+    assert theory.AVAILABLE_SCALES.is_loaded("exotic")
+    assert hijaz["name"] == "Hijaz"
+    assert theory.AVAILABLE_SCALES["exotic:hijaz"] is hijaz
+    assert theory.scale_key_of(hijaz) == "exotic:hijaz"
+    assert theory.scale_degree_table("exotic:hijaz")[1][:2] == ("ii", 1)
+    with pytest.raises(TypeError):
+        hijaz["name"] = "Changed"
+
+    chord_set = ChordGenerator(theory).generate_chord_set("C", hijaz, 0, 0)
+    assert chord_set["ii"].name == "Db"
+
+
+def test_unknown_pack_scale_raises_key_error(theory):
+    with pytest.raises(KeyError):
+        theory.AVAILABLE_SCALES["exotic:missing"]
+
+
+def test_generator_does_not_load_packs(theory):
+    ChordGenerator(theory).generate_chord_set("C", theory.AVAILABLE_SCALES["1"])
+    assert not theory.AVAILABLE_SCALES.is_loaded("exotic")
+
+
+def test_manifest_is_cached(tmp_path, monkeypatch):
+    source = tmp_path / "exotic.json"
+    source.write_text(json.dumps(PACK), encoding="utf-8")
+    cache_dir = str(tmp_path / "cache")
+    first = catalog.load_pack_manifest(str(source), cache_dir)
+    assert first["names"] == {"hijaz": "Hijaz"}
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("cache hit should not recompile")
+
+    monkeypatch.setattr(catalog, "compile_pack_manifest", _fail)
+    assert catalog.load_pack_manifest(str(source), cache_dir) == first
+
+
+def test_later_directories_override_namespace(tmp_path):
+    package_dir, user_dir = tmp_path / "package", tmp_path / "user"
+    for directory, name in ((package_dir, "Bundled"), (user_dir, "Mine")):
+        directory.mkdir()
+        pack = json.loads(json.dumps(PACK))
+        pack["pack"]["name"] = name
+        (directory / "exotic.json").write_text(json.dumps(pack), encoding="utf-8")
+
+    packs = scale_packs.discover_packs([str(package_dir), str(user_dir)], str(tmp_path / "cache"))
+    assert [pack.name for pack in packs] == ["Mine"]
+
+
+def test_batch_generation_loads_only_requested_packs(theory):
+    pytest.importorskip("numpy")
+    generator = ChordGenerator(theory)
+    batch = generator.generate_batch([0, 2], "1")
+    assert batch.chord_types.shape == (2, 1)
+    assert not theory.AVAILABLE_SCALES.is_loaded("exotic")
+
+    batch = generator.generate_batch([0], ["exotic:hijaz"])
+    assert theory.AVAILABLE_SCALES.is_loaded("exotic")
+    assert batch.roots[0].tolist() == [0, 1]
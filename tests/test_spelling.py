@@ -0,0 +1,82 @@
+"""
+test_spelling.py — Tests for letter-name spelling of scales and chords.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.modules["mido"] = MagicMock()
+
+from chorderizer.generators import ChordGenerator  # noqa: E402
+from chorderizer.spelling import (  # noqa: E402
+    SPELLINGS,
+    chord_tone_steps,
+    key_spelling,
+    parse_note,
+    spell_chord_tones,
+)
+from chorderizer.theory_utils import MusicTheory  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def scales():
+    return MusicTheory().AVAILABLE_SCALES
+
+
+def test_spelling_table():
+    assert SPELLINGS[3][7] == "F##"  # F letter, pitch class G
+    assert SPELLINGS[6][9] == "Bbb"
+    assert SPELLINGS[0][6] is None  # C letter cannot carry F#/Gb
+    assert parse_note("Eb Major") == (2, 3)
+    assert parse_note("C##") == (0, 2)
+    assert parse_note("Z") is None
+
+
+@pytest.mark.parametrize(
+    "tonic, scale_key, expected",
+    [
+        ("F", "1", ("F", "G", "A", "Bb", "C", "D", "E")),
+        ("Eb", "2", ("Eb", "F", "Gb", "Ab", "Bb", "Cb", "Db")),
+        ("G#", "3", ("G#", "A#", "B", "C#", "D#", "E", "F##")),
+        ("F#", "1", ("F#", "G#", "A#", "B", "C#", "D#", "E#")),
+        ("B", "1", ("B", "C#", "D#", "E", "F#", "G#", "A#")),
+        ("A", "11", ("A", "C", "D", "E", "G")),
+    ],
+)
+def test_key_spelling(scales, tonic, scale_key, expected):
+    assert key_spelling(tonic, scales[scale_key]).root_names == expected
+
+
+def test_enharmonic_tonic_switch(scales):
+    # D# major would need nine sharps (incl. F## and C##); Eb major needs three flats
+    spelling = key_spelling("D#", scales["1"])
+    assert spelling.tonic == "Eb"
+    assert spelling.root_names == ("Eb", "F", "G", "Ab", "Bb", "C", "D")
+    assert key_spelling("Z", scales["1"]) is None
+
+
+def test_chord_tone_spelling():
+    theory = MusicTheory()
+    structures = theory.CHORD_STRUCTURES
+    # Bdim7 in C harmonic minor: B D F Ab
+    assert spell_chord_tones(6, 11, structures["dim7"], [59, 62, 65, 68]) == ("B", "D", "F", "Ab")
+    # Ebaug: Eb G B
+    assert spell_chord_tones(2, 3, structures["augmented"], [63, 67, 71]) == ("Eb", "G", "B")
+    # A ninth is spelled as a second above the root
+    assert chord_tone_steps(structures["dom9"])[2] == 1
+
+
+def test_generator_uses_key_spelling(scales):
+    generator = ChordGenerator(MusicTheory())
+    harmonic = generator.generate_chord_set("C", scales["3"], extension_level=0)
+    assert harmonic["III+"].name == "Ebaug"
+    assert harmonic["III+"].note_names == ("Eb", "G", "B")
+
+    g_sharp = generator.generate_chord_set("G#", scales["3"], extension_level=1)
+    assert g_sharp["vii°7"].name == "F##dim7"
+    assert set(g_sharp["vii°7"].note_names) == {"F##", "A#", "C#", "E"}
+
+    b_major = generator.generate_chord_set("B", scales["1"])
+    assert b_major["ii"].name == "C#m7"
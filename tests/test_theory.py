@@ -1,6 +1,6 @@
 import pytest
 
-from chorderizer.theory_utils import MusicTheoryUtils
+from chorderizer.theory_utils import MusicTheory, MusicTheoryUtils
 
 
 def test_get_note_index():
@@ -9,6 +9,11 @@ def test_get_note_index():
     assert MusicTheoryUtils.get_note_index("Db") == 1
     assert MusicTheoryUtils.get_note_index("G") == 7
     assert MusicTheoryUtils.get_note_index("B") == 11
+    # Chord names and suffixed tonics resolve to their root
+    assert MusicTheoryUtils.get_note_index("Cm") == 0
+    assert MusicTheoryUtils.get_note_index("Bbm7") == 10
+    assert MusicTheoryUtils.get_note_index("Bm") == 11
+    assert MusicTheoryUtils.get_note_index("F##") == 7
     with pytest.raises(ValueError):
         MusicTheoryUtils.get_note_index("Z")
 
@@ -26,6 +31,8 @@ def test_should_use_flats():
     assert MusicTheoryUtils.should_use_flats("C") is False
     assert MusicTheoryUtils.should_use_flats("G") is False
     assert MusicTheoryUtils.should_use_flats("Eb Major") is True
+    assert MusicTheoryUtils.should_use_flats("B") is False
+    assert MusicTheoryUtils.should_use_flats("F#") is False
 
 
 def test_split_chord_name():
@@ -49,3 +56,72 @@ def test_transpose_chords():
     original_g = {"I": "Gmaj7", "IV": "Cmaj7", "V": "D7"}
     transposed_bb = MusicTheoryUtils.transpose_chords(original_g, "G", "Bb")
     assert transposed_bb == {"I": "Bbmaj7", "IV": "Ebmaj7", "V": "F7"}
+
+
+def test_pitch_class_mask_round_trip():
+    mask = MusicTheoryUtils.pitch_classes_to_mask([60, 64, 67, 72])
+    assert mask == 0b000010010001
+    assert MusicTheoryUtils.mask_to_pitch_classes(mask) == frozenset({0, 4, 7})
+    assert MusicTheoryUtils.rotate_mask(mask, 2) == MusicTheoryUtils.pitch_classes_to_mask(
+        [2, 6, 9]
+    )
+
+
+def test_scale_mask_index():
+    theory = MusicTheory()
+    # G Major: G A B C D E F#
+    assert theory.scale_pitch_classes("1", 7) == frozenset({7, 9, 11, 0, 2, 4, 6})
+    assert theory.is_pitch_in_scale(66, "1", 7)  # F#4
+    assert not theory.is_pitch_in_scale(65, "1", 7)  # F4
+    assert theory.scale_mask("1", 0) == theory.scale_mask("2", 9)  # C Major == A Minor
+    # C Major vs C Minor Pentatonic (C Eb F G Bb)
+    assert theory.scale_intersection("1", 0, "11", 0) == frozenset({0, 5, 7})
+
+
+def test_find_scales_contains():
+    theory = MusicTheory()
+    matches = theory.find_scales([0, 4, 7, 11])  # Cmaj7 notes
+    found = {(m.scale_key, m.tonic) for m in matches}
+    assert ("1", 0) in found  # C Major
+    assert ("1", 7) in found  # G Major
+    assert ("7", 0) in found  # C Lydian
+    assert ("2", 0) not in found  # C Minor
+    assert all(a.extra_notes <= b.extra_notes for a, b in zip(matches, matches[1:]))
+    assert [m.scale_key for m in theory.find_scales([60, 64, 67, 71], tonic_pc=0)] == [
+        "1",
+        "7",
+    ]
+
+
+def test_find_scales_within():
+    theory = MusicTheory()
+    c_major = [0, 2, 4, 5, 7, 9, 11]
+    matches = theory.find_scales(c_major, mode=MusicTheory.FIND_WITHIN)
+    assert matches[0].extra_notes == 0
+    found = {(m.scale_key, m.tonic) for m in matches}
+    assert ("10", 0) in found  # C Major Pentatonic
+    assert ("11", 9) in found  # A Minor Pentatonic
+    with pytest.raises(ValueError):
+        theory.find_scales(c_major, mode="bogus")
+
+
+def test_shared_theory_tables_are_read_only():
+    theory = MusicTheory.shared()
+    assert MusicTheory.shared() is theory
+    # Fresh instances for the same catalog reuse the registry instead of reloading
+    assert MusicTheory().AVAILABLE_SCALES is theory.AVAILABLE_SCALES
+
+    with pytest.raises(TypeError):
+        theory.AVAILABLE_SCALES["1"] = {}
+    with pytest.raises(TypeError):
+        theory.AVAILABLE_SCALES["1"]["degrees"]["I"]["root_interval"] = 3
+    with pytest.raises(TypeError):
+        theory.CHORD_STRUCTURES["major"] = (0, 3, 7)
+    assert isinstance(theory.CHORD_STRUCTURES["major"], tuple)
+
+
+def test_freeze_thaw_round_trip():
+    data = {"a": [1, {"b": [2, 3]}]}
+    frozen = MusicTheoryUtils.freeze(data)
+    assert frozen["a"][1]["b"] == (2, 3)
+    assert MusicTheoryUtils.thaw(frozen) == data
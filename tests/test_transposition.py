@@ -0,0 +1,85 @@
+"""
+test_transposition.py — Tests for pitch-class transposition.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.modules["mido"] = MagicMock()
+
+from chorderizer import transposition  # noqa: E402
+from chorderizer.generators import ChordGenerator  # noqa: E402
+from chorderizer.theory_utils import MusicTheory  # noqa: E402
+from chorderizer.transposition import (  # noqa: E402
+    KEY_TONIC_NAMES,
+    shortest_shift,
+    transpose_chord_set,
+    transpose_midi,
+    transpose_progression,
+    transpose_to_all_keys,
+)
+
+
+@pytest.fixture
+def c_major():
+    theory = MusicTheory()
+    return ChordGenerator(theory).generate_chord_set("C", theory.AVAILABLE_SCALES["1"])
+
+
+def test_shortest_shift():
+    assert shortest_shift(0, 2) == 2
+    assert shortest_shift(0, 11) == -1
+    assert shortest_shift(0, 6) == -6
+    assert shortest_shift(7, 5) == -2
+
+
+def test_transpose_midi_keeps_container():
+    assert transpose_midi([60, 64, 67], 2) == [62, 66, 69]
+    assert transpose_midi((60, 64), -1) == (59, 63)
+
+
+@pytest.mark.parametrize("tonic", ["D", "Eb", "F#", "Ab"])
+def test_transpose_chord_set_matches_generated_names(c_major, tonic):
+    theory = MusicTheory()
+    generated = ChordGenerator(theory).generate_chord_set(tonic, theory.AVAILABLE_SCALES["1"])
+    transposed = transpose_chord_set(c_major, tonic)
+
+    assert transposed.tonic == tonic
+    assert transposed.names() == generated.names()
+    for chord, expected in zip(transposed, generated):
+        assert chord.root_pc == expected.root_pc
+        assert {n % 12 for n in chord.midi_notes} == {n % 12 for n in expected.midi_notes}
+        assert set(chord.note_names) == set(expected.note_names)
+
+
+def test_transpose_progression_stays_in_register(c_major):
+    progression = [c_major["ii"], c_major["V"], c_major["I"]]
+    down = transpose_progression(progression, "C", "Bb")
+    assert [c.name for c in down] == ["Cm7", "F7", "Bbmaj7"]
+    assert down[2].midi_notes == tuple(n - 2 for n in c_major["I"].midi_notes)
+
+
+def test_transpose_to_all_keys(c_major, monkeypatch):
+    progression = list(c_major)
+    all_keys = transpose_to_all_keys(progression, "C")
+
+    assert tuple(all_keys) == KEY_TONIC_NAMES
+    assert all_keys["C"] == tuple(progression)
+    assert [c.name for c in all_keys["Db"][:2]] == ["Dbmaj7", "Ebm7"]
+    assert [c.name for c in all_keys["B"][:2]] == ["Bmaj7", "C#m7"]
+
+    # The pure-Python fallback gives identical results
+    monkeypatch.setattr(transposition, "np", None)
+    assert transpose_to_all_keys(progression, "C") == all_keys
+
+
+def test_transpose_midi_all_keys():
+    np = pytest.importorskip("numpy")
+    midi = np.array([[60, 64, 67, -1], [62, 65, 69, 72]])
+    out = transposition.transpose_midi_all_keys(midi, from_pc=0)
+
+    assert out.shape == (12, 2, 4)
+    assert out[2].tolist() == [[62, 66, 69, -1], [64, 67, 71, 74]]
+    assert out[11].tolist() == [[59, 63, 66, -1], [61, 64, 68, 71]]
@@ -0,0 +1,48 @@
+"""
+test_tui_app.py — Tests for the Textual dashboard.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("textual")
+
+from chorderizer import tui_app  # noqa: E402
+from chorderizer.theory_utils import MusicTheory  # noqa: E402
+
+PACK = {
+    "pack": {"name": "Exotic", "namespace": "exotic"},
+    "scales": {
+        "hijaz": {
+            "name": "Hijaz",
+            "tonic_suffix": "",
+            "degrees": {
+                "I": {
+                    "root_interval": 0,
+                    "base_quality": "major",
+                    "full_quality": "dom7",
+                    "display_suffix": "7",
+                },
+            },
+        }
+    },
+}
+
+
+def test_app_mounts_with_scale_pack(tmp_path, monkeypatch):
+    packs = tmp_path / "packs"
+    packs.mkdir()
+    (packs / "exotic.json").write_text(json.dumps(PACK), encoding="utf-8")
+    theory = MusicTheory(pack_dirs=[str(packs)])
+    monkeypatch.setattr(MusicTheory, "_shared_instance", theory)
+    monkeypatch.setattr(tui_app.ConfigManager, "save", lambda self, settings: None)
+
+    async def run():
+        app = tui_app.ChorderizerApp()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            return [item.scale_key for item in app.query_one("#jam-scale-list").children]
+
+    assert "exotic:hijaz" in asyncio.run(run())
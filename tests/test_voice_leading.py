@@ -0,0 +1,93 @@
+"""
+test_voice_leading.py — Tests for the dynamic-programming voice-leading optimizer.
+"""
+
+import pytest
+
+from chorderizer.generators import ChordGenerator, MidiGenerator, VoiceLeader
+from chorderizer.theory_utils import MusicTheory
+from chorderizer.voice_leading import VoiceLeadingOptimizer, motion_cost
+
+
+def _progression(degrees=("ii", "V", "I", "vi", "ii", "V", "I")):
+    theory = MusicTheory()
+    chords = ChordGenerator(theory).generate_chord_set("C", theory.AVAILABLE_SCALES["1"])
+    return [list(chords[d].midi_notes) for d in degrees]
+
+
+def _total_motion(voicings):
+    return sum(motion_cost(a, b) for a, b in zip(voicings, voicings[1:]))
+
+
+def test_motion_cost_pads_with_top_voice():
+    assert motion_cost([60, 64, 67], [60, 64, 67]) == 0
+    assert motion_cost([60, 64, 67], [60, 64, 67, 70]) == 3
+
+
+def test_optimize_beats_greedy_and_keeps_chords():
+    progression = _progression()
+    optimized = VoiceLeadingOptimizer().optimize(progression)
+
+    greedy = [progression[0]]
+    for notes in progression[1:]:
+        greedy.append(VoiceLeader.apply(greedy[-1], notes))
+    assert _total_motion(optimized) < _total_motion(greedy)
+
+    for original, voiced in zip(progression, optimized):
+        assert {n % 12 for n in voiced} == {n % 12 for n in original}
+        assert voiced[0] % 12 == original[0] % 12
+        assert voiced == sorted(voiced)
+        assert 36 <= voiced[0] and voiced[-1] <= 96 and voiced[-1] - voiced[0] <= 24
+
+
+def test_stream_matches_constraints_and_passes_empty_chords():
+    progression = _progression() * 20
+    progression.insert(3, [])
+    optimizer = VoiceLeadingOptimizer()
+    streamed = list(optimizer.stream(iter(progression), window=6))
+    assert len(streamed) == len(progression)
+    assert streamed[3] == []
+    # Windowed decoding stays close to the global optimum
+    windowed = _total_motion([v for v in streamed if v])
+    optimal = _total_motion([v for v in optimizer.optimize(progression) if v])
+    assert windowed <= optimal * 1.5
+    with pytest.raises(ValueError):
+        list(optimizer.stream(progression, window=1))
+
+
+def test_midi_file_optimal_voice_leading(monkeypatch):
+    progression = _progression(("I", "IV", "V", "I"))
+    chords = [{"midi_notes": notes, "duration_beats": 1} for notes in progression]
+    played = []
+    monkeypatch.setattr(
+        MidiGenerator, "_generate_block_track", lambda self, track, notes, *a: played.append(notes)
+    )
+    monkeypatch.setattr(MidiGenerator, "_save_midi_file", lambda self, *a: None)
+
+    options = {"voice_leading": "optimal", "voice_leading_window": 2}
+    MidiGenerator().generate_midi_file(chords, "unused.mid", options)
+    assert played == list(VoiceLeadingOptimizer().stream(progression, 2))
+
+    played.clear()
+    MidiGenerator().generate_midi_file(chords, "unused.mid", {"voice_leading": "optimal"})
+    assert played == VoiceLeadingOptimizer().optimize(progression)
+
+
+def test_key_table_is_cached_and_matches_pair_costs():
+    theory = MusicTheory()
+    major = theory.AVAILABLE_SCALES["1"]
+    optimizer = VoiceLeadingOptimizer(generator=ChordGenerator(theory))
+    table = optimizer.key_table("C", major, 2)
+    assert optimizer.key_table("C", major, 2) is table
+    assert optimizer.cache_info()["tables"].hits == 1
+    assert len(table.chords) == 7
+
+    progression = _progression() + [[61, 65, 68]]
+    assert progression[0] in table and [61, 65, 68] not in table
+    assert optimizer.optimize(progression, table) == VoiceLeadingOptimizer().optimize(progression)
+
+    prev, curr = sorted(progression[1]), sorted(progression[2])
+    matrix = optimizer.transition_matrix(prev, curr)
+    candidates = optimizer.candidates(prev), optimizer.candidates(curr)
+    assert matrix == table.matrix(tuple(prev), tuple(curr))
+    assert matrix[3][5] == motion_cost(candidates[0][5], candidates[1][3])
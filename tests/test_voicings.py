@@ -0,0 +1,58 @@
+"""
+test_voicings.py — Tests for the lazy voicing enumerator.
+"""
+
+import itertools
+
+import pytest
+
+from chorderizer.generators import ChordGenerator
+from chorderizer.theory_utils import MusicTheory
+from chorderizer.voicings import VoicingEnumerator, classify_voicing, iter_voicings
+
+
+def test_classify_voicing_styles():
+    assert classify_voicing((48, 52, 55, 59)) == "close"
+    assert classify_voicing((43, 48, 52, 59)) == "drop2"
+    assert classify_voicing((40, 48, 55, 59)) == "drop3"
+    assert classify_voicing((36, 52, 55, 59)) == "spread"
+    assert classify_voicing((48, 55, 64, 71)) == "open"
+
+
+def test_voicings_respect_limits():
+    enumerator = VoicingEnumerator(MusicTheory())
+    voicings = list(enumerator.voicings(0, "maj7", low=48, high=84, max_span=19))
+    assert voicings
+    assert len({v.notes for v in voicings}) == len(voicings)
+    for voicing in voicings:
+        assert 48 <= voicing.notes[0] and voicing.notes[-1] <= 84
+        assert voicing.span <= 19
+        assert {n % 12 for n in voicing.notes} == {0, 4, 7, 11}
+        assert list(voicing.notes) == sorted(voicing.notes)
+    assert (48, 52, 55, 59) in [v.notes for v in voicings]
+
+
+def test_voicings_filter_styles_bass_and_omissions():
+    enumerator = VoicingEnumerator(MusicTheory())
+    drops = list(enumerator.voicings(7, "dom7", styles=["drop2"], bass_pc=5))
+    assert drops and all(v.style == "drop2" and v.notes[0] % 12 == 5 for v in drops)
+
+    shells = list(enumerator.voicings(7, "dom7", omit_fifth=True, max_notes=3))
+    assert (43, 47, 53) in [v.notes for v in shells]
+    assert all(len(v.notes) <= 3 for v in shells)
+
+
+def test_voicings_are_lazy_with_doublings():
+    voicings = iter_voicings([0, 4, 7, 10, 2, 5, 9], allow_doublings=True, max_notes=8)
+    first = list(itertools.islice(voicings, 50))
+    assert len(first) == 50
+    assert all(len(v.notes) >= 7 for v in first)
+
+
+def test_voicings_for_generated_chord():
+    theory = MusicTheory()
+    chord = ChordGenerator(theory).generate_chord_set("C", theory.AVAILABLE_SCALES["1"], 0)["V"]
+    voicings = VoicingEnumerator(theory).voicings_for_chord(chord, styles=["close"])
+    assert all({n % 12 for n in v.notes} == {7, 11, 2} for v in voicings)
+    with pytest.raises(ValueError):
+        VoicingEnumerator(theory).voicings(0, "unknown")